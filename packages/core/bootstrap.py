@@ -17,12 +17,14 @@ class CoreApp:
     executor: ServiceExecutor
 
 
-def build_core() -> CoreApp:
+def build_core(*, bus: EventBus | None = None) -> CoreApp:
     """
     Build core components.
     Providers/modules are attached outside core via runtime configuration.
+
+    bus: optional custom bus (e.g. QueuedEventBus), in-memory EventBus by default.
     """
-    bus = EventBus()
+    bus = bus if bus is not None else EventBus()
     services = ServiceRegistry()
     executor = ServiceExecutor(bus=bus, registry=services)
     return CoreApp(bus=bus, services=services, executor=executor)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from .loader import TenantConfig, TenantConfigStore, TenantNotFound
+
+logger = logging.getLogger(__name__)
+
+EvictListener = Callable[[str], None]
+
+
+@dataclass(frozen=True)
+class CachedStoreStats:
+    size: int
+    max_tenants: int
+    hits: int
+    stale_hits: int
+    negative_hits: int
+    misses: int
+    fetches: int
+    evictions: int
+
+
+class _Entry:
+    __slots__ = ("config", "loaded_at")
+
+    def __init__(self, config: Optional[TenantConfig], loaded_at: float) -> None:
+        # None: negative entry (tenant not found)
+        self.config = config
+        self.loaded_at = loaded_at
+
+
+class CachedTenantConfigStore:
+    """
+    Caching TenantConfigStore over any backing store.
+
+    - lazy: a tenant is fetched on its first request
+    - fresh for ttl_seconds, then served stale for up to stale_seconds more
+      while one background refresh runs (stale-while-revalidate)
+    - concurrent requests for the same tenant share one fetch
+    - TenantNotFound is cached for negative_ttl_seconds, other errors are not
+    - at most max_tenants resident; least recently used tenants are evicted
+      and evict listeners are notified (e.g. ConfigManager.unload_tenant)
+    """
+
+    def __init__(
+        self,
+        backing: TenantConfigStore,
+        *,
+        ttl_seconds: float = 60.0,
+        stale_seconds: float = 300.0,
+        negative_ttl_seconds: float = 10.0,
+        max_tenants: int = 10_000,
+    ) -> None:
+        self._backing = backing
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._max_tenants = max(1, max_tenants)
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # tenant_id -> running fetch, shared by all waiters
+        self._inflight: Dict[str, asyncio.Task[TenantConfig]] = {}
+        self._evict_listeners: List[EvictListener] = []
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._fetches = 0
+        self._evictions = 0
+
+    def add_evict_listener(self, listener: EvictListener) -> None:
+        self._evict_listeners.append(listener)
+
+    async def get_tenant_config(self, tenant_id: str) -> TenantConfig:
+        entry = self._entries.get(tenant_id)
+        if entry is not None:
+            self._entries.move_to_end(tenant_id)
+            age = time.monotonic() - entry.loaded_at
+
+            if entry.config is None:
+                if age < self._negative_ttl:
+                    self._negative_hits += 1
+                    raise TenantNotFound(tenant_id)
+            elif age < self._ttl:
+                self._hits += 1
+                return entry.config
+            elif age < self._ttl + self._stale:
+                self._stale_hits += 1
+                self._fetch(tenant_id, background=True)
+                return entry.config
+
+        self._misses += 1
+        # shield: a cancelled caller must not cancel the fetch other callers wait for
+        return await asyncio.shield(self._fetch(tenant_id))
+
+    def invalidate(self, tenant_id: str) -> None:
+        """
+        Drop cached entry; next request fetches again (no evict notification).
+        """
+        self._entries.pop(tenant_id, None)
+
+    def stats(self) -> CachedStoreStats:
+        return CachedStoreStats(
+            size=len(self._entries),
+            max_tenants=self._max_tenants,
+            hits=self._hits,
+            stale_hits=self._stale_hits,
+            negative_hits=self._negative_hits,
+            misses=self._misses,
+            fetches=self._fetches,
+            evictions=self._evictions,
+        )
+
+    def _fetch(self, tenant_id: str, *, background: bool = False) -> "asyncio.Task[TenantConfig]":
+        task = self._inflight.get(tenant_id)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._load(tenant_id))
+            self._inflight[tenant_id] = task
+            task.add_done_callback(lambda t: self._inflight.pop(tenant_id, None))
+            if background:
+                task.add_done_callback(_log_refresh_error)
+        return task
+
+    async def _load(self, tenant_id: str) -> TenantConfig:
+        self._fetches += 1
+        try:
+            cfg = await self._backing.get_tenant_config(tenant_id)
+        except TenantNotFound:
+            self._put(tenant_id, _Entry(None, time.monotonic()))
+            raise
+        self._put(tenant_id, _Entry(cfg, time.monotonic()))
+        return cfg
+
+    def _put(self, tenant_id: str, entry: _Entry) -> None:
+        prev = self._entries.get(tenant_id)
+        self._entries[tenant_id] = entry
+        self._entries.move_to_end(tenant_id)
+
+        if prev is not None and prev.config is not None and entry.config is None:
+            # tenant was deleted in the backing store
+            self._notify_evicted(tenant_id)
+
+        while len(self._entries) > self._max_tenants:
+            old_id, old = self._entries.popitem(last=False)
+            self._evictions += 1
+            if old.config is not None:
+                self._notify_evicted(old_id)
+
+    def _notify_evicted(self, tenant_id: str) -> None:
+        for listener in self._evict_listeners:
+            try:
+                listener(tenant_id)
+            except Exception:
+                logger.exception("Evict listener failed for tenant=%s", tenant_id)
+
+
+def _log_refresh_error(task: "asyncio.Task[TenantConfig]") -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None and not isinstance(exc, TenantNotFound):
+        # stale config keeps being served until the stale window ends
+        logger.warning("Background tenant config refresh failed: %r", exc)
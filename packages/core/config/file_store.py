@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import uuid
+import zlib
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+from .cached_store import CachedTenantConfigStore
+from .loader import TenantConfig, TenantNotFound
+
+if TYPE_CHECKING:
+    from ..runtime.config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+_SUFFIXES = (".json", ".yaml", ".yml")
+_INDEX_MAGIC = b"TCIDX3\n"
+# mtime_ns, size, count, crc32 of the packed file, crc32 of the rest of the sidecar
+_HEADER = "<qqqII"
+# fast path: "tenant_id" is the first key of the record (as json.dumps writes a
+# config that starts with it); other records are parsed to find the top-level key
+_LEADING_TENANT_ID_RE = re.compile(rb'\s*\{\s*"tenant_id"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+@dataclass(frozen=True)
+class _Index:
+    """
+    Column-wise index (arrays load from disk without per-tenant objects).
+    directory layout: paths[i] is the whole file; packed layout: offset/length
+    in the packed file. versions: mtime_ns (directory) or crc32 of the record (packed).
+    """
+    positions: Dict[str, int]
+    offsets: "array[int]"
+    lengths: "array[int]"
+    versions: "array[int]"
+    paths: Optional[List[str]] = None
+
+    def version(self, tenant_id: str) -> Optional[int]:
+        i = self.positions.get(tenant_id)
+        return None if i is None else self.versions[i]
+
+
+def _new_index(
+    ids: List[str],
+    offsets: "array[int]",
+    lengths: "array[int]",
+    versions: "array[int]",
+    paths: Optional[List[str]] = None,
+) -> _Index:
+    return _Index(dict(zip(ids, range(len(ids)))), offsets, lengths, versions, paths)
+
+
+def config_from_mapping(raw: Mapping[str, Any], tenant_id: str) -> TenantConfig:
+    return TenantConfig(
+        tenant_id=str(raw.get("tenant_id", tenant_id)),
+        locale=str(raw.get("locale", "ru")),
+        services=dict(raw.get("services") or {}),
+        modules={str(k): dict(v) for k, v in dict(raw.get("modules") or {}).items()},
+        limits=dict(raw["limits"]) if raw.get("limits") else None,
+    )
+
+
+def _record_tenant_id(line: bytes) -> Optional[str]:
+    """
+    Top-level "tenant_id" of a packed record (None if it has none or is not JSON).
+    """
+    m = _LEADING_TENANT_ID_RE.match(line)
+    if m is not None:
+        return json.loads(b'"' + m.group(1) + b'"')
+    if not line.strip():
+        return None
+    try:
+        raw = json.loads(line)
+    except ValueError:
+        return None
+    tenant_id = raw.get("tenant_id") if isinstance(raw, dict) else None
+    return tenant_id if isinstance(tenant_id, str) else None
+
+
+def _parse(data: bytes, path: str) -> Mapping[str, Any]:
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError as exc:  # optional dependency
+            raise RuntimeError("YAML tenant configs require PyYAML") from exc
+        return yaml.safe_load(data) or {}
+    return json.loads(data)
+
+
+class FileTenantConfigStore:
+    """
+    TenantConfigStore over configs on local disk (no network needed).
+
+    Layouts:
+    - directory: one <tenant_id>.json / .yaml / .yml per tenant
+    - packed file: JSON Lines, one tenant config object per line
+      (must contain a top-level "tenant_id"; indexing is fastest when it is
+      the first key)
+
+    Startup builds an index only: a directory listing, or line offsets of the
+    packed file. The packed index is persisted next to the file (<file>.idx)
+    and reused while the file's mtime/size and content checksum are unchanged.
+    A tenant config is parsed on request; packed records are read through mmap.
+    A directory file whose own "tenant_id" differs from its name is rejected
+    (ValueError) instead of serving another tenant's config.
+
+    poll()/watch(): mtime polling, reports only tenants whose record changed.
+    """
+
+    def __init__(self, path: str, *, index_path: Optional[str] = None) -> None:
+        self._path = os.path.abspath(path)
+        self._packed = os.path.isfile(self._path)
+        self._index_path = index_path or (self._path + ".idx" if self._packed else None)
+
+        # packed file (mtime_ns, size) the index was built for
+        self._stamp: Tuple[int, int] = (0, 0)
+        self._mm: Optional[mmap.mmap] = None
+        self._file: Any = None
+
+        self._index = self._build_index()
+
+    def tenant_ids(self) -> List[str]:
+        return list(self._index.positions)
+
+    async def get_tenant_config(self, tenant_id: str) -> TenantConfig:
+        i = self._index.positions.get(tenant_id)
+        if i is None:
+            raise TenantNotFound(tenant_id)
+        raw = self._read(i)
+        declared = raw.get("tenant_id", tenant_id)
+        if declared != tenant_id:
+            raise ValueError(f"Tenant config for {tenant_id!r} declares tenant_id={declared!r}")
+        return config_from_mapping(raw, tenant_id)
+
+    def poll(self) -> Tuple[List[str], List[str]]:
+        """
+        Re-check files. Returns (changed_or_added, removed) tenant ids.
+        """
+        if self._packed:
+            st = os.stat(self._path)
+            if (st.st_mtime_ns, st.st_size) == self._stamp:
+                return [], []
+
+        old = self._index
+        new = self._build_index()
+        self._index = new
+
+        changed = [tid for tid, i in new.positions.items() if old.version(tid) != new.versions[i]]
+        removed = [tid for tid in old.positions if tid not in new.positions]
+        return changed, removed
+
+    async def watch(
+        self,
+        manager: "ConfigManager",
+        *,
+        interval_seconds: float = 2.0,
+        only_applied: bool = True,
+    ) -> None:
+        """
+        Poll forever and push changes to the ConfigManager.
+
+        only_applied: apply changed configs only for tenants the manager has
+        loaded (lazy tenants pick up the new config on their next ensure_tenant).
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                changed, removed = self.poll()
+            except OSError:
+                logger.exception("Tenant config poll failed path=%s", self._path)
+                continue
+
+            cache = manager.store if isinstance(manager.store, CachedTenantConfigStore) else None
+            for tid in removed:
+                if cache is not None:
+                    cache.invalidate(tid)
+                manager.unload_tenant(tid)
+
+            for tid in changed:
+                if cache is not None:
+                    cache.invalidate(tid)
+                if only_applied and not manager.is_applied(tid):
+                    continue
+                try:
+                    cfg = await self.get_tenant_config(tid)
+                except Exception:
+                    logger.exception("Cannot load changed tenant config tenant=%s", tid)
+                    continue
+                manager.apply_tenant_config(
+                    tenant_id=tid,
+                    trace_id=f"trc_{uuid.uuid4().hex}",
+                    request_id=f"req_{uuid.uuid4().hex}",
+                    services=cfg.services or {},
+                    modules=cfg.modules or {},
+                    limits=cfg.limits,
+                )
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # --- index ---
+
+    def _build_index(self) -> _Index:
+        if not self._packed:
+            return self._scan_directory()
+
+        st = os.stat(self._path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        self._remap()
+        # one C pass over the mapping; far cheaper than rescanning records
+        crc = zlib.crc32(self._mm) if self._mm is not None else 0
+        index = self._load_index_file(stamp, crc)
+        if index is None:
+            index = self._scan_packed()
+            self._save_index_file(stamp, crc, index)
+        self._stamp = stamp
+        return index
+
+    def _scan_directory(self) -> _Index:
+        ids: List[str] = []
+        paths: List[str] = []
+        sizes, mtimes = array("q"), array("q")
+        with os.scandir(self._path) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(_SUFFIXES) or not entry.is_file():
+                    continue
+                st = entry.stat()
+                ids.append(name.rsplit(".", 1)[0])
+                paths.append(entry.path)
+                sizes.append(st.st_size)
+                mtimes.append(st.st_mtime_ns)
+        return _new_index(ids, array("q", [0]) * len(ids), sizes, mtimes, paths)
+
+    def _scan_packed(self) -> _Index:
+        ids: List[str] = []
+        offsets, lengths, versions = array("q"), array("q"), array("q")
+        mm = self._mm
+        if mm is not None:
+            pos, end = 0, len(mm)
+            while pos < end:
+                nl = mm.find(b"\n", pos)
+                if nl < 0:
+                    nl = end
+                line = mm[pos:nl]
+                tenant_id = _record_tenant_id(line)
+                if tenant_id is not None:
+                    ids.append(tenant_id)
+                    offsets.append(pos)
+                    lengths.append(nl - pos)
+                    versions.append(zlib.crc32(line))
+                elif line.strip():
+                    logger.warning("Packed tenant config line without tenant_id at offset=%s", pos)
+                pos = nl + 1
+        return _new_index(ids, offsets, lengths, versions)
+
+    def _load_index_file(self, stamp: Tuple[int, int], crc: int) -> Optional[_Index]:
+        """
+        Binary sidecar: magic, (mtime_ns, size, count, file crc32, body crc32),
+        then the body: offsets/lengths/versions as int64 arrays and tenant ids
+        joined by "\n". Any mismatch means a rebuild.
+        """
+        if self._index_path is None:
+            return None
+        try:
+            with open(self._index_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        head = len(_INDEX_MAGIC) + struct.calcsize(_HEADER)
+        if not data.startswith(_INDEX_MAGIC) or len(data) < head:
+            return None
+        mtime_ns, size, count, file_crc, body_crc = struct.unpack_from(_HEADER, data, len(_INDEX_MAGIC))
+        if (mtime_ns, size) != stamp or file_crc != crc or zlib.crc32(data[head:]) != body_crc:
+            return None
+
+        cols = []
+        pos = head
+        for _ in range(3):
+            col = array("q")
+            col.frombytes(data[pos:pos + 8 * count])
+            cols.append(col)
+            pos += 8 * count
+        ids = data[pos:].decode("utf-8").split("\n") if count else []
+        if len(ids) != count or any(len(c) != count for c in cols):
+            return None
+        return _new_index(ids, cols[0], cols[1], cols[2])
+
+    def _save_index_file(self, stamp: Tuple[int, int], crc: int, index: _Index) -> None:
+        if self._index_path is None:
+            return
+        body = b"".join((
+            index.offsets.tobytes(),
+            index.lengths.tobytes(),
+            index.versions.tobytes(),
+            "\n".join(index.positions).encode("utf-8"),
+        ))
+        tmp = f"{self._index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(_INDEX_MAGIC)
+                f.write(struct.pack(_HEADER, stamp[0], stamp[1], len(index.positions), crc, zlib.crc32(body)))
+                f.write(body)
+            os.replace(tmp, self._index_path)
+        except OSError:
+            # read-only location: index is rebuilt on next start
+            logger.warning("Cannot write tenant config index path=%s", self._index_path)
+
+    # --- reads ---
+
+    def _remap(self) -> None:
+        self.close()
+        if os.path.getsize(self._path) == 0:
+            return
+        self._file = open(self._path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _read(self, i: int) -> Mapping[str, Any]:
+        index = self._index
+        if index.paths is not None:
+            path = index.paths[i]
+            with open(path, "rb") as f:
+                return _parse(f.read(), path)
+        assert self._mm is not None
+        offset = index.offsets[i]
+        return json.loads(self._mm[offset:offset + index.lengths[i]])
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Mapping
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    return value
+
+
+def config_hash(cfg: Any) -> str:
+    """
+    Stable hash of a config blob.
+
+    - independent of mapping key order and Mapping/dict, tuple/list types
+    - same across processes (no PYTHONHASHSEED dependency)
+    - values that are not JSON-serializable are hashed by repr
+    """
+    blob = json.dumps(_canonical(cfg), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=repr)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
@@ -15,6 +15,15 @@ class TenantConfig:
     # module_key -> module config blob (module decides schema)
     modules: Mapping[str, Mapping[str, Any]] = None  # type: ignore[assignment]
 
+    # admission limits, e.g. {"max_concurrent": 20, "max_queue": 100}
+    limits: Mapping[str, Any] = None  # type: ignore[assignment]
+
+
+class TenantNotFound(KeyError):
+    """
+    Raised by stores for unknown tenants (cacheable, unlike transient errors).
+    """
+
 
 class TenantConfigStore(Protocol):
     """
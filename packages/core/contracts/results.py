@@ -44,3 +44,14 @@ class ServiceResult(Generic[T]):
 
     # if deferred, core returns ticket_id and later emits an event when completed
     ticket_id: Optional[str] = None
+
+
+class StreamError(Exception):
+    """
+    Raised by ServiceResult.stream (as returned by ServiceExecutor) when the
+    stream fails after the result was handed out, e.g. idle timeout.
+    """
+
+    def __init__(self, error: ErrorInfo) -> None:
+        super().__init__(error.message)
+        self.error = error
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Mapping, Optional, Protocol
+from typing import Any, Mapping, Optional, Protocol, Sequence
 
 from .results import ServiceResult
 
@@ -39,6 +39,16 @@ class TextComposer(Protocol):
     async def compose(self, call: ServiceCall, inp: TextComposeIn) -> ServiceResult[TextComposeOut]:
         ...
 
+    async def compose_many(
+        self,
+        call: ServiceCall,
+        inputs: Sequence[TextComposeIn],
+    ) -> list[ServiceResult[TextComposeOut]]:
+        """
+        Batch variant: one result per input, same order.
+        """
+        ...
+
 
 @dataclass(frozen=True)
 class IntentResolveIn:
@@ -59,6 +69,16 @@ class IntentResolver(Protocol):
     async def resolve(self, call: ServiceCall, inp: IntentResolveIn) -> ServiceResult[IntentResolveOut]:
         ...
 
+    async def resolve_many(
+        self,
+        call: ServiceCall,
+        inputs: Sequence[IntentResolveIn],
+    ) -> list[ServiceResult[IntentResolveOut]]:
+        """
+        Batch variant: one result per input, same order.
+        """
+        ...
+
 
 @dataclass(frozen=True)
 class KnowledgeRespondIn:
@@ -75,4 +95,8 @@ class KnowledgeRespondOut:
 
 class KnowledgeResponder(Protocol):
     async def respond(self, call: ServiceCall, inp: KnowledgeRespondIn) -> ServiceResult[KnowledgeRespondOut]:
+        """
+        Long answers may be streamed: result.stream yields KnowledgeRespondOut
+        pieces (answer_text deltas; sources on any piece).
+        """
         ...
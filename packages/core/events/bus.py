@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 import uuid
 from collections import defaultdict
-from typing import DefaultDict, List
+from dataclasses import dataclass
+from itertools import groupby
+from typing import DefaultDict, Dict, List, Set, Tuple
 
+from .patterns import SubscriptionTrie, is_pattern
 from .types import Subscription
 from ..contracts.events import EventEnvelope
 
@@ -20,6 +24,30 @@ def _new_id(prefix: str) -> str:
     return f"{prefix}_{uuid.uuid4().hex}"
 
 
+@dataclass(frozen=True)
+class _Stage:
+    """
+    Subscribers of one priority level, split by dispatch mode.
+    """
+    sequential: Tuple[Subscription, ...]
+    concurrent: Tuple[Subscription, ...]
+    background: Tuple[Subscription, ...]
+
+
+def _build_plan(subs: List[Subscription]) -> Tuple[_Stage, ...]:
+    stages = []
+    for _, group in groupby(subs, key=lambda s: s.priority):
+        items = list(group)
+        stages.append(
+            _Stage(
+                sequential=tuple(s for s in items if s.mode == "sequential"),
+                concurrent=tuple(s for s in items if s.mode == "concurrent"),
+                background=tuple(s for s in items if s.mode == "background"),
+            )
+        )
+    return tuple(stages)
+
+
 class EventBus:
     """
     Simple in-memory event bus.
@@ -28,20 +56,43 @@ class EventBus:
     - error isolation per handler
     - emits system event on handler failure
     - supports unsubscribe (needed for runtime module detach)
+    - per-subscription dispatch mode (sequential | concurrent | background);
+      within one priority level: background handlers are scheduled first,
+      then concurrent handlers are gathered, then sequential ones run in order
+    - wildcard subscriptions ("service.*.error", "service.text_compose.*", "service.**");
+      exact and wildcard subscribers are resolved once per concrete event name
+      and cached until the next subscribe/unsubscribe
     """
 
-    def __init__(self) -> None:
+    # resolved names kept in cache; cleared entirely when exceeded
+    max_resolved_names = 10_000
+
+    def __init__(self, *, max_background_tasks: int = 1_000) -> None:
         self._subscriptions: DefaultDict[str, List[Subscription]] = defaultdict(list)
+        self._patterns = SubscriptionTrie()
+
+        # concrete event name -> (subscribers, dispatch plan)
+        self._resolved: Dict[str, Tuple[Tuple[Subscription, ...], Tuple[_Stage, ...]]] = {}
+
+        # bounded group of background handler tasks
+        self._background: Set[asyncio.Task[None]] = set()
+        self._background_slots = asyncio.Semaphore(max(1, max_background_tasks))
 
     def subscribe(self, sub: Subscription) -> None:
-        self._subscriptions[sub.name].append(sub)
-        self._subscriptions[sub.name].sort(key=lambda s: s.priority)
+        if is_pattern(sub.name):
+            self._patterns.add(sub)
+            self._resolved.clear()
+        else:
+            self._subscriptions[sub.name].append(sub)
+            self._subscriptions[sub.name].sort(key=lambda s: s.priority)
+            self._resolved.pop(sub.name, None)
 
         logger.debug(
-            "Subscribed handler=%s to event=%s priority=%s",
+            "Subscribed handler=%s to event=%s priority=%s mode=%s",
             sub.handler,
             sub.name,
             sub.priority,
+            sub.mode,
         )
 
     def unsubscribe(self, name: str, handler) -> int:
@@ -49,6 +100,12 @@ class EventBus:
         Remove subscriptions for event name and handler.
         Returns number of removed subscriptions.
         """
+        if is_pattern(name):
+            removed = self._patterns.remove(name, handler)
+            if removed:
+                self._resolved.clear()
+            return removed
+
         subs = self._subscriptions.get(name, [])
         if not subs:
             return 0
@@ -61,54 +118,122 @@ class EventBus:
             self._subscriptions[name] = subs
         else:
             self._subscriptions.pop(name, None)
+        self._resolved.pop(name, None)
 
         return removed
 
     async def publish(self, event: EventEnvelope) -> None:
-        subs = list(self._subscriptions.get(event.name, []))
+        _, plan = self._resolve(event.name)
 
-        if not subs:
+        if not plan:
             logger.debug("No subscribers for event %s", event.name)
             return
 
-        for sub in subs:
-            try:
-                await sub.handler(event)
+        for stage in plan:
+            for sub in stage.background:
+                await self._spawn_background(sub, event)
 
-            except Exception as exc:
-                logger.exception(
-                    "Error in handler=%s for event=%s",
-                    sub.handler,
-                    event.name,
+            if stage.concurrent:
+                outcomes = await asyncio.gather(
+                    *(self._dispatch(sub, event) for sub in stage.concurrent),
+                    return_exceptions=True,
                 )
-
-                if sub.isolate_errors:
-                    err_event = EventEnvelope(
-                        name="system.handler_error",
-                        kind="system",
-                        tenant_id=event.tenant_id,
-                        event_id=_new_id("evt"),
-                        trace_id=event.trace_id,
-                        occurred_at_ms=_now_ms(),
-                        request_id=event.request_id,
-                        ticket_id=event.ticket_id,
-                        payload={
-                            "failed_event": event.name,
-                            "handler": repr(sub.handler),
-                            "error_type": type(exc).__name__,
-                            "error_message": str(exc),
-                        },
-                    )
-                    await self._publish_internal(err_event)
-
-                    if sub.stop_on_error:
-                        break
-                    continue
-
-                raise
+                stop = False
+                for outcome in outcomes:
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                    stop = stop or outcome
+                if stop:
+                    return
+
+            for sub in stage.sequential:
+                if await self._dispatch(sub, event):
+                    return
+
+    async def drain(self) -> None:
+        """
+        Wait for scheduled background handlers to finish.
+        """
+        while self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
+
+    def _resolve(self, name: str) -> Tuple[Tuple[Subscription, ...], Tuple[_Stage, ...]]:
+        resolved = self._resolved.get(name)
+        if resolved is not None:
+            return resolved
+
+        subs = list(self._subscriptions.get(name, []))
+        if len(self._patterns):
+            subs.extend(self._patterns.match(name))
+            # stable: exact subscribers first within the same priority
+            subs.sort(key=lambda s: s.priority)
+
+        if len(self._resolved) >= self.max_resolved_names:
+            self._resolved.clear()
+        resolved = (tuple(subs), _build_plan(subs))
+        self._resolved[name] = resolved
+        return resolved
+
+    async def _dispatch(self, sub: Subscription, event: EventEnvelope) -> bool:
+        """
+        Run one handler. Returns True if processing of the event must stop.
+        Re-raises handler errors when isolation is off.
+        """
+        try:
+            await sub.handler(event)
+            return False
+
+        except Exception as exc:
+            logger.exception(
+                "Error in handler=%s for event=%s",
+                sub.handler,
+                event.name,
+            )
+
+            if sub.isolate_errors:
+                await self._publish_handler_error(sub, event, exc)
+                return sub.stop_on_error
+
+            raise
+
+    async def _spawn_background(self, sub: Subscription, event: EventEnvelope) -> None:
+        # bounded: publisher waits for a free slot when the group is full
+        await self._background_slots.acquire()
+        task = asyncio.get_running_loop().create_task(self._run_background(sub, event))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _run_background(self, sub: Subscription, event: EventEnvelope) -> None:
+        try:
+            await sub.handler(event)
+        except Exception as exc:
+            logger.exception("Error in background handler=%s for event=%s", sub.handler, event.name)
+            # nobody awaits a background handler: always report instead of raising
+            await self._publish_handler_error(sub, event, exc)
+        finally:
+            self._background_slots.release()
+
+    async def _publish_handler_error(self, sub: Subscription, event: EventEnvelope, exc: Exception) -> None:
+        err_event = EventEnvelope(
+            name="system.handler_error",
+            kind="system",
+            tenant_id=event.tenant_id,
+            event_id=_new_id("evt"),
+            trace_id=event.trace_id,
+            occurred_at_ms=_now_ms(),
+            request_id=event.request_id,
+            ticket_id=event.ticket_id,
+            payload={
+                "failed_event": event.name,
+                "handler": repr(sub.handler),
+                "error_type": type(exc).__name__,
+                "error_message": str(exc),
+            },
+        )
+        await self._publish_internal(err_event)
 
     async def _publish_internal(self, event: EventEnvelope) -> None:
-        subs = list(self._subscriptions.get(event.name, []))
+        subs, _ = self._resolve(event.name)
         for sub in subs:
             try:
                 await sub.handler(event)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from .types import Subscription
+
+# one segment: "service.*.error"
+SINGLE = "*"
+# zero or more segments: "service.**"
+MULTI = "**"
+
+
+def is_pattern(name: str) -> bool:
+    return SINGLE in name
+
+
+class _Node:
+    __slots__ = ("children", "subs")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _Node] = {}
+        self.subs: List[Subscription] = []
+
+
+class SubscriptionTrie:
+    """
+    Segment trie of wildcard subscriptions (segments are split by ".").
+
+    - "*" matches exactly one segment
+    - "**" matches zero or more segments
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, sub: Subscription) -> None:
+        node = self._root
+        for seg in sub.name.split("."):
+            node = node.children.setdefault(seg, _Node())
+        node.subs.append(sub)
+        self._count += 1
+
+    def remove(self, pattern: str, handler) -> int:
+        path: List[_Node] = [self._root]
+        for seg in pattern.split("."):
+            nxt: Optional[_Node] = path[-1].children.get(seg)
+            if nxt is None:
+                return 0
+            path.append(nxt)
+
+        node = path[-1]
+        before = len(node.subs)
+        node.subs = [s for s in node.subs if s.handler is not handler]
+        removed = before - len(node.subs)
+        self._count -= removed
+
+        # prune empty branches
+        segs = pattern.split(".")
+        for i in range(len(segs), 0, -1):
+            child = path[i]
+            if child.subs or child.children:
+                break
+            del path[i - 1].children[segs[i - 1]]
+
+        return removed
+
+    def match(self, name: str) -> List[Subscription]:
+        """
+        All subscriptions whose pattern matches a concrete event name
+        (in pattern insertion order per node, deduplicated).
+        """
+        out: List[Subscription] = []
+        seen: set[int] = set()
+        self._match(self._root, name.split("."), 0, out, seen)
+        return out
+
+    def _match(self, node: _Node, segs: List[str], i: int, out: List[Subscription], seen: set[int]) -> None:
+        multi = node.children.get(MULTI)
+        if multi is not None:
+            # "**" consumes segs[i:j] for every j
+            for j in range(i, len(segs) + 1):
+                self._match(multi, segs, j, out, seen)
+
+        if i == len(segs):
+            for sub in node.subs:
+                # a node can be reached through several "**" expansions
+                if id(sub) not in seen:
+                    seen.add(id(sub))
+                    out.append(sub)
+            return
+
+        exact = node.children.get(segs[i])
+        if exact is not None:
+            self._match(exact, segs, i + 1, out, seen)
+
+        single = node.children.get(SINGLE)
+        if single is not None:
+            self._match(single, segs, i + 1, out, seen)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Literal, Mapping, Tuple
+
+from .bus import EventBus
+from ..contracts.events import EventEnvelope, EventKind
+
+logger = logging.getLogger(__name__)
+
+# block: publisher waits for free space
+# drop_oldest: oldest queued event is discarded to make room
+# drop_new: the published event is discarded
+OverflowPolicy = Literal["block", "drop_oldest", "drop_new"]
+
+
+class BusClosed(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class QueueConfig:
+    maxsize: int = 10_000
+    workers: int = 1
+    overflow: OverflowPolicy = "block"
+
+
+@dataclass(frozen=True)
+class QueueMetrics:
+    depth: int
+    maxsize: int
+    enqueued: int
+    processed: int
+    dropped: int
+    # enqueue -> dispatch start, milliseconds
+    last_lag_ms: float
+    max_lag_ms: float
+
+
+@dataclass
+class _KindQueue:
+    cfg: QueueConfig
+    # (enqueued_at monotonic seconds, event)
+    queue: "asyncio.Queue[Tuple[float, EventEnvelope]]"
+    workers: List[asyncio.Task[None]] = field(default_factory=list)
+
+    enqueued: int = 0
+    processed: int = 0
+    dropped: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+
+
+class QueuedEventBus(EventBus):
+    """
+    EventBus with per-event-kind bounded queues and worker pools.
+
+    publish() only enqueues, handlers run in worker tasks, so publisher latency
+    does not depend on subscriber latency. Order is preserved per kind only
+    with a single worker.
+
+    Handler errors that would be re-raised to the publisher by EventBus
+    (isolate_errors=False) are logged by the worker instead.
+    """
+
+    def __init__(
+        self,
+        *,
+        default: QueueConfig = QueueConfig(),
+        per_kind: Mapping[EventKind, QueueConfig] | None = None,
+        max_background_tasks: int = 1_000,
+    ) -> None:
+        super().__init__(max_background_tasks=max_background_tasks)
+        self._default_cfg = default
+        self._per_kind_cfg: Dict[str, QueueConfig] = dict(per_kind or {})
+        self._queues: Dict[str, _KindQueue] = {}
+        self._closed = False
+
+    async def publish(self, event: EventEnvelope) -> None:
+        if self._closed:
+            raise BusClosed("Event bus is closed")
+
+        kq = self._queue_for(event.kind)
+        item = (time.monotonic(), event)
+
+        if kq.queue.full():
+            policy = kq.cfg.overflow
+            if policy == "drop_new":
+                kq.dropped += 1
+                logger.warning("Event queue full, dropped new event=%s kind=%s", event.name, event.kind)
+                return
+            if policy == "drop_oldest":
+                try:
+                    _, old = kq.queue.get_nowait()
+                    kq.queue.task_done()
+                    kq.dropped += 1
+                    logger.warning("Event queue full, dropped oldest event=%s kind=%s", old.name, old.kind)
+                except asyncio.QueueEmpty:
+                    pass
+
+        await kq.queue.put(item)
+        kq.enqueued += 1
+
+    async def drain(self) -> None:
+        """
+        Wait until all queued events and background handlers are processed.
+        """
+        for kq in list(self._queues.values()):
+            await kq.queue.join()
+        await super().drain()
+
+    async def close(self) -> None:
+        """
+        Graceful shutdown: stop accepting events, drain queues, stop workers.
+        """
+        self._closed = True
+        await self.drain()
+
+        workers = [w for kq in self._queues.values() for w in kq.workers]
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for kq in self._queues.values():
+            kq.workers.clear()
+
+    def metrics(self) -> Dict[str, QueueMetrics]:
+        """
+        kind -> queue metrics (depth, lag, counters).
+        """
+        return {
+            kind: QueueMetrics(
+                depth=kq.queue.qsize(),
+                maxsize=kq.cfg.maxsize,
+                enqueued=kq.enqueued,
+                processed=kq.processed,
+                dropped=kq.dropped,
+                last_lag_ms=kq.last_lag_ms,
+                max_lag_ms=kq.max_lag_ms,
+            )
+            for kind, kq in self._queues.items()
+        }
+
+    def _queue_for(self, kind: str) -> _KindQueue:
+        kq = self._queues.get(kind)
+        if kq is not None:
+            return kq
+
+        cfg = self._per_kind_cfg.get(kind, self._default_cfg)
+        kq = _KindQueue(cfg=cfg, queue=asyncio.Queue(maxsize=max(1, cfg.maxsize)))
+        loop = asyncio.get_running_loop()
+        for i in range(max(1, cfg.workers)):
+            kq.workers.append(loop.create_task(self._worker(kq), name=f"event-bus-{kind}-{i}"))
+        self._queues[kind] = kq
+        return kq
+
+    async def _worker(self, kq: _KindQueue) -> None:
+        while True:
+            enqueued_at, event = await kq.queue.get()
+            try:
+                lag_ms = (time.monotonic() - enqueued_at) * 1000.0
+                kq.last_lag_ms = lag_ms
+                if lag_ms > kq.max_lag_ms:
+                    kq.max_lag_ms = lag_ms
+
+                await EventBus.publish(self, event)
+
+            except Exception:
+                logger.exception("Unhandled error while dispatching event=%s", event.name)
+
+            finally:
+                kq.processed += 1
+                kq.queue.task_done()
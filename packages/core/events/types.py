@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Literal
 
 from ..contracts.events import EventEnvelope, EventName
 
 
 EventHandler = Callable[[EventEnvelope], Awaitable[None]]
 
+# sequential: awaited one by one in priority order (default)
+# concurrent: awaited together with other concurrent handlers of the same priority
+# background: scheduled as a task, publish does not wait for it
+DispatchMode = Literal["sequential", "concurrent", "background"]
+
 
 @dataclass(frozen=True)
 class Subscription:
@@ -19,3 +24,4 @@ class Subscription:
     stop_on_error: bool = False
     # isolation: errors are captured and emitted as system events by bus
     isolate_errors: bool = True
+    mode: DispatchMode = "sequential"
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Mapping, Optional, TypeVar
+
+from ..contracts.results import ErrorInfo, ResultMeta, ServiceResult
+from ..registry.services import ServiceRegistry
+from .stream_mw import observe_stream
+from .types import Next, ServiceOp
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class AdmissionLimits:
+    # calls running at the same time
+    max_concurrent: int
+    # calls allowed to wait for a slot; beyond that calls are rejected at once
+    max_queue: int = 0
+
+    @staticmethod
+    def from_cfg(cfg: Mapping[str, Any]) -> "AdmissionLimits":
+        return AdmissionLimits(
+            max_concurrent=int(cfg["max_concurrent"]),
+            max_queue=int(cfg.get("max_queue", 0)),
+        )
+
+
+class _Gate:
+    """
+    Semaphore with a bounded FIFO wait queue.
+    """
+
+    __slots__ = ("limits", "active", "waiters")
+
+    def __init__(self, limits: AdmissionLimits) -> None:
+        self.limits = limits
+        self.active = 0
+        self.waiters: Deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> bool:
+        if self.active < self.limits.max_concurrent and not self.waiters:
+            self.active += 1
+            return True
+
+        if len(self.waiters) >= self.limits.max_queue:
+            return False
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.waiters.append(fut)
+        try:
+            await fut
+            return True
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # slot was handed over right before cancellation: pass it on
+                self.release()
+            else:
+                self.waiters.remove(fut)
+            raise
+
+    def release(self) -> None:
+        # hand the slot directly to the next waiter (active stays the same),
+        # unless lowered limits already have more calls running than allowed
+        if self.active <= self.limits.max_concurrent:
+            while self.waiters:
+                fut = self.waiters.popleft()
+                if not fut.done():
+                    fut.set_result(None)
+                    return
+        self.active -= 1
+
+    def set_limits(self, limits: AdmissionLimits) -> None:
+        """
+        Raised limits admit waiters now; lowered ones take effect as running
+        calls release (no waiter gets a slot until active is below the limit).
+        """
+        self.limits = limits
+        while self.waiters and self.active < limits.max_concurrent:
+            fut = self.waiters.popleft()
+            if not fut.done():
+                self.active += 1
+                fut.set_result(None)
+
+
+class AdmissionController:
+    """
+    Concurrency limits per tenant, per provider and global.
+
+    A call takes a slot in every applicable gate, narrowest scope first
+    (tenant -> provider -> global): while it waits in a gate's queue it holds
+    slots only in narrower gates, so a noisy tenant's queued calls do not
+    occupy global slots. The provider gate is the one of op.provider_name
+    (the provider the executor picked), so every provider of a multi-provider
+    binding is limited by its own gate.
+    When a gate is full and its wait queue is full too, the call is rejected
+    with ErrorInfo(code="overloaded", retryable=True) without reaching the provider.
+    """
+
+    def __init__(
+        self,
+        *,
+        registry: ServiceRegistry | None = None,
+        global_limits: AdmissionLimits | None = None,
+        tenant_default: AdmissionLimits | None = None,
+        provider_limits: Mapping[str, AdmissionLimits] | None = None,
+    ) -> None:
+        self._registry = registry
+        self._global = _Gate(global_limits) if global_limits is not None else None
+        self._tenant_default = tenant_default
+        self._tenant_overrides: Dict[str, AdmissionLimits] = {}
+        self._tenants: Dict[str, _Gate] = {}
+        self._providers: Dict[str, _Gate] = {n: _Gate(l) for n, l in (provider_limits or {}).items()}
+
+    def set_tenant_limits(self, tenant_id: str, limits: AdmissionLimits | None) -> None:
+        """
+        Override limits for a tenant (None -> back to tenant_default).
+        """
+        if limits is None:
+            self._tenant_overrides.pop(tenant_id, None)
+        else:
+            self._tenant_overrides[tenant_id] = limits
+
+        effective = limits or self._tenant_default
+        gate = self._tenants.get(tenant_id)
+        if gate is None:
+            return
+        if effective is None:
+            # no limit anymore: keep gate until in-flight calls release it
+            gate.set_limits(AdmissionLimits(max_concurrent=1 << 30, max_queue=0))
+            if gate.active == 0:
+                self._tenants.pop(tenant_id, None)
+        else:
+            gate.set_limits(effective)
+
+    def set_provider_limits(self, provider_name: str, limits: AdmissionLimits) -> None:
+        gate = self._providers.get(provider_name)
+        if gate is None:
+            self._providers[provider_name] = _Gate(limits)
+        else:
+            gate.set_limits(limits)
+
+    def _gates(self, op: ServiceOp[Any]) -> List[tuple[str, _Gate]]:
+        """
+        Applicable gates in acquire order (narrowest first).
+        """
+        gates: List[tuple[str, _Gate]] = []
+        tenant_id = op.call.tenant_id
+        gate = self._tenants.get(tenant_id)
+        if gate is None:
+            limits = self._tenant_overrides.get(tenant_id) or self._tenant_default
+            if limits is not None:
+                gate = self._tenants[tenant_id] = _Gate(limits)
+        if gate is not None:
+            gates.append(("tenant", gate))
+
+        if self._providers:
+            provider = op.provider_name
+            if provider is None and self._registry is not None:
+                # fn-mode call without a provider name: the binding's preferred provider
+                provider = self._registry.bound_provider_name(tenant_id, op.service_key)
+            pgate = self._providers.get(provider) if provider else None
+            if pgate is not None:
+                gates.append(("provider", pgate))
+
+        if self._global is not None:
+            gates.append(("global", self._global))
+        return gates
+
+    async def admit(self, op: ServiceOp[Any]) -> tuple[Optional[str], List[_Gate]]:
+        """
+        Returns (rejected_scope or None, acquired gates to release).
+        """
+        acquired: List[_Gate] = []
+        for scope, gate in self._gates(op):
+            try:
+                ok = await gate.acquire()
+            except BaseException:
+                for g in reversed(acquired):
+                    g.release()
+                raise
+            if not ok:
+                for g in reversed(acquired):
+                    g.release()
+                return scope, []
+            acquired.append(gate)
+        return None, acquired
+
+
+def _overloaded(op: ServiceOp[T], scope: str) -> ServiceResult[T]:
+    meta = ResultMeta(
+        request_id=op.call.request_id,
+        tenant_id=op.call.tenant_id,
+        trace_id=op.call.trace_id,
+        started_at_ms=0,
+        finished_at_ms=None,
+        provider_name=None,
+        attempt=1,
+        idempotency_key=op.call.idempotency_key,
+        tags=op.call.tags,
+    )
+    return ServiceResult(
+        status="error",
+        meta=meta,
+        error=ErrorInfo(
+            code="overloaded",
+            message="Too many concurrent requests",
+            retryable=True,
+            details={"scope": scope},
+        ),
+    )
+
+
+def make_admission_middleware(controller: AdmissionController):
+    async def mw(op: ServiceOp[T], nxt: Next[T]) -> ServiceResult[T]:
+        rejected, gates = await controller.admit(op)
+        if rejected is not None:
+            return _overloaded(op, rejected)
+
+        def release(*_: object) -> None:
+            for gate in reversed(gates):
+                gate.release()
+
+        return await _hold(op, nxt, release)
+
+    return mw
+
+
+def make_limit_middleware(limits: AdmissionLimits, *, scope: str = "binding"):
+    """
+    One standalone gate (e.g. per ResolvedService handle), same semantics as
+    the controller gates.
+    """
+    gate = _Gate(limits)
+
+    async def mw(op: ServiceOp[T], nxt: Next[T]) -> ServiceResult[T]:
+        if not await gate.acquire():
+            return _overloaded(op, scope)
+        return await _hold(op, nxt, lambda *_: gate.release())
+
+    return mw
+
+
+async def _hold(op: ServiceOp[T], nxt: Next[T], release) -> ServiceResult[T]:
+    """
+    Run nxt() holding the slot; a streamed result keeps it until its stream ends.
+    """
+    try:
+        res = await nxt()
+    except BaseException:
+        release()
+        raise
+    if res.stream is None:
+        release()
+        return res
+    return observe_stream(op, res, on_end=release)
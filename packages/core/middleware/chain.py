@@ -1,34 +1,90 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Awaitable, Callable, Generic, List, TypeVar
+from typing import Awaitable, Callable, Generic, Iterable, Tuple, TypeVar
 
 from ..contracts.results import ServiceResult
 from .types import Next, ServiceMiddleware, ServiceOp
 
 T = TypeVar("T")
 
+Middleware = Callable[[ServiceOp[T], Next[T]], Awaitable[ServiceResult[T]]]
+
+
+class ChainFrozen(Exception):
+    pass
+
+
+class _Next(Generic[T]):
+    """
+    `nxt` handed to layer i-1: calling it runs layer i (or the terminal).
+
+    Immutable, one per layer reached: a middleware may call its nxt() again
+    (retry-style) or concurrently (hedge-style), each call runs the rest of
+    the pipeline from the same layer.
+    """
+
+    __slots__ = ("_mws", "_op", "_terminal", "_i")
+
+    def __init__(self, mws: Tuple[Middleware[T], ...], op: ServiceOp[T], terminal: Next[T], i: int) -> None:
+        self._mws = mws
+        self._op = op
+        self._terminal = terminal
+        self._i = i
+
+    def __call__(self) -> Awaitable[ServiceResult[T]]:
+        i = self._i
+        if i >= len(self._mws):
+            return self._terminal()
+        return self._mws[i](self._op, _Next(self._mws, self._op, self._terminal, i + 1))
+
 
-@dataclass
 class MiddlewareChain:
-    middlewares: List[Callable[[ServiceOp[T], Next[T]], Awaitable[ServiceResult[T]]]] = field(default_factory=list)
+    """
+    Ordered middlewares around a terminal operation.
 
-    def add(self, mw: Callable[[ServiceOp[T], Next[T]], Awaitable[ServiceResult[T]]]) -> None:
-        self.middlewares.append(mw)
+    The chain is compiled into a fixed pipeline on add()/freeze():
+    - 0 middlewares: terminal is called directly
+    - 1 middleware: mw(op, terminal), no extra objects
+    - N middlewares: one small next object per layer reached, no closures
 
-    async def run(self, op: ServiceOp[T], terminal: Next[T]) -> ServiceResult[T]:
-        """
-        Run middlewares around terminal operation.
-        """
-        async def call_at(i: int) -> ServiceResult[T]:
-            if i >= len(self.middlewares):
-                return await terminal()
+    `middlewares` is a read-only tuple; add() is the only way to change the chain.
+    """
+
+    def __init__(self, middlewares: Iterable[Middleware[T]] = ()) -> None:
+        self._pipeline: Tuple[Middleware[T], ...] = tuple(middlewares)
+        self._frozen = False
+
+    def __repr__(self) -> str:
+        return f"MiddlewareChain(middlewares={self._pipeline!r})"
+
+    @property
+    def middlewares(self) -> Tuple[Middleware[T], ...]:
+        return self._pipeline
 
-            mw = self.middlewares[i]
+    def add(self, mw: Middleware[T]) -> None:
+        if self._frozen:
+            raise ChainFrozen("Middleware chain is frozen")
+        self._pipeline = (*self._pipeline, mw)
 
-            async def nxt() -> ServiceResult[T]:
-                return await call_at(i + 1)
+    def freeze(self) -> "MiddlewareChain":
+        """
+        Forbid further add().
+        """
+        self._frozen = True
+        return self
 
-            return await mw(op, nxt)
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
 
-        return await call_at(0)
+    def run(self, op: ServiceOp[T], terminal: Next[T]) -> Awaitable[ServiceResult[T]]:
+        """
+        Run middlewares around terminal operation.
+        Returns an awaitable (no extra coroutine frame for the chain itself).
+        """
+        mws = self._pipeline
+        if not mws:
+            return terminal()
+        if len(mws) == 1:
+            return mws[0](op, terminal)
+        return mws[0](op, _Next(mws, op, terminal, 1))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TypeVar
+import asyncio
+from typing import Dict, TypeVar
 
 from ..contracts.results import ErrorInfo, ResultMeta, ServiceResult
 from .idempotency_store import IdempotencyStore
@@ -9,12 +10,51 @@ from .types import Next, ServiceOp
 T = TypeVar("T")
 
 
+def _in_progress(op: ServiceOp[T], key: str) -> ServiceResult[T]:
+    # Someone else is working; return a deterministic retryable error
+    meta = ResultMeta(
+        request_id=op.call.request_id,
+        tenant_id=op.call.tenant_id,
+        trace_id=op.call.trace_id,
+        started_at_ms=op.call.tags.get("started_at_ms", 0) if isinstance(op.call.tags, dict) else 0,
+        finished_at_ms=None,
+        provider_name=None,
+        attempt=1,
+        idempotency_key=key,
+        tags=op.call.tags,
+    )
+    return ServiceResult(
+        status="error",
+        meta=meta,
+        error=ErrorInfo(code="in_progress", message="Operation in progress", retryable=True),
+    )
+
+
+def _consume(fut: "asyncio.Future[ServiceResult[T]]") -> None:
+    # leader failure with no followers must not be reported as "never retrieved"
+    if not fut.cancelled():
+        fut.exception()
+
+
 def make_idempotency_middleware(
     *,
     store: IdempotencyStore[T],
     ttl_seconds: int = 300,
     lock_ttl_seconds: int = 30,
+    coalesce: bool = False,
+    coalesce_wait_ms: int = 1_000,
 ):
+    """
+    coalesce=False: duplicates of an in-flight key get an "in_progress" error.
+    coalesce=True: duplicates arriving while the key is in flight in this process
+    await the first call (up to coalesce_wait_ms) and receive the same result;
+    if the wait runs out they get "in_progress" as before.
+    Streamed results are neither stored nor shared (a stream is consumed once):
+    duplicates get "in_progress".
+    """
+    # key -> result of the call currently in flight (coalesce mode only)
+    inflight: Dict[str, "asyncio.Future[ServiceResult[T]]"] = {}
+
     async def mw(op: ServiceOp[T], nxt: Next[T]) -> ServiceResult[T]:
         key = op.call.idempotency_key
         if not key:
@@ -24,29 +64,44 @@ def make_idempotency_middleware(
         if cached is not None:
             return cached
 
+        if not coalesce:
+            return await _run_locked(op, nxt, key)
+
+        pending = inflight.get(key)
+        if pending is not None:
+            # asyncio.wait never cancels the leader's future on timeout
+            done, _ = await asyncio.wait({pending}, timeout=coalesce_wait_ms / 1000.0)
+            if not done or pending.cancelled() or pending.result().stream is not None:
+                return _in_progress(op, key)
+            return pending.result()
+
+        fut: "asyncio.Future[ServiceResult[T]]" = asyncio.get_running_loop().create_future()
+        fut.add_done_callback(_consume)
+        inflight[key] = fut
+        try:
+            res = await _run_locked(op, nxt, key)
+            fut.set_result(res)
+            return res
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as exc:
+            fut.set_exception(exc)
+            raise
+        finally:
+            if inflight.get(key) is fut:
+                del inflight[key]
+
+    async def _run_locked(op: ServiceOp[T], nxt: Next[T], key: str) -> ServiceResult[T]:
         acquired = await store.lock(key, ttl_seconds=lock_ttl_seconds)
         if not acquired:
-            # Someone else is working; return a deterministic retryable error
-            meta = ResultMeta(
-                request_id=op.call.request_id,
-                tenant_id=op.call.tenant_id,
-                trace_id=op.call.trace_id,
-                started_at_ms=op.call.tags.get("started_at_ms", 0) if isinstance(op.call.tags, dict) else 0,
-                finished_at_ms=None,
-                provider_name=None,
-                attempt=1,
-                idempotency_key=key,
-                tags=op.call.tags,
-            )
-            return ServiceResult(
-                status="error",
-                meta=meta,
-                error=ErrorInfo(code="in_progress", message="Operation in progress", retryable=True),
-            )
+            return _in_progress(op, key)
 
         try:
             res = await nxt()
-            await store.put(key, res, ttl_seconds=ttl_seconds)
+            # a stream can be consumed only once: streamed results are not replayed
+            if res.stream is None:
+                await store.put(key, res, ttl_seconds=ttl_seconds)
             return res
         finally:
             await store.unlock(key)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Generic, Optional, Protocol, Tuple, TypeVar
+from typing import Dict, Generic, List, Optional, Protocol, Tuple, TypeVar
 
 from ..contracts.results import ServiceResult
 
@@ -33,37 +35,101 @@ class IdempotencyStore(Protocol, Generic[T]):
         ...
 
 
+@dataclass(frozen=True)
+class IdempotencyStoreStats:
+    size: int
+    locks: int
+    expired: int
+    evicted: int
+
+
+# heap entries allowed on top of 2x live ones before compaction
+_HEAP_SLACK = 64
+
+
+class _Shard(Generic[T]):
+    __slots__ = ("data", "locks", "heap")
+
+    def __init__(self) -> None:
+        # key -> (expires_at_ms, result), ordered by recent use (LRU first)
+        self.data: "OrderedDict[str, Tuple[int, ServiceResult[T]]]" = OrderedDict()
+        # key -> lock_expires_at_ms
+        self.locks: Dict[str, int] = {}
+        # (expires_at_ms, is_lock, key); stale entries are skipped on sweep
+        self.heap: List[Tuple[int, bool, str]] = []
+
+    def push(self, expires_at: int, is_lock: bool, key: str) -> None:
+        """
+        Entries of evicted/re-put results and released locks stay in the heap
+        until they expire; once stale entries outnumber live ones the heap is
+        rebuilt from live entries, so it stays within ~2x of the live size.
+        """
+        heapq.heappush(self.heap, (expires_at, is_lock, key))
+        live = len(self.data) + len(self.locks)
+        if len(self.heap) > 2 * live + _HEAP_SLACK:
+            self.heap = [(exp, False, k) for k, (exp, _) in self.data.items()]
+            self.heap.extend((exp, True, k) for k, exp in self.locks.items())
+            heapq.heapify(self.heap)
+
+
 @dataclass
 class InMemoryIdempotencyStore(Generic[T]):
     """
     Dev/test store. For prod we'll implement Redis/PostgreSQL-backed store.
+
+    - keys are spread over shards (no global lock: every operation completes
+      without awaiting, so the event loop already makes it atomic)
+    - expired results/locks are dropped by a heap-based sweeper task,
+      not only lazily on get
+    - hard cap on stored results, least recently used evicted first
     """
 
-    def __init__(self) -> None:
-        # key -> (expires_at_ms, result)
-        self._data: Dict[str, Tuple[int, ServiceResult[T]]] = {}
-        # key -> lock_expires_at_ms
-        self._locks: Dict[str, int] = {}
-        self._mx = asyncio.Lock()
+    def __init__(
+        self,
+        *,
+        shards: int = 16,
+        max_entries: int = 100_000,
+        sweep_interval_seconds: float = 1.0,
+    ) -> None:
+        self._shards: List[_Shard[T]] = [_Shard() for _ in range(max(1, shards))]
+        self._max_per_shard = max(1, max_entries // len(self._shards))
+        self._sweep_interval = sweep_interval_seconds
+        self._sweeper: Optional[asyncio.Task[None]] = None
+
+        self._expired = 0
+        self._evicted = 0
 
     def _now_ms(self) -> int:
         return int(time.time() * 1000)
 
+    def _shard(self, key: str) -> _Shard[T]:
+        return self._shards[hash(key) % len(self._shards)]
+
     async def get(self, key: str) -> Optional[ServiceResult[T]]:
-        async with self._mx:
-            item = self._data.get(key)
-            if not item:
-                return None
-            expires_at, res = item
-            if self._now_ms() >= expires_at:
-                self._data.pop(key, None)
-                return None
-            return res
+        shard = self._shard(key)
+        item = shard.data.get(key)
+        if not item:
+            return None
+        expires_at, res = item
+        if self._now_ms() >= expires_at:
+            shard.data.pop(key, None)
+            self._expired += 1
+            return None
+        shard.data.move_to_end(key)
+        return res
 
     async def put(self, key: str, result: ServiceResult[T], *, ttl_seconds: int) -> None:
-        async with self._mx:
-            expires_at = self._now_ms() + ttl_seconds * 1000
-            self._data[key] = (expires_at, result)
+        self._ensure_sweeper()
+
+        shard = self._shard(key)
+        expires_at = self._now_ms() + ttl_seconds * 1000
+        shard.data[key] = (expires_at, result)
+        shard.data.move_to_end(key)
+        shard.push(expires_at, False, key)
+
+        while len(shard.data) > self._max_per_shard:
+            shard.data.popitem(last=False)
+            self._evicted += 1
 
     async def lock(self, key: str, *, ttl_seconds: int) -> bool:
         """
@@ -71,14 +137,75 @@ class InMemoryIdempotencyStore(Generic[T]):
         - returns True if lock acquired
         - returns False if someone already holds a non-expired lock
         """
-        async with self._mx:
-            now = self._now_ms()
-            exp = self._locks.get(key)
-            if exp is not None and now < exp:
-                return False
-            self._locks[key] = now + ttl_seconds * 1000
-            return True
+        self._ensure_sweeper()
+
+        shard = self._shard(key)
+        now = self._now_ms()
+        exp = shard.locks.get(key)
+        if exp is not None and now < exp:
+            return False
+        expires_at = now + ttl_seconds * 1000
+        shard.locks[key] = expires_at
+        shard.push(expires_at, True, key)
+        return True
 
     async def unlock(self, key: str) -> None:
-        async with self._mx:
-            self._locks.pop(key, None)
+        self._shard(key).locks.pop(key, None)
+
+    def sweep_expired(self) -> int:
+        """
+        Drop expired results and locks. Returns number of removed entries.
+        """
+        now = self._now_ms()
+        removed = 0
+        for shard in self._shards:
+            heap = shard.heap
+            while heap and heap[0][0] <= now:
+                expires_at, is_lock, key = heapq.heappop(heap)
+                if is_lock:
+                    if shard.locks.get(key) == expires_at:
+                        del shard.locks[key]
+                        removed += 1
+                    continue
+                item = shard.data.get(key)
+                # skip stale heap entries (key re-put or evicted meanwhile)
+                if item is not None and item[0] == expires_at:
+                    del shard.data[key]
+                    self._expired += 1
+                    removed += 1
+        return removed
+
+    async def close(self) -> None:
+        """
+        Stop the background sweeper (call on worker shutdown).
+        """
+        task, self._sweeper = self._sweeper, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> IdempotencyStoreStats:
+        return IdempotencyStoreStats(
+            size=sum(len(s.data) for s in self._shards),
+            locks=sum(len(s.locks) for s in self._shards),
+            expired=self._expired,
+            evicted=self._evicted,
+        )
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweeper is not None or self._sweep_interval <= 0:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._sweeper = loop.create_task(self._sweep_loop())
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._sweep_interval)
+            self.sweep_expired()
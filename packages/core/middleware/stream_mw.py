@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import AsyncIterator, Callable, Optional, TypeVar
+
+from ..contracts.results import ServiceResult
+from .types import Next, ServiceOp
+
+T = TypeVar("T")
+
+# chunk -> chunk to pass on (return the same object to only observe)
+ChunkFn = Callable[[ServiceOp[T], T], T]
+# called once when the stream ends: (op, chunks seen, error or None)
+EndFn = Callable[[ServiceOp[T], int, Optional[BaseException]], None]
+
+
+def observe_stream(
+    op: ServiceOp[T],
+    res: ServiceResult[T],
+    *,
+    on_chunk: ChunkFn[T] | None = None,
+    on_end: EndFn[T] | None = None,
+) -> ServiceResult[T]:
+    """
+    Same result with its stream wrapped; results without a stream are returned as is.
+
+    on_end runs exactly once: on exhaustion, on an error of the stream, or when
+    the consumer closes it early (error is then GeneratorExit/CancelledError).
+    """
+    if res.stream is None:
+        return res
+    return replace(res, stream=_observed(op, res.stream, on_chunk, on_end))
+
+
+async def _observed(
+    op: ServiceOp[T],
+    stream: AsyncIterator[T],
+    on_chunk: ChunkFn[T] | None,
+    on_end: EndFn[T] | None,
+) -> AsyncIterator[T]:
+    count = 0
+    error: Optional[BaseException] = None
+    try:
+        async for chunk in stream:
+            count += 1
+            yield on_chunk(op, chunk) if on_chunk is not None else chunk
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if error is not None and aclose is not None:
+            await aclose()
+        if on_end is not None:
+            on_end(op, count, error)
+
+
+def make_stream_middleware(on_chunk: ChunkFn[T] | None = None, *, on_end: EndFn[T] | None = None):
+    """
+    Middleware that observes/transforms chunks of streamed results
+    (non-streamed results pass through untouched).
+    """
+
+    async def mw(op: ServiceOp[T], nxt: Next[T]) -> ServiceResult[T]:
+        return observe_stream(op, await nxt(), on_chunk=on_chunk, on_end=on_end)
+
+    return mw
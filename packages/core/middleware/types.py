@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Generic, Protocol, TypeVar
+from typing import Awaitable, Callable, Generic, Optional, Protocol, TypeVar
 
 from ..contracts.results import ServiceResult
 from ..contracts.services import ServiceCall
@@ -18,6 +18,13 @@ class ServiceOp(Generic[T]):
     op_name: str
     call: ServiceCall
 
+    # >1 for batch calls (ServiceExecutor.call_many): result data is a list of per-item results
+    batch_size: int = 1
+
+    # provider serving this attempt: picked by the executor (invoke mode) or
+    # named by the caller (fn mode); None if unknown
+    provider_name: Optional[str] = None
+
 
 Next = Callable[[], Awaitable[ServiceResult[T]]]
 
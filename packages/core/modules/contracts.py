@@ -24,6 +24,9 @@ class ModuleHandle:
     # bindings keys applied by module (service_key list)
     service_keys: list[str] = field(default_factory=list)
 
+    # config_hash() of the cfg the module currently runs with (set by ModuleManager)
+    cfg_hash: str = ""
+
 
 class CoreModule(Protocol):
     module_key: str
@@ -33,3 +36,17 @@ class CoreModule(Protocol):
 
     def detach(self, app: CoreApp, handle: ModuleHandle) -> None:
         ...
+
+
+class ReconfigurableModule(CoreModule, Protocol):
+    """
+    Optional extension: apply a changed config in place (e.g. swap templates)
+    instead of detach + attach.
+    """
+
+    def reconfigure(self, app: CoreApp, handle: ModuleHandle, cfg: Mapping[str, Any]) -> bool:
+        """
+        Returns False if the change cannot be applied in place
+        (ModuleManager then falls back to detach + attach).
+        """
+        ...
@@ -1,31 +1,48 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Literal, Mapping, Set
 
 from ..bootstrap import CoreApp
+from ..config.hashing import config_hash
 from .contracts import CoreModule, ModuleHandle
 
+RefreshAction = Literal["attached", "detached", "reconfigured", "reattached"]
+
 
 @dataclass
 class ModuleManager:
     """
     Attaches/detaches modules per tenant and tracks handles.
+
+    Providers listed in handle.provider_names are reference-counted over all
+    handles: when the last handle naming a provider is detached and no tenant
+    binding names it, the provider is unregistered (shared providers stay
+    while any tenant uses them). Providers still bound at that moment are
+    released later by release_unused(), once their bindings are gone.
     """
     app: CoreApp
     modules: Dict[str, CoreModule] = field(default_factory=dict)
 
     # tenant_id -> module_key -> handle
     _handles: Dict[str, Dict[str, ModuleHandle]] = field(default_factory=dict)
+    # provider_name -> number of attached handles naming it
+    _provider_refs: Dict[str, int] = field(default_factory=dict)
+    # module providers with no handle left that were still bound when detached
+    _unowned: Set[str] = field(default_factory=set)
 
     def register(self, module: CoreModule) -> None:
         self.modules[module.module_key] = module
 
-    def attach(self, *, tenant_id: str, module_key: str, cfg: Mapping[str, Any]) -> None:
+    def attach(self, *, tenant_id: str, module_key: str, cfg: Mapping[str, Any], cfg_hash: str = "") -> None:
         mod = self.modules[module_key]
         handle = mod.attach(self.app, tenant_id=tenant_id, cfg=cfg)
+        handle.cfg_hash = cfg_hash or config_hash(cfg)
 
         self._handles.setdefault(tenant_id, {})[module_key] = handle
+        for name in set(handle.provider_names):
+            self._provider_refs[name] = self._provider_refs.get(name, 0) + 1
+            self._unowned.discard(name)
 
     def detach(self, *, tenant_id: str, module_key: str) -> None:
         handle = self._handles.get(tenant_id, {}).get(module_key)
@@ -39,28 +56,69 @@ class ModuleManager:
         if not self._handles[tenant_id]:
             self._handles.pop(tenant_id, None)
 
-    def refresh(self, *, tenant_id: str, desired: Mapping[str, Mapping[str, Any]]) -> None:
+        for name in set(handle.provider_names):
+            refs = self._provider_refs.get(name, 0) - 1
+            if refs > 0:
+                self._provider_refs[name] = refs
+            else:
+                self._provider_refs.pop(name, None)
+                self._unowned.add(name)
+        self.release_unused()
+
+    def release_unused(self) -> int:
+        """
+        Unregister module providers that no handle and no binding use anymore.
+        Returns the number of providers dropped.
+        """
+        registry = self.app.services
+        released = [name for name in self._unowned if not registry.is_bound(name)]
+        for name in released:
+            self._unowned.discard(name)
+            registry.unregister_provider(name)
+        return len(released)
+
+    def refresh(self, *, tenant_id: str, desired: Mapping[str, Mapping[str, Any]]) -> Dict[str, RefreshAction]:
         """
         desired: module_key -> cfg
         - detach missing
         - attach new
-        - reattach changed (simple strategy)
+        - changed cfg (by config_hash): module.reconfigure() in place if the
+          module supports it, otherwise detach + attach
+        - unchanged modules are not touched
+
+        Returns module_key -> action for touched modules only.
         """
         current = self._handles.get(tenant_id, {})
+        actions: Dict[str, RefreshAction] = {}
 
         # detach modules not desired anymore
         for mk in list(current.keys()):
             if mk not in desired:
                 self.detach(tenant_id=tenant_id, module_key=mk)
+                actions[mk] = "detached"
 
-        # attach / reattach
+        # attach / reconfigure / reattach
         for mk, cfg in desired.items():
             if mk not in self.modules:
                 continue
 
-            if mk not in current:
-                self.attach(tenant_id=tenant_id, module_key=mk, cfg=cfg)
+            new_hash = config_hash(cfg)
+            handle = current.get(mk)
+            if handle is None:
+                self.attach(tenant_id=tenant_id, module_key=mk, cfg=cfg, cfg_hash=new_hash)
+                actions[mk] = "attached"
+                continue
+
+            if handle.cfg_hash == new_hash:
+                continue
+
+            reconfigure = getattr(self.modules[mk], "reconfigure", None)
+            if reconfigure is not None and reconfigure(self.app, handle, cfg):
+                handle.cfg_hash = new_hash
+                actions[mk] = "reconfigured"
             else:
-                # naive: always reattach when refresh called (later: compare cfg hash)
                 self.detach(tenant_id=tenant_id, module_key=mk)
-                self.attach(tenant_id=tenant_id, module_key=mk, cfg=cfg)
+                self.attach(tenant_id=tenant_id, module_key=mk, cfg=cfg, cfg_hash=new_hash)
+                actions[mk] = "reattached"
+
+        return actions
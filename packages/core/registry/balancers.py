@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Protocol, Sequence
+
+
+@dataclass(frozen=True)
+class ProviderChoice:
+    """
+    One provider of a multi-provider binding.
+    """
+    name: str
+    weight: int = 1
+    # lower is preferred; higher tiers are used only when lower ones are unavailable
+    priority: int = 0
+
+
+class ProviderStats:
+    """
+    Live per-provider counters shared by all bindings (providers are shared
+    between tenants, so load is tracked per provider name).
+    """
+
+    def __init__(self, *, ewma_alpha: float = 0.3) -> None:
+        self._alpha = ewma_alpha
+        self.outstanding: Dict[str, int] = {}
+        self.ewma_ms: Dict[str, float] = {}
+
+    def started(self, name: str) -> None:
+        self.outstanding[name] = self.outstanding.get(name, 0) + 1
+
+    def finished(self, name: str, latency_ms: float) -> None:
+        self.outstanding[name] = max(0, self.outstanding.get(name, 0) - 1)
+        prev = self.ewma_ms.get(name)
+        self.ewma_ms[name] = latency_ms if prev is None else prev + self._alpha * (latency_ms - prev)
+
+
+class Balancer(Protocol):
+    def pick(self, choices: Sequence[ProviderChoice], stats: ProviderStats) -> ProviderChoice:
+        """
+        choices: non-empty, same priority tier.
+        """
+        ...
+
+
+class WeightedRoundRobin:
+    """
+    Smooth weighted round-robin (same sequence as nginx upstreams).
+    """
+
+    def __init__(self) -> None:
+        self._current: Dict[str, int] = {}
+
+    def pick(self, choices: Sequence[ProviderChoice], stats: ProviderStats) -> ProviderChoice:
+        total = 0
+        best: ProviderChoice | None = None
+        best_value = 0
+        for c in choices:
+            weight = max(1, c.weight)
+            value = self._current.get(c.name, 0) + weight
+            self._current[c.name] = value
+            total += weight
+            if best is None or value > best_value:
+                best, best_value = c, value
+
+        assert best is not None
+        self._current[best.name] = best_value - total
+        return best
+
+
+class LeastOutstanding:
+    """
+    Fewest in-flight calls relative to weight.
+    """
+
+    def pick(self, choices: Sequence[ProviderChoice], stats: ProviderStats) -> ProviderChoice:
+        return min(choices, key=lambda c: stats.outstanding.get(c.name, 0) / max(1, c.weight))
+
+
+class EwmaLatency:
+    """
+    Lowest EWMA latency scaled by in-flight calls (unmeasured providers first).
+    """
+
+    def pick(self, choices: Sequence[ProviderChoice], stats: ProviderStats) -> ProviderChoice:
+        def cost(c: ProviderChoice) -> float:
+            ewma = stats.ewma_ms.get(c.name, 0.0)
+            return ewma * (stats.outstanding.get(c.name, 0) + 1) / max(1, c.weight)
+
+        return min(choices, key=cost)
+
+
+BALANCERS: Dict[str, Callable[[], Balancer]] = {
+    "weighted_round_robin": WeightedRoundRobin,
+    "least_outstanding": LeastOutstanding,
+    "ewma_latency": EwmaLatency,
+}
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from typing import AbstractSet, Any, Generic, Optional, Sequence, Tuple, Type, TypeVar, cast
+
+from ..middleware.admission_mw import AdmissionLimits, make_limit_middleware
+from ..middleware.chain import Middleware, MiddlewareChain
+from .services import (
+    RegistrySnapshot,
+    ServiceBinding,
+    ServiceNotConfigured,
+    ServiceNotRegistered,
+    ServiceRegistry,
+    service_key,
+)
+
+P = TypeVar("P")
+
+
+class ResolvedService(Generic[P]):
+    """
+    Handle bound to one (tenant, service_key) pair.
+    Handlers keep it instead of calling resolve_typed() per request.
+
+    - steady state: one identity check of the registry snapshot
+    - re-resolved only when the tenant binding or the bound provider changed
+      (other tenants' updates only move the snapshot reference)
+    - multi-provider bindings are still balanced per call (registry.pick)
+    - middleware/limits apply only to calls made through this handle
+      (ServiceExecutor.call(handle=...)), inside the executor's chain
+    """
+
+    __slots__ = (
+        "_registry",
+        "tenant_id",
+        "service_key",
+        "chain",
+        "rebinds",
+        "_snapshot",
+        "_binding",
+        "_provider_name",
+        "_provider",
+    )
+
+    def __init__(
+        self,
+        registry: ServiceRegistry,
+        tenant_id: str,
+        service_key: str,
+        *,
+        middleware: Sequence[Middleware[Any]] = (),
+        limits: AdmissionLimits | None = None,
+    ) -> None:
+        self._registry = registry
+        self.tenant_id = tenant_id
+        self.service_key = service_key
+
+        mws = list(middleware)
+        if limits is not None:
+            # limits first: rejected calls do not reach handle middleware
+            mws.insert(0, make_limit_middleware(limits))
+        self.chain: MiddlewareChain | None = MiddlewareChain(middlewares=mws).freeze() if mws else None
+
+        # times the provider/binding actually changed (0 after the first resolve)
+        self.rebinds = -1
+        self._snapshot: Optional[RegistrySnapshot] = None
+        self._binding: Optional[ServiceBinding] = None
+        self._provider_name: Optional[str] = None
+        self._provider: Any = None
+
+    @property
+    def version(self) -> int:
+        """
+        Registry version the handle was last validated against (-1: never).
+        """
+        return self._snapshot.version if self._snapshot is not None else -1
+
+    def __call__(self) -> P:
+        """
+        Current provider (raises ServiceNotConfigured/ServiceNotRegistered like resolve()).
+        """
+        snap = self._registry.snapshot()
+        if snap is not self._snapshot:
+            self._refresh(snap)
+        if self._provider_name is None:
+            # multi-provider binding: balancer decides per call
+            return cast(P, self._registry.resolve(self.tenant_id, self.service_key))
+        return cast(P, self._provider)
+
+    def pick(self, *, exclude: AbstractSet[str] = frozenset()) -> Optional[Tuple[str, Any]]:
+        """
+        Same contract as ServiceRegistry.pick for the bound pair.
+        """
+        snap = self._registry.snapshot()
+        if snap is not self._snapshot:
+            self._refresh(snap)
+        if self._provider_name is None:
+            return self._registry.pick(self.tenant_id, self.service_key, exclude=exclude)
+        if self._provider_name in exclude:
+            return None
+        return self._provider_name, self._provider
+
+    def _refresh(self, snap: RegistrySnapshot) -> None:
+        tenant_map = snap.bindings.get(self.tenant_id)
+        binding = tenant_map.get(self.service_key) if tenant_map is not None else None
+        if binding is None:
+            raise ServiceNotConfigured(
+                f"Service '{self.service_key}' not configured for tenant '{self.tenant_id}'"
+            )
+
+        name: Optional[str] = None
+        provider: Any = None
+        if not binding.providers:
+            name = binding.provider
+            provider = snap.providers.get(name)
+            if provider is None:
+                raise ServiceNotRegistered(f"Provider '{name}' not registered")
+
+        if binding != self._binding or provider is not self._provider:
+            self.rebinds += 1
+        self._binding = binding
+        self._provider_name = name
+        self._provider = provider
+        # set last: a failed refresh is retried on the next call
+        self._snapshot = snap
+
+
+def bind_typed(
+    registry: ServiceRegistry,
+    tenant_id: str,
+    proto: Type[P],
+    *,
+    middleware: Sequence[Middleware[Any]] = (),
+    limits: AdmissionLimits | None = None,
+) -> ResolvedService[P]:
+    """
+    Typed handle, counterpart of resolve_typed().
+    """
+    return ResolvedService(registry, tenant_id, service_key(proto), middleware=middleware, limits=limits)
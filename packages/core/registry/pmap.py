@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_BITS = 6
+_FAN = 1 << _BITS
+_MASK = _FAN - 1
+
+# shared by every empty slot; never mutated (writes copy a leaf first)
+_EMPTY_LEAF: Dict[Any, Any] = {}
+_EMPTY_MID: Tuple[Dict[Any, Any], ...] = (_EMPTY_LEAF,) * _FAN
+_EMPTY_ROOT: Tuple[Tuple[Dict[Any, Any], ...], ...] = (_EMPTY_MID,) * _FAN
+
+
+class PMap(Mapping[K, V]):
+    """
+    Persistent (immutable) hash map for copy-on-write snapshots.
+
+    Two levels of 64-way fan-out over hash(key) with small dict leaves.
+    evolve()/set()/remove() return a new map sharing every untouched leaf:
+    a single-key write copies one leaf (~n/4096 entries) and two 64-slot
+    tuples instead of the whole map.
+    """
+
+    __slots__ = ("_root", "_len")
+
+    def __init__(self, items: Optional[Mapping[K, V]] = None) -> None:
+        self._root = _EMPTY_ROOT
+        self._len = 0
+        if items:
+            other = self.evolve(sets=items.items())
+            self._root, self._len = other._root, other._len
+
+    @classmethod
+    def _make(cls, root: Tuple[Tuple[Dict[K, V], ...], ...], length: int) -> "PMap[K, V]":
+        m = cls.__new__(cls)
+        m._root = root
+        m._len = length
+        return m
+
+    def __getitem__(self, key: K) -> V:
+        h = hash(key)
+        return self._root[h & _MASK][(h >> _BITS) & _MASK][key]
+
+    def get(self, key: K, default: Any = None) -> Any:
+        h = hash(key)
+        return self._root[h & _MASK][(h >> _BITS) & _MASK].get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        h = hash(key)
+        return key in self._root[h & _MASK][(h >> _BITS) & _MASK]
+
+    def __iter__(self) -> Iterator[K]:
+        for mid in self._root:
+            if mid is _EMPTY_MID:
+                continue
+            for leaf in mid:
+                yield from leaf
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"PMap({dict(self.items())!r})"
+
+    def set(self, key: K, value: V) -> "PMap[K, V]":
+        return self.evolve(sets=((key, value),))
+
+    def remove(self, key: K) -> "PMap[K, V]":
+        return self.evolve(removes=(key,))
+
+    def evolve(
+        self,
+        *,
+        sets: Iterable[Tuple[K, V]] = (),
+        removes: Iterable[K] = (),
+    ) -> "PMap[K, V]":
+        """
+        New map with `sets` applied, then `removes`; each touched leaf is copied once.
+        """
+        root = self._root
+        leaves: Dict[Tuple[int, int], Dict[K, V]] = {}
+        length = self._len
+
+        for key, value in sets:
+            h = hash(key)
+            slot = (h & _MASK, (h >> _BITS) & _MASK)
+            leaf = leaves.get(slot)
+            if leaf is None:
+                leaf = leaves[slot] = dict(root[slot[0]][slot[1]])
+            if key not in leaf:
+                length += 1
+            leaf[key] = value
+
+        for key in removes:
+            h = hash(key)
+            slot = (h & _MASK, (h >> _BITS) & _MASK)
+            leaf = leaves.get(slot)
+            if leaf is None:
+                if key not in root[slot[0]][slot[1]]:
+                    continue
+                leaf = leaves[slot] = dict(root[slot[0]][slot[1]])
+            if key in leaf:
+                del leaf[key]
+                length -= 1
+
+        if not leaves:
+            return self
+
+        new_root: List[Tuple[Dict[K, V], ...]] = list(root)
+        mids: Dict[int, List[Dict[K, V]]] = {}
+        for (i, j), leaf in leaves.items():
+            mid = mids.get(i)
+            if mid is None:
+                mid = mids[i] = list(root[i])
+            mid[j] = leaf if leaf else _EMPTY_LEAF
+        for i, mid in mids.items():
+            new_root[i] = tuple(mid)
+        return PMap._make(tuple(new_root), length)
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional, Protocol, Type, TypeVar, cast
+from types import MappingProxyType
+from typing import AbstractSet, Any, Dict, Iterator, Mapping, Optional, Protocol, Tuple, Type, TypeVar, cast
+
+from .balancers import BALANCERS, Balancer, ProviderChoice, ProviderStats
+from .pmap import PMap
 
 T = TypeVar("T")
 
@@ -19,50 +24,272 @@ class ServiceBinding:
     """
     Binding: service interface -> provider instance name for a tenant.
     Example: TextComposer -> "jinja2_v1"
+
+    Multi-provider: providers=(ProviderChoice("nlu_a", weight=3), ProviderChoice("nlu_b")),
+    picked by `balancer` ("weighted_round_robin" | "least_outstanding" | "ewma_latency").
     """
-    provider: str
+    provider: str = ""
+    providers: Tuple[ProviderChoice, ...] = ()
+    balancer: str = "weighted_round_robin"
+
+    def choices(self) -> Tuple[ProviderChoice, ...]:
+        return self.providers or (ProviderChoice(name=self.provider),)
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """
+    Immutable registry state. Readers keep a reference, writers swap in a new one.
+    """
+    version: int
+    # provider_name -> provider instance
+    providers: PMap[str, Any]
+    # tenant_id -> { service_key -> binding }
+    bindings: PMap[str, Mapping[str, ServiceBinding]]
+
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass
+class _Transaction:
+    # working state: published as one snapshot when the transaction ends
+    providers: PMap[str, Any]
+    bindings: PMap[str, Mapping[str, ServiceBinding]]
+    dirty: bool = False
 
 
 class ServiceRegistry:
     """
     In-memory registry.
     Core does not assume where config is stored.
+
+    Copy-on-write: resolve reads the current snapshot with a single attribute
+    read and never sees a half-applied update; every write builds a new
+    snapshot with version + 1 (callers may cache resolved providers by version).
+    Snapshot maps are persistent (PMap): a write copies only the touched
+    leaves, so its cost does not grow with the number of tenants/providers.
     """
 
     def __init__(self) -> None:
-        # key: provider_name -> provider instance (object with async methods)
-        self._providers: Dict[str, Any] = {}
+        self._snapshot = RegistrySnapshot(version=0, providers=PMap(), bindings=PMap())
+        self._txn: Optional[_Transaction] = None
+        # provider_name -> number of tenant bindings naming it (working state)
+        self._bound_refs: Dict[str, int] = {}
 
-        # key: tenant_id -> { service_key -> binding }
-        self._bindings: Dict[str, Dict[str, ServiceBinding]] = {}
+        # balancer state per multi-provider binding, tenant_id -> service_key -> balancer
+        self._balancers: Dict[str, Dict[str, Balancer]] = {}
+        self.stats = ProviderStats()
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def snapshot(self) -> RegistrySnapshot:
+        """
+        Published state (inside a transaction: without its pending writes).
+        """
+        return self._snapshot
+
+    @contextmanager
+    def transaction(self) -> Iterator["ServiceRegistry"]:
+        """
+        Group writes into a single snapshot swap (one version bump):
+
+            with registry.transaction():
+                registry.apply_many(...)
+                registry.register_provider(...)   # e.g. from module attach
+
+        Readers (snapshot/pick/resolve) keep seeing the published state until
+        the outermost transaction ends; writers look up providers registered in
+        the transaction with get_provider(). Nested transactions join the outer
+        one. Writes made before an exception are published too (side effects
+        like attached modules already happened). Meant for synchronous blocks:
+        writes of other tasks made while it is open are published with it.
+        """
+        if self._txn is not None:
+            yield self
+            return
+
+        snap = self._snapshot
+        txn = self._txn = _Transaction(providers=snap.providers, bindings=snap.bindings)
+        try:
+            yield self
+        finally:
+            self._txn = None
+            if txn.dirty:
+                self._swap(self._snapshot, providers=txn.providers, bindings=txn.bindings)
+
+    def get_provider(self, name: str) -> Optional[Any]:
+        """
+        Provider by name, including ones registered in the open transaction.
+        """
+        txn = self._txn
+        providers = txn.providers if txn is not None else self._snapshot.providers
+        return providers.get(name)
 
     def register_provider(self, name: str, provider: Any) -> None:
         """
         Register a provider instance by name.
         Providers live in external modules, core only stores references.
         """
-        self._providers[name] = provider
+        providers, _ = self._working()
+        self._write(providers=providers.set(name, provider))
+
+    def unregister_provider(self, name: str) -> bool:
+        """
+        Drop a provider instance (e.g. when the last module using it is detached
+        and no binding names it).
+        Bindings that still name it fail with ServiceNotRegistered. Returns False
+        if it was not registered.
+        """
+        providers, _ = self._working()
+        if name not in providers:
+            return False
+        self._write(providers=providers.remove(name))
+        return True
 
     def set_tenant_bindings(self, tenant_id: str, bindings: Mapping[str, ServiceBinding]) -> None:
         """
         Apply runtime bindings for a tenant (can be refreshed without restart).
         """
-        self._bindings[tenant_id] = dict(bindings)
+        self.apply_many({tenant_id: bindings})
 
-    def resolve(self, tenant_id: str, service_key: str) -> Any:
+    def apply_many(self, bindings: Mapping[str, Optional[Mapping[str, ServiceBinding]]]) -> int:
         """
-        Resolve provider for a given tenant and service key.
+        Apply bindings of many tenants in one snapshot swap
+        (tenant_id -> bindings, None removes the tenant). Returns new version
+        (inside a transaction: the version it will publish).
+        """
+        _, current = self._working()
+        sets = []
+        removes = []
+        for tenant_id, tenant_bindings in bindings.items():
+            self._count_bound(current.get(tenant_id), -1)
+            if tenant_bindings is None:
+                removes.append(tenant_id)
+            else:
+                frozen = MappingProxyType(dict(tenant_bindings))
+                self._count_bound(frozen, +1)
+                sets.append((tenant_id, frozen))
+            self._balancers.pop(tenant_id, None)
+        return self._write(bindings=current.evolve(sets=sets, removes=removes))
+
+    def is_bound(self, provider_name: str) -> bool:
+        """
+        True if any tenant binding names the provider (including the open transaction).
+        """
+        return self._bound_refs.get(provider_name, 0) > 0
+
+    def _count_bound(self, tenant_bindings: Optional[Mapping[str, ServiceBinding]], delta: int) -> None:
+        if not tenant_bindings:
+            return
+        refs = self._bound_refs
+        for binding in tenant_bindings.values():
+            for choice in binding.choices():
+                n = refs.get(choice.name, 0) + delta
+                if n > 0:
+                    refs[choice.name] = n
+                else:
+                    refs.pop(choice.name, None)
+
+    def _working(self) -> Tuple[PMap[str, Any], PMap[str, Mapping[str, ServiceBinding]]]:
+        txn = self._txn
+        if txn is not None:
+            return txn.providers, txn.bindings
+        return self._snapshot.providers, self._snapshot.bindings
+
+    def _write(
+        self,
+        *,
+        providers: Optional[PMap[str, Any]] = None,
+        bindings: Optional[PMap[str, Mapping[str, ServiceBinding]]] = None,
+    ) -> int:
+        txn = self._txn
+        if txn is None:
+            return self._swap(self._snapshot, providers=providers, bindings=bindings)
+        if providers is not None:
+            txn.providers = providers
+        if bindings is not None:
+            txn.bindings = bindings
+        txn.dirty = True
+        return self._snapshot.version + 1
+
+    def _swap(
+        self,
+        snap: RegistrySnapshot,
+        *,
+        providers: Optional[PMap[str, Any]] = None,
+        bindings: Optional[PMap[str, Mapping[str, ServiceBinding]]] = None,
+    ) -> int:
+        self._snapshot = RegistrySnapshot(
+            version=snap.version + 1,
+            providers=providers if providers is not None else snap.providers,
+            bindings=bindings if bindings is not None else snap.bindings,
+        )
+        return self._snapshot.version
+
+    def bound_provider_name(self, tenant_id: str, service_key: str) -> Optional[str]:
+        """
+        Provider name bound for tenant/service (None if not configured).
+        For multi-provider bindings: the first preferred provider.
+        """
+        binding = self._snapshot.bindings.get(tenant_id, _EMPTY).get(service_key)
+        if binding is None:
+            return None
+        if not binding.providers:
+            return binding.provider
+        return min(binding.providers, key=lambda c: c.priority).name
+
+    def pick(
+        self,
+        tenant_id: str,
+        service_key: str,
+        *,
+        exclude: AbstractSet[str] = frozenset(),
+    ) -> Optional[Tuple[str, Any]]:
         """
-        tenant_map = self._bindings.get(tenant_id)
-        if not tenant_map or service_key not in tenant_map:
+        Pick (provider_name, provider) for a call, skipping `exclude`d and
+        unregistered providers. None if nothing is left to pick.
+        """
+        snap = self._snapshot
+        binding = snap.bindings.get(tenant_id, _EMPTY).get(service_key)
+        if binding is None:
             raise ServiceNotConfigured(f"Service '{service_key}' not configured for tenant '{tenant_id}'")
 
-        binding = tenant_map[service_key]
-        provider = self._providers.get(binding.provider)
-        if provider is None:
-            raise ServiceNotRegistered(f"Provider '{binding.provider}' not registered")
+        if not binding.providers:
+            if binding.provider in exclude:
+                return None
+            provider = snap.providers.get(binding.provider)
+            if provider is None:
+                raise ServiceNotRegistered(f"Provider '{binding.provider}' not registered")
+            return binding.provider, provider
+
+        available = [c for c in binding.providers if c.name not in exclude and c.name in snap.providers]
+        if not available:
+            return None
+
+        tier = min(c.priority for c in available)
+        candidates = [c for c in available if c.priority == tier]
 
-        return provider
+        balancer = self._balancers.get(tenant_id, {}).get(service_key)
+        if balancer is None:
+            factory = BALANCERS.get(binding.balancer)
+            if factory is None:
+                raise ServiceNotConfigured(f"Unknown balancer '{binding.balancer}' for service '{service_key}'")
+            balancer = self._balancers.setdefault(tenant_id, {})[service_key] = factory()
+
+        chosen = candidates[0] if len(candidates) == 1 else balancer.pick(candidates, self.stats)
+        return chosen.name, snap.providers[chosen.name]
+
+    def resolve(self, tenant_id: str, service_key: str) -> Any:
+        """
+        Resolve provider for a given tenant and service key.
+        """
+        picked = self.pick(tenant_id, service_key)
+        if picked is None:
+            raise ServiceNotRegistered(f"No registered provider for service '{service_key}'")
+        return picked[1]
 
 
 # --- Helper to keep call sites typed (optional) ---
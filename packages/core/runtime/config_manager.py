@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import time
 import uuid
-from dataclasses import dataclass
-from typing import Any, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Set, Tuple
 
 from ..bootstrap import CoreApp
+from ..config.cached_store import CachedTenantConfigStore
+from ..config.hashing import config_hash
+from ..config.loader import TenantConfig, TenantConfigStore
 from ..contracts.events import EventEnvelope
+from ..middleware.admission_mw import AdmissionController, AdmissionLimits
 from ..registry.services import ServiceBinding
 from ..modules.manager import ModuleManager
 
@@ -19,10 +24,50 @@ def _new_id(prefix: str) -> str:
     return f"{prefix}_{uuid.uuid4().hex}"
 
 
+# bulk: one config.bulk_updated event for the whole batch
+# per_tenant: config.tenant_updated per changed tenant (optionally rate-limited)
+BulkEventMode = Literal["bulk", "per_tenant"]
+
+
+@dataclass(frozen=True)
+class BulkApplyResult:
+    # registry version after the single snapshot swap (bindings + module providers)
+    version: int
+    # tenants whose config differed from the applied one
+    changed: Tuple[str, ...]
+    unchanged: int
+
+
+def _tenant_state_hash(
+    services: Mapping[str, str],
+    modules: Mapping[str, Mapping[str, Any]],
+    limits: Mapping[str, Any] | None,
+) -> str:
+    return config_hash({"services": services, "modules": modules, "limits": limits})
+
+
 @dataclass
 class ConfigManager:
     app: CoreApp
     modules: ModuleManager
+    # optional: per-tenant concurrency limits come from tenant config
+    admission: AdmissionController | None = None
+    # optional: source for lazily loaded tenants (ensure_tenant); with
+    # CachedTenantConfigStore evicted tenants are unloaded automatically
+    store: TenantConfigStore | None = None
+
+    # config event publishes still running (kept referenced until done)
+    _pending: Set[asyncio.Task[Any]] = field(default_factory=set, init=False, repr=False)
+    # events of configs applied outside an event loop, published by the next flush
+    _queued: List[EventEnvelope] = field(default_factory=list, init=False, repr=False)
+    # tenant_id -> hash of the last applied (services, modules, limits)
+    _applied: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    # tenant_id -> config object last taken from store (identity check per request)
+    _loaded: Dict[str, TenantConfig] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if isinstance(self.store, CachedTenantConfigStore):
+            self.store.add_evict_listener(self.unload_tenant)
 
     def apply_tenant_config(
         self,
@@ -32,12 +77,14 @@ class ConfigManager:
         request_id: str,
         services: Mapping[str, str],
         modules: Mapping[str, Mapping[str, Any]],
+        limits: Mapping[str, Any] | None = None,
     ) -> None:
         """
         Apply runtime config without restart.
 
         services: service_key -> provider_name
         modules: module_key -> module_cfg_blob
+        limits: {"max_concurrent": int, "max_queue": int} or None for defaults
         """
         # 1) apply service bindings
         self.app.services.set_tenant_bindings(
@@ -45,11 +92,183 @@ class ConfigManager:
             {k: ServiceBinding(provider=v) for k, v in services.items()},
         )
 
-        # 2) refresh modules
+        # 2) refresh modules, 3) admission limits
+        self._apply_tenant_runtime(tenant_id, modules, limits)
+        self.modules.release_unused()
+        self._applied[tenant_id] = _tenant_state_hash(services, modules, limits)
+
+        # 4) emit config event
+        # sync method: publish in a tracked task, caller can await drain() if needed;
+        # without a running loop (startup code) the event waits for the next flush
+        self._queued.append(self._tenant_event(tenant_id, trace_id, request_id, services, modules, limits))
+        self._flush_queued()
+
+    async def ensure_tenant(self, tenant_id: str, *, trace_id: str, request_id: str) -> TenantConfig:
+        """
+        Lazy tenant loading: get config from store and apply it if it changed.
+        Call on request ingress; raises TenantNotFound for unknown tenants.
+        """
+        if self.store is None:
+            raise RuntimeError("ConfigManager has no tenant config store")
+
+        cfg = await self.store.get_tenant_config(tenant_id)
+        if self._loaded.get(tenant_id) is cfg:
+            return cfg
+
+        self._loaded[tenant_id] = cfg
+        services, modules = cfg.services or {}, cfg.modules or {}
+        if self._applied.get(tenant_id) != _tenant_state_hash(services, modules, cfg.limits):
+            self.apply_tenant_config(
+                tenant_id=tenant_id,
+                trace_id=trace_id,
+                request_id=request_id,
+                services=services,
+                modules=modules,
+                limits=cfg.limits,
+            )
+        return cfg
+
+    def is_applied(self, tenant_id: str) -> bool:
+        return tenant_id in self._applied
+
+    def unload_tenant(self, tenant_id: str) -> None:
+        """
+        Release what a tenant holds in core: bindings, modules, limits.
+        The next ensure_tenant() loads it again.
+        """
+        self._loaded.pop(tenant_id, None)
+        if self._applied.pop(tenant_id, None) is None:
+            return
+
+        # bindings first: module providers nobody binds anymore are dropped on detach
+        self.app.services.apply_many({tenant_id: None})
+        self.modules.refresh(tenant_id=tenant_id, desired={})
+        if self.admission is not None:
+            self.admission.set_tenant_limits(tenant_id, None)
+
+    def apply_many(
+        self,
+        configs: Iterable[TenantConfig],
+        *,
+        trace_id: str,
+        request_id: str,
+        events: BulkEventMode = "bulk",
+        max_events_per_second: Optional[float] = None,
+    ) -> "asyncio.Task[BulkApplyResult]":
+        """
+        Apply configs of many tenants at once.
+
+        - tenants whose (services, modules, limits) equal the applied ones are skipped
+        - service bindings of all changed tenants and providers registered by
+          their modules go in one registry snapshot swap (registry transaction)
+        - modules/limits are refreshed per changed tenant (module diff applies)
+        - events: one config.bulk_updated, or config.tenant_updated per changed
+          tenant paced to max_events_per_second (None: no pacing)
+
+        Returns a task that completes when all subscribers have been notified,
+        so it needs a running event loop (checked before anything is applied).
+        """
+        asyncio.get_running_loop()
+
+        changed: List[TenantConfig] = []
+        hashes: Dict[str, str] = {}
+        unchanged = 0
+        for cfg in configs:
+            h = _tenant_state_hash(cfg.services or {}, cfg.modules or {}, cfg.limits)
+            if self._applied.get(cfg.tenant_id) == h:
+                unchanged += 1
+                continue
+            changed.append(cfg)
+            hashes[cfg.tenant_id] = h
+
+        registry = self.app.services
+        with registry.transaction():
+            # 1) bindings of all changed tenants
+            registry.apply_many(
+                {
+                    cfg.tenant_id: {k: ServiceBinding(provider=v) for k, v in (cfg.services or {}).items()}
+                    for cfg in changed
+                }
+            )
+
+            # 2) + 3) modules and limits (module provider registrations join the swap)
+            for cfg in changed:
+                self._apply_tenant_runtime(cfg.tenant_id, cfg.modules or {}, cfg.limits)
+            self.modules.release_unused()
+        self._applied.update(hashes)
+
+        result = BulkApplyResult(
+            version=registry.version,
+            changed=tuple(cfg.tenant_id for cfg in changed),
+            unchanged=unchanged,
+        )
+        return self._track(self._publish_bulk(result, changed, trace_id, request_id, events, max_events_per_second))
+
+    def _apply_tenant_runtime(
+        self,
+        tenant_id: str,
+        modules: Mapping[str, Mapping[str, Any]],
+        limits: Mapping[str, Any] | None,
+    ) -> None:
         self.modules.refresh(tenant_id=tenant_id, desired=modules)
 
-        # 3) emit config event
-        evt = EventEnvelope(
+        if self.admission is not None:
+            self.admission.set_tenant_limits(
+                tenant_id,
+                AdmissionLimits.from_cfg(limits) if limits else None,
+            )
+
+    async def _publish_bulk(
+        self,
+        result: BulkApplyResult,
+        changed: List[TenantConfig],
+        trace_id: str,
+        request_id: str,
+        events: BulkEventMode,
+        max_events_per_second: Optional[float],
+    ) -> BulkApplyResult:
+        if events == "bulk":
+            await self.app.bus.publish(
+                EventEnvelope(
+                    name="config.bulk_updated",
+                    kind="system",
+                    tenant_id="*",
+                    event_id=_new_id("evt"),
+                    trace_id=trace_id,
+                    occurred_at_ms=_now_ms(),
+                    request_id=request_id,
+                    payload={
+                        "version": result.version,
+                        "tenants": list(result.changed),
+                        "unchanged": result.unchanged,
+                    },
+                )
+            )
+            return result
+
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        for i, cfg in enumerate(changed):
+            if max_events_per_second:
+                ahead = t0 + i / max_events_per_second - loop.time()
+                if ahead > 0:
+                    await asyncio.sleep(ahead)
+            evt = self._tenant_event(
+                cfg.tenant_id, trace_id, request_id, cfg.services or {}, cfg.modules or {}, cfg.limits
+            )
+            await self.app.bus.publish(evt)
+        return result
+
+    @staticmethod
+    def _tenant_event(
+        tenant_id: str,
+        trace_id: str,
+        request_id: str,
+        services: Mapping[str, str],
+        modules: Mapping[str, Mapping[str, Any]],
+        limits: Mapping[str, Any] | None,
+    ) -> EventEnvelope:
+        return EventEnvelope(
             name="config.tenant_updated",
             kind="system",
             tenant_id=tenant_id,
@@ -60,9 +279,34 @@ class ConfigManager:
             payload={
                 "services": dict(services),
                 "modules": {k: dict(v) for k, v in modules.items()},
+                "limits": dict(limits) if limits else None,
             },
         )
-        # fire and forget is ok here (sync method), caller can await publish if needed
-        # we keep it simple for now:
-        import asyncio
-        asyncio.get_event_loop().create_task(self.app.bus.publish(evt))
+
+    def _flush_queued(self) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._queued:
+            events, self._queued = self._queued, []
+            self._track(self._publish_all(events))
+
+    async def _publish_all(self, events: List[EventEnvelope]) -> None:
+        for evt in events:
+            await self.app.bus.publish(evt)
+
+    def _track(self, coro: Any) -> "asyncio.Task[Any]":
+        task = asyncio.get_running_loop().create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
+    async def drain(self) -> None:
+        """
+        Wait until all config events published so far are handed to the bus
+        (including events of configs applied before the loop was running).
+        """
+        self._flush_queued()
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
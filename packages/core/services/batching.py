@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Literal, Optional, Set, Tuple, TypeVar
+
+from ..contracts.results import ErrorInfo, ResultMeta, ServiceResult
+from ..contracts.services import ServiceCall
+from ..registry.services import ServiceNotConfigured, ServiceNotRegistered
+
+if TYPE_CHECKING:
+    from .executor import ServiceExecutor
+
+I = TypeVar("I")
+T = TypeVar("T")
+
+FlushReason = Literal["size", "time", "drain"]
+
+
+@dataclass(frozen=True)
+class BatchWindow:
+    # a batch is dispatched when it has max_items items...
+    max_items: int = 32
+    # ...or max_delay_ms after its first item arrived, whichever comes first
+    max_delay_ms: float = 5.0
+
+
+@dataclass
+class BatchStats:
+    batches: int = 0
+    items: int = 0
+    largest: int = 0
+    # dispatched items not sent as a batch (provider has no batch method)
+    unbatched: int = 0
+    flushed: Dict[str, int] = field(default_factory=lambda: {"size": 0, "time": 0, "drain": 0})
+
+
+@dataclass
+class _Pending(Generic[I, T]):
+    items: List[Tuple[ServiceCall, I, "asyncio.Future[ServiceResult[T]]"]] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class BatchDispatcher(Generic[I, T]):
+    """
+    Coalesces concurrent single-item calls into batch calls of a provider.
+
+    submit(call, item) parks the item in the window of its tenant; the window
+    is flushed after max_delay_ms or at max_items. A flush picks the bound
+    provider once and, if it has the batch method (e.g. resolve_many), sends
+    all items in one ServiceExecutor.call_many; every caller gets its own
+    ServiceResult (meta re-stamped with the caller's request/trace ids).
+
+    - providers without the batch method: items go one by one through
+      ServiceExecutor.call with single_method (error result if it is not set)
+    - the batch call uses the strictest timeout/attempts of its items and no
+      idempotency key; middlewares see one call with op.batch_size = n
+    - a caller that gives up (cancelled) before the flush is not sent
+    - a dispatch that is cancelled (close(), loop shutdown) cancels the
+      futures of its callers instead of leaving them waiting forever
+    """
+
+    def __init__(
+        self,
+        executor: "ServiceExecutor",
+        *,
+        service_key: str,
+        op_name: str,
+        batch_method: str,
+        single_method: Optional[str] = None,
+        window: BatchWindow = BatchWindow(),
+    ) -> None:
+        self._executor = executor
+        self._service_key = service_key
+        self._op_name = op_name
+        self._batch_method = batch_method
+        self._single_method = single_method
+        self._window = window
+
+        # tenant_id -> items waiting for the flush
+        self._pending: Dict[str, _Pending[I, T]] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._stats = BatchStats()
+
+    @property
+    def window(self) -> BatchWindow:
+        return self._window
+
+    def stats(self) -> BatchStats:
+        return replace(self._stats, flushed=dict(self._stats.flushed))
+
+    async def submit(self, call: ServiceCall, item: I) -> ServiceResult[T]:
+        loop = asyncio.get_running_loop()
+        fut: "asyncio.Future[ServiceResult[T]]" = loop.create_future()
+
+        pending = self._pending.get(call.tenant_id)
+        if pending is None:
+            pending = self._pending[call.tenant_id] = _Pending()
+        pending.items.append((call, item, fut))
+
+        if len(pending.items) >= self._window.max_items:
+            self._flush(call.tenant_id, "size")
+        elif pending.timer is None:
+            pending.timer = loop.call_later(self._window.max_delay_ms / 1000.0, self._flush, call.tenant_id, "time")
+
+        return await fut
+
+    async def drain(self) -> None:
+        """
+        Flush every open window now and wait for all dispatched batches.
+        """
+        for tenant_id in list(self._pending):
+            self._flush(tenant_id, "drain")
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def close(self) -> None:
+        """
+        Shutdown: callers of open windows and of running batches get CancelledError.
+        """
+        for pending in self._pending.values():
+            if pending.timer is not None:
+                pending.timer.cancel()
+            for _, _, fut in pending.items:
+                fut.cancel()
+        self._pending.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def _flush(self, tenant_id: str, reason: FlushReason) -> None:
+        pending = self._pending.pop(tenant_id, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+
+        items = [entry for entry in pending.items if not entry[2].done()]
+        if not items:
+            return
+        self._stats.flushed[reason] += 1
+
+        task = asyncio.ensure_future(self._dispatch(tenant_id, items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(
+        self,
+        tenant_id: str,
+        items: List[Tuple[ServiceCall, I, "asyncio.Future[ServiceResult[T]]"]],
+    ) -> None:
+        started = int(time.time() * 1000)
+        try:
+            try:
+                picked = self._executor.registry.pick(tenant_id, self._service_key)
+                if picked is None:
+                    raise ServiceNotConfigured(f"No available provider for {self._service_key}")
+                provider_name, provider = picked
+
+                batch_fn = getattr(provider, self._batch_method, None)
+                if batch_fn is None:
+                    self._stats.unbatched += len(items)
+                    results = await asyncio.gather(*(self._single(call, item) for call, item, _ in items))
+                else:
+                    results = await self._batch(tenant_id, provider_name, batch_fn, items)
+            except (ServiceNotConfigured, ServiceNotRegistered) as exc:
+                error = ErrorInfo(code="not_configured", message=str(exc))
+                results = [_error(call, started, error) for call, _, _ in items]
+            except Exception as exc:
+                error = ErrorInfo(code="exception", message=str(exc))
+                results = [_error(call, started, error) for call, _, _ in items]
+
+            for (call, _, fut), res in zip(items, results):
+                if not fut.done():
+                    fut.set_result(_restamp(res, call))
+        finally:
+            # cancelled mid-batch: nobody else would ever resolve these
+            for _, _, fut in items:
+                if not fut.done():
+                    fut.cancel()
+
+    async def _batch(
+        self,
+        tenant_id: str,
+        provider_name: str,
+        batch_fn: Any,
+        items: List[Tuple[ServiceCall, I, "asyncio.Future[ServiceResult[T]]"]],
+    ) -> List[ServiceResult[T]]:
+        calls = [call for call, _, _ in items]
+        inputs = [item for _, item, _ in items]
+        batch_call = ServiceCall(
+            tenant_id=tenant_id,
+            request_id=f"batch_{uuid.uuid4().hex}",
+            trace_id=calls[0].trace_id,
+            timeout_ms=min(c.timeout_ms for c in calls),
+            max_attempts=min(c.max_attempts for c in calls),
+            tags=calls[0].tags,
+        )
+
+        self._stats.batches += 1
+        self._stats.items += len(items)
+        self._stats.largest = max(self._stats.largest, len(items))
+
+        return await self._executor.call_many(
+            service_key=self._service_key,
+            call=batch_call,
+            op_name=self._op_name,
+            size=len(inputs),
+            fn=lambda: batch_fn(batch_call, inputs),
+            provider_name=provider_name,
+        )
+
+    async def _single(self, call: ServiceCall, item: I) -> ServiceResult[T]:
+        method = self._single_method
+        if method is None:
+            error = ErrorInfo(code="not_configured", message=f"Provider has no {self._batch_method}")
+            return _error(call, int(time.time() * 1000), error)
+        return await self._executor.call(
+            call=call,
+            op_name=self._op_name,
+            service_key=self._service_key,
+            invoke=lambda provider: getattr(provider, method)(call, item),
+        )
+
+
+def _restamp(res: ServiceResult[T], call: ServiceCall) -> ServiceResult[T]:
+    meta = res.meta
+    if (meta.request_id, meta.trace_id) == (call.request_id, call.trace_id):
+        return res
+    meta = ResultMeta(
+        **{
+            **meta.__dict__,
+            "request_id": call.request_id,
+            "trace_id": call.trace_id,
+            "idempotency_key": call.idempotency_key,
+        }
+    )
+    return replace(res, meta=meta)
+
+
+def _error(call: ServiceCall, started: int, error: ErrorInfo) -> ServiceResult[Any]:
+    meta = ResultMeta(
+        request_id=call.request_id,
+        tenant_id=call.tenant_id,
+        trace_id=call.trace_id,
+        started_at_ms=started,
+        finished_at_ms=int(time.time() * 1000),
+        attempt=1,
+        idempotency_key=call.idempotency_key,
+        tags=call.tags,
+    )
+    return ServiceResult(status="error", meta=meta, error=error)
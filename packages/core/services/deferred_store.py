@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import time
 from dataclasses import dataclass
-from typing import Dict, Generic, Optional, Protocol, Tuple, TypeVar
+from typing import Dict, Generic, Iterable, Optional, Protocol, Tuple, TypeVar
 
 from ..contracts.results import ServiceResult
 
@@ -24,12 +24,23 @@ class DeferredStore(Protocol, Generic[T]):
     async def get(self, ticket_id: str) -> Optional[ServiceResult[T]]:
         ...
 
+    async def get_many(self, ticket_ids: Iterable[str]) -> Dict[str, Optional[ServiceResult[T]]]:
+        ...
+
+    async def wait(self, ticket_id: str, *, timeout: float) -> Optional[ServiceResult[T]]:
+        """
+        Resolve as soon as the ticket is completed; None on timeout.
+        """
+        ...
+
 
 @dataclass
 class InMemoryDeferredStore(Generic[T]):
     def __init__(self) -> None:
         # ticket_id -> (expires_at_ms, result_or_none)
         self._data: Dict[str, Tuple[int, Optional[ServiceResult[T]]]] = {}
+        # ticket_id -> (future resolved by complete(), number of waiters)
+        self._waiters: Dict[str, Tuple["asyncio.Future[ServiceResult[T]]", int]] = {}
         self._mx = asyncio.Lock()
 
     def _now_ms(self) -> int:
@@ -43,13 +54,52 @@ class InMemoryDeferredStore(Generic[T]):
         async with self._mx:
             self._data[ticket_id] = (self._now_ms() + ttl_seconds * 1000, result)
 
+            waiter = self._waiters.pop(ticket_id, None)
+            if waiter is not None and not waiter[0].done():
+                waiter[0].set_result(result)
+
     async def get(self, ticket_id: str) -> Optional[ServiceResult[T]]:
         async with self._mx:
-            item = self._data.get(ticket_id)
-            if not item:
-                return None
-            expires_at, res = item
-            if self._now_ms() >= expires_at:
-                self._data.pop(ticket_id, None)
-                return None
-            return res
+            return self._get_locked(ticket_id)
+
+    async def get_many(self, ticket_ids: Iterable[str]) -> Dict[str, Optional[ServiceResult[T]]]:
+        async with self._mx:
+            return {ticket_id: self._get_locked(ticket_id) for ticket_id in ticket_ids}
+
+    async def wait(self, ticket_id: str, *, timeout: float) -> Optional[ServiceResult[T]]:
+        async with self._mx:
+            res = self._get_locked(ticket_id)
+            if res is not None:
+                return res
+
+            fut, count = self._waiters.get(ticket_id) or (asyncio.get_running_loop().create_future(), 0)
+            self._waiters[ticket_id] = (fut, count + 1)
+
+        try:
+            # asyncio.wait does not cancel the shared future on timeout
+            done, _ = await asyncio.wait({fut}, timeout=timeout)
+        finally:
+            self._release_waiter(ticket_id, fut)
+
+        if not done:
+            return None
+        return fut.result()
+
+    def _release_waiter(self, ticket_id: str, fut: "asyncio.Future[ServiceResult[T]]") -> None:
+        waiter = self._waiters.get(ticket_id)
+        if waiter is None or waiter[0] is not fut:
+            return
+        if waiter[1] <= 1:
+            del self._waiters[ticket_id]
+        else:
+            self._waiters[ticket_id] = (fut, waiter[1] - 1)
+
+    def _get_locked(self, ticket_id: str) -> Optional[ServiceResult[T]]:
+        item = self._data.get(ticket_id)
+        if not item:
+            return None
+        expires_at, res = item
+        if self._now_ms() >= expires_at:
+            self._data.pop(ticket_id, None)
+            return None
+        return res
@@ -1,18 +1,31 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import time
-from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Optional, TypeVar
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Optional, Sequence, Set, Tuple, TypeVar
 
 from ..contracts.events import EventEnvelope
-from ..contracts.results import ErrorInfo, ResultMeta, ServiceResult
+from ..contracts.results import ErrorInfo, ResultMeta, ServiceResult, StreamError
 from ..contracts.services import ServiceCall
 from ..events.bus import EventBus
 from ..middleware.chain import MiddlewareChain
 from ..middleware.types import ServiceOp
-from ..registry.services import ServiceRegistry
+from ..registry.handles import ResolvedService
+from ..registry.services import ServiceNotConfigured, ServiceNotRegistered, ServiceRegistry
+from .batching import BatchDispatcher, BatchWindow
 from .deferred_store import DeferredStore
+from .resilience import (
+    BreakerConfig,
+    BreakerState,
+    HealthKey,
+    HealthTracker,
+    HedgePolicy,
+    LatencyTracker,
+    RetryPolicy,
+)
 
 T = TypeVar("T")
 
@@ -22,44 +35,187 @@ class ServiceExecutor:
     """
     Единственная точка вызова сервисов.
 
-    - timeout/retry
+    - timeout/retry (exponential backoff with jitter, retry budget)
+    - circuit breaker per (tenant, service_key, provider) (optional)
+    - hedged requests per call (optional)
     - service events in bus
     - middleware chain
     - deferred tickets (optional)
+    - streamed results (ServiceResult.stream)
+    - batch windows for single-item calls (batcher)
     """
 
     bus: EventBus
     registry: ServiceRegistry
     chain: MiddlewareChain | None = None
     deferred: DeferredStore[Any] | None = None  # store is type-erased at core level
+    breaker: BreakerConfig | None = None
+    retry: RetryPolicy = RetryPolicy()
+
+    _health: HealthTracker = field(init=False, repr=False, compare=False)
+    _latency: LatencyTracker = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_health", HealthTracker(self.breaker, self.retry))
+        object.__setattr__(self, "_latency", LatencyTracker())
 
     async def call(
         self,
         *,
-        service_key: str,
         call: ServiceCall,
         op_name: str,
-        fn: Callable[[], Awaitable[ServiceResult[T]]],
+        service_key: str = "",
+        fn: Callable[[], Awaitable[ServiceResult[T]]] | None = None,
+        invoke: Callable[[Any], Awaitable[ServiceResult[T]]] | None = None,
         deferred_ttl_seconds: int = 3600,
+        hedge: HedgePolicy | None = None,
+        hedge_fn: Callable[[], Awaitable[ServiceResult[T]]] | None = None,
+        handle: ResolvedService[Any] | None = None,
+        stream_idle_timeout_ms: int | None = None,
+        provider_name: str | None = None,
     ) -> ServiceResult[T]:
+        """
+        fn: call of an already resolved provider; provider_name (if the caller
+        knows it) keys its circuit breaker and retry budget. Without it fn mode
+        is keyed by the binding's preferred provider, which for multi-provider
+        bindings is not necessarily the one the balancer resolved.
+        invoke: provider -> call; the executor picks the provider from the
+        tenant binding for every attempt (balancer, circuit breaker) and fails
+        over to another provider of the binding on retryable errors.
+
+        hedge: if the attempt is still running after the hedge delay, start
+        hedge_fn and take the first successful result; the other one is
+        cancelled. Default hedge_fn: fn mode repeats fn; invoke mode invokes
+        another provider of the binding picked by the balancer (no hedge if
+        there is none with a closed breaker). Hedging happens inside the
+        terminal, so middlewares (idempotency included) see one call.
+
+        handle: ResolvedService for the call (service_key may be omitted);
+        invoke mode resolves providers through it, its middleware/limits run
+        inside the executor chain.
+
+        Streamed results (ok/partial with stream set):
+        - call.timeout_ms covers the call up to the first chunk; the first chunk
+          is fetched inside the attempt, so a slow start is retried/failed over
+        - then every next chunk must arrive within stream_idle_timeout_ms
+          (default call.timeout_ms), otherwise the stream raises StreamError
+        - middlewares see the result before the first chunk and may wrap its
+          stream (see middleware.stream_mw)
+        - health, provider stats and the service event are recorded when the
+          stream ends: service.<op>.completed or service.<op>.error
+        """
+        if (fn is None) == (invoke is None):
+            raise ValueError("Exactly one of fn/invoke must be given")
+        if handle is not None:
+            service_key = service_key or handle.service_key
+        if not service_key:
+            raise ValueError("service_key or handle must be given")
+
         started = int(time.time() * 1000)
         last_error: Optional[ServiceResult[T]] = None
         attempts = max(1, call.max_attempts)
 
+        # fn mode: op and terminal are the same for every attempt (fn is the terminal);
+        # invoke mode: the op of each attempt names the provider picked for it
+        op = ServiceOp(service_key=service_key, op_name=op_name, call=call, provider_name=provider_name)
+        chain = self.chain
+        handle_chain = handle.chain if handle is not None else None
+        pick = handle.pick if handle is not None else functools.partial(self.registry.pick, call.tenant_id, service_key)
+
+        if fn is not None:
+            health_key = self._health_key(call.tenant_id, service_key, provider_name)
+            if hedge is not None:
+                fn = self._hedged(call, service_key, op_name, fn, hedge_fn or fn, hedge)
+
+        # providers that already failed in this call (invoke mode)
+        tried: Set[str] = set()
+        loop = asyncio.get_running_loop()
+        idle_s = (stream_idle_timeout_ms if stream_idle_timeout_ms is not None else call.timeout_ms) / 1000.0
+
         for attempt in range(1, attempts + 1):
-            try:
-                op = ServiceOp(service_key=service_key, op_name=op_name, call=call)
+            picked: Optional[str] = None
 
-                async def terminal() -> ServiceResult[T]:
-                    return await fn()
+            if invoke is not None:
+                try:
+                    selected = await self._select_provider(call, service_key, tried, pick)
+                except (ServiceNotConfigured, ServiceNotRegistered) as exc:
+                    return _error_result(call, started, attempt, ErrorInfo(code="not_configured", message=str(exc)))
+                if selected is None:
+                    key = (call.tenant_id, service_key, "*")
+                    return await self._circuit_open(call, op_name, key, started, attempt)
 
-                if self.chain is not None:
-                    coro = self.chain.run(op, terminal)
+                picked, provider, health_key = selected
+                attempt_fn = functools.partial(invoke, provider)
+                if hedge is not None:
+                    alternate = hedge_fn or functools.partial(
+                        self._alternate, call, service_key, pick, invoke, tried | {picked}
+                    )
+                    attempt_fn = self._hedged(call, service_key, op_name, attempt_fn, alternate, hedge)
+                self.registry.stats.started(picked)
+                attempt_op = replace(op, provider_name=picked)
+            else:
+                if not await self._breaker_allow(call, health_key):
+                    return await self._circuit_open(call, op_name, health_key, started, attempt)
+                attempt_fn = fn  # type: ignore[assignment]
+                attempt_op = op
+
+            if handle_chain is not None:
+                attempt_fn = functools.partial(handle_chain.run, attempt_op, attempt_fn)
+
+            t0 = time.perf_counter()
+            streaming = False
+            try:
+                if chain is not None:
+                    coro = chain.run(attempt_op, attempt_fn)
                 else:
-                    coro = terminal()
+                    coro = attempt_fn()
 
+                deadline = loop.time() + call.timeout_ms / 1000.0
                 res = await asyncio.wait_for(coro, timeout=call.timeout_ms / 1000.0)
 
+                if res.stream is not None and res.status in ("ok", "partial"):
+                    first = await _first_chunk(res.stream, deadline - loop.time())
+                    streaming = True
+                    return replace(
+                        res,
+                        stream=_StartedStream(self._guarded_stream(
+                            call=call,
+                            op_name=op_name,
+                            service_key=service_key,
+                            attempt=attempt,
+                            provider_name=picked,
+                            health_key=health_key,
+                            status=res.status,
+                            stream=res.stream,
+                            first=first,
+                            idle_s=idle_s,
+                            t0=t0,
+                        )),
+                    )
+
+                failed = _is_failure(res)
+                await self._record(call, health_key, ok=_health_outcome(res))
+
+                if failed and picked is not None and attempt < attempts:
+                    # fail over: next attempt goes to another provider of the binding
+                    last_error = res
+                    tried.add(picked)
+                    await self._publish_service_event(
+                        tenant_id=call.tenant_id,
+                        trace_id=call.trace_id,
+                        request_id=call.request_id,
+                        name=f"service.{op_name}.error",
+                        payload={
+                            "service_key": service_key,
+                            "attempt": attempt,
+                            "provider": picked,
+                            "error_code": res.error.code if res.error else "unknown",
+                        },
+                    )
+                    if not await self._before_retry(health_key, attempt):
+                        return res
+                    continue
+
                 # if deferred -> remember pending ticket (if store configured)
                 if res.status == "deferred" and res.ticket_id and self.deferred is not None:
                     await self.deferred.put_pending(res.ticket_id, ttl_seconds=deferred_ttl_seconds)
@@ -85,7 +241,7 @@ class ServiceExecutor:
                     trace_id=call.trace_id,
                     started_at_ms=started,
                     finished_at_ms=int(time.time() * 1000),
-                    provider_name=None,
+                    provider_name=picked,
                     attempt=attempt,
                     idempotency_key=call.idempotency_key,
                     tags=call.tags,
@@ -103,7 +259,7 @@ class ServiceExecutor:
                     trace_id=call.trace_id,
                     started_at_ms=started,
                     finished_at_ms=int(time.time() * 1000),
-                    provider_name=None,
+                    provider_name=picked,
                     attempt=attempt,
                     idempotency_key=call.idempotency_key,
                     tags=call.tags,
@@ -114,6 +270,20 @@ class ServiceExecutor:
                     error=ErrorInfo(code="exception", message=str(exc), retryable=(attempt < attempts)),
                 )
 
+            except BaseException:
+                # cancelled: the attempt tells nothing about the provider, free its probe slot
+                self._release_probe(health_key)
+                raise
+
+            finally:
+                # a running stream reports to stats when it ends
+                if picked is not None and not streaming:
+                    self.registry.stats.finished(picked, (time.perf_counter() - t0) * 1000.0)
+
+            if picked is not None:
+                tried.add(picked)
+
+            await self._record(call, health_key, ok=False)
             await self._publish_service_event(
                 tenant_id=call.tenant_id,
                 trace_id=call.trace_id,
@@ -122,16 +292,515 @@ class ServiceExecutor:
                 payload={
                     "service_key": service_key,
                     "attempt": attempt,
-                    "provider": None,
+                    "provider": picked,
                     "error_code": last_error.error.code if last_error and last_error.error else "unknown",
                 },
             )
 
             if not last_error or not last_error.error or not last_error.error.retryable:
                 break
+            if not await self._before_retry(health_key, attempt):
+                break
 
         return last_error  # type: ignore[return-value]
 
+    async def _guarded_stream(
+        self,
+        *,
+        call: ServiceCall,
+        op_name: str,
+        service_key: str,
+        attempt: int,
+        provider_name: Optional[str],
+        health_key: HealthKey,
+        status: str,
+        stream: AsyncIterator[T],
+        first: Any,
+        idle_s: float,
+        t0: float,
+    ) -> AsyncIterator[T]:
+        first_chunk_ms = (time.perf_counter() - t0) * 1000.0
+        chunks = 0
+        error: Optional[ErrorInfo] = None
+        cancelled = False
+        try:
+            if first is not _END:
+                chunks += 1
+                yield first
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(stream.__anext__(), timeout=idle_s)
+                    except StopAsyncIteration:
+                        break
+                    chunks += 1
+                    yield chunk
+        except asyncio.TimeoutError:
+            error = ErrorInfo(code="stream_idle_timeout", message="Stream idle timeout", details={"chunks": chunks})
+            raise StreamError(error) from None
+        except (GeneratorExit, asyncio.CancelledError):
+            # consumer stopped reading: not the provider's fault
+            cancelled = True
+            raise
+        except Exception as exc:
+            error = ErrorInfo(code="exception", message=str(exc), details={"chunks": chunks})
+            raise StreamError(error) from exc
+        finally:
+            # synchronous bookkeeping first: a cancelled close may not get past an await
+            if provider_name is not None:
+                self.registry.stats.finished(provider_name, (time.perf_counter() - t0) * 1000.0)
+            if cancelled:
+                self._release_probe(health_key)
+            if error is not None or cancelled:
+                await _aclose(stream)
+            if not cancelled:
+                await self._record(call, health_key, ok=error is None)
+
+            payload: dict[str, Any] = {
+                "service_key": service_key,
+                "attempt": attempt,
+                "provider": provider_name,
+                "stream": True,
+                "chunks": chunks,
+                "first_chunk_ms": round(first_chunk_ms, 3),
+                "duration_ms": round((time.perf_counter() - t0) * 1000.0, 3),
+            }
+            if error is None and not cancelled:
+                name = f"service.{op_name}.completed"
+                payload["status"] = status
+            else:
+                name = f"service.{op_name}.error"
+                payload["error_code"] = error.code if error is not None else "cancelled"
+            await self._publish_service_event(
+                tenant_id=call.tenant_id,
+                trace_id=call.trace_id,
+                request_id=call.request_id,
+                name=name,
+                payload=payload,
+            )
+
+    async def call_many(
+        self,
+        *,
+        service_key: str,
+        call: ServiceCall,
+        op_name: str,
+        size: int,
+        fn: Callable[[], Awaitable[Sequence[ServiceResult[T]]]],
+        deferred_ttl_seconds: int = 3600,
+        provider_name: str | None = None,
+    ) -> list[ServiceResult[T]]:
+        """
+        Batch variant of call() (fn mode; provider_name as there).
+
+        - middleware chain runs once for the whole batch (op.batch_size = size,
+          the result passed through middlewares carries per-item results in data)
+        - one timeout for the whole batch (call.timeout_ms)
+        - retry repeats the whole batch
+        - service events are aggregated: one event per resulting status,
+          payload carries item counts instead of per-item details
+        """
+        started = int(time.time() * 1000)
+        attempts = max(1, call.max_attempts)
+        error_info: Optional[ErrorInfo] = None
+
+        op = ServiceOp(service_key=service_key, op_name=op_name, call=call, batch_size=size, provider_name=provider_name)
+        health_key = self._health_key(call.tenant_id, service_key, provider_name)
+        attempt = 1
+
+        async def terminal() -> ServiceResult[list[ServiceResult[T]]]:
+            items = list(await fn())
+            if len(items) != size:
+                raise ValueError(f"Batch size mismatch: expected {size}, got {len(items)}")
+            return ServiceResult(
+                status="ok",
+                meta=_call_meta(call, started, attempt),
+                data=items,
+            )
+
+        for attempt in range(1, attempts + 1):
+            if not await self._breaker_allow(call, health_key):
+                res = await self._circuit_open(call, op_name, health_key, started, attempt)
+                return [res for _ in range(size)]
+
+            try:
+                if self.chain is not None:
+                    coro = self.chain.run(op, terminal)
+                else:
+                    coro = terminal()
+
+                batch = await asyncio.wait_for(coro, timeout=call.timeout_ms / 1000.0)
+
+                if batch.status != "ok" or batch.data is None:
+                    await self._record(call, health_key, ok=_health_outcome(batch))
+                    # middleware short-circuited the whole batch (e.g. in_progress)
+                    error_info = batch.error or ErrorInfo(code="batch_failed", message="Batch failed")
+                    results = [
+                        ServiceResult(status="error", meta=batch.meta, error=error_info) for _ in range(size)
+                    ]
+                    await self._publish_batch_events(call, service_key, op_name, attempt, results)
+                    return results
+
+                results = list(batch.data)
+                await self._record(call, health_key, ok=_batch_health_outcome(results))
+
+                if self.deferred is not None:
+                    for res in results:
+                        if res.status == "deferred" and res.ticket_id:
+                            await self.deferred.put_pending(res.ticket_id, ttl_seconds=deferred_ttl_seconds)
+
+                await self._publish_batch_events(call, service_key, op_name, attempt, results)
+                return results
+
+            except asyncio.TimeoutError:
+                error_info = ErrorInfo(code="timeout", message="Service timeout", retryable=(attempt < attempts))
+
+            except Exception as exc:
+                error_info = ErrorInfo(code="exception", message=str(exc), retryable=(attempt < attempts))
+
+            except BaseException:
+                self._release_probe(health_key)
+                raise
+
+            await self._record(call, health_key, ok=False)
+            await self._publish_service_event(
+                tenant_id=call.tenant_id,
+                trace_id=call.trace_id,
+                request_id=call.request_id,
+                name=f"service.{op_name}.error",
+                payload={
+                    "service_key": service_key,
+                    "attempt": attempt,
+                    "provider": None,
+                    "error_code": error_info.code,
+                    "batch_size": size,
+                    "count": size,
+                },
+            )
+
+            if not error_info.retryable:
+                break
+            if not await self._before_retry(health_key, attempt):
+                break
+
+        meta = _call_meta(call, started, attempt, finished=True)
+        return [ServiceResult(status="error", meta=meta, error=error_info) for _ in range(size)]
+
+    def batcher(
+        self,
+        *,
+        service_key: str,
+        op_name: str,
+        batch_method: str,
+        single_method: Optional[str] = None,
+        window: BatchWindow = BatchWindow(),
+    ) -> BatchDispatcher[Any, Any]:
+        """
+        Batch window over this executor: concurrent submit(call, item) calls are
+        sent to the provider's batch_method (e.g. resolve_many) as one call_many.
+        Create one per service op and share it between handlers.
+        """
+        return BatchDispatcher(
+            self,
+            service_key=service_key,
+            op_name=op_name,
+            batch_method=batch_method,
+            single_method=single_method,
+            window=window,
+        )
+
+    def _hedged(
+        self,
+        call: ServiceCall,
+        service_key: str,
+        op_name: str,
+        primary: Callable[[], Awaitable[ServiceResult[T]]],
+        secondary: Callable[[], Optional[Awaitable[ServiceResult[T]]]],
+        policy: HedgePolicy,
+    ) -> Callable[[], Awaitable[ServiceResult[T]]]:
+        """
+        secondary() is called once the hedge delay passes; None: nothing to
+        hedge with, keep waiting for the primary.
+        """
+        latency_key = (service_key, op_name)
+
+        async def timed_primary() -> ServiceResult[T]:
+            # the tracked percentile is the primary's latency, whoever wins: a
+            # primary cancelled after losing counts with its elapsed time (a lower
+            # bound above the hedge delay), so the delay does not drift down
+            t0 = time.perf_counter()
+            try:
+                return await primary()
+            finally:
+                self._latency.record(latency_key, (time.perf_counter() - t0) * 1000.0)
+
+        async def run() -> ServiceResult[T]:
+            delay_ms = policy.delay_ms
+            if delay_ms is None:
+                tracked = self._latency.percentile(latency_key, policy.percentile, min_samples=policy.min_samples)
+                delay_ms = int(tracked) if tracked is not None else None
+
+            first = asyncio.ensure_future(timed_primary())
+            if delay_ms is None:
+                return await first
+
+            tasks = {first}
+            hedged = False
+            try:
+                done, _ = await asyncio.wait(tasks, timeout=delay_ms / 1000.0)
+                if not done:
+                    hedge_call = secondary()
+                    if hedge_call is not None:
+                        tasks.add(asyncio.ensure_future(hedge_call))
+                        hedged = True
+
+                # a retryable error (or exception) only wins if no other attempt does better
+                error: Optional[BaseException] = None
+                fallback: Optional[ServiceResult[T]] = None
+                while tasks:
+                    done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        exc = asyncio.CancelledError() if task.cancelled() else task.exception()
+                        if exc is not None:
+                            error = error or exc
+                            continue
+
+                        res = task.result()
+                        if _is_retryable_error(res) and tasks:
+                            fallback = fallback or res
+                            continue
+
+                        if hedged:
+                            await self._publish_hedged(call, service_key, op_name, delay_ms, task is first)
+                        return res
+
+                if fallback is not None:
+                    return fallback
+                assert error is not None
+                raise error
+            finally:
+                # loser (or both, if we are cancelled/timed out) is cancelled and awaited
+                for task in tasks:
+                    task.cancel()
+                if tasks:
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
+        return run
+
+    def _alternate(
+        self,
+        call: ServiceCall,
+        service_key: str,
+        pick: Callable[..., Optional[Tuple[str, Any]]],
+        invoke: Callable[[Any], Awaitable[ServiceResult[T]]],
+        exclude: Set[str],
+    ) -> Optional[Awaitable[ServiceResult[T]]]:
+        """
+        Hedge of an invoke-mode attempt: another provider of the binding picked
+        by the balancer (never one in `exclude`, never a breaker that is not
+        closed: a hedge is no probe). None if the binding has no such provider.
+        """
+        skip = set(exclude)
+        while True:
+            picked = pick(exclude=skip)
+            if picked is None:
+                return None
+            name, provider = picked
+            key = (call.tenant_id, service_key, name)
+            breaker = self._health.existing_breaker(key)
+            if breaker is None or breaker.state == "closed":
+                return self._run_alternate(call, key, name, invoke, provider)
+            skip.add(name)
+
+    async def _run_alternate(
+        self,
+        call: ServiceCall,
+        key: HealthKey,
+        name: str,
+        invoke: Callable[[Any], Awaitable[ServiceResult[T]]],
+        provider: Any,
+    ) -> ServiceResult[T]:
+        # the hedge provider's own stats/health; a cancelled (losing) hedge records nothing
+        self.registry.stats.started(name)
+        t0 = time.perf_counter()
+        try:
+            res = await invoke(provider)
+        except Exception:
+            await self._record(call, key, ok=False)
+            raise
+        finally:
+            self.registry.stats.finished(name, (time.perf_counter() - t0) * 1000.0)
+        await self._record(call, key, ok=_health_outcome(res))
+        return res
+
+    async def _publish_hedged(
+        self,
+        call: ServiceCall,
+        service_key: str,
+        op_name: str,
+        delay_ms: int,
+        primary_won: bool,
+    ) -> None:
+        await self._publish_service_event(
+            tenant_id=call.tenant_id,
+            trace_id=call.trace_id,
+            request_id=call.request_id,
+            name=f"service.{op_name}.hedged",
+            payload={
+                "service_key": service_key,
+                "delay_ms": delay_ms,
+                "winner": "primary" if primary_won else "hedge",
+            },
+        )
+
+    async def _select_provider(
+        self,
+        call: ServiceCall,
+        service_key: str,
+        tried: Set[str],
+        pick: Callable[..., Optional[Tuple[str, Any]]],
+    ) -> Optional[Tuple[str, Any, HealthKey]]:
+        """
+        Pick a provider whose breaker lets the call through, preferring
+        providers not tried yet in this call. None: every provider is open.
+        """
+        for skip_tried in (True, False):
+            skip = set(tried) if skip_tried else set()
+            while True:
+                picked = pick(exclude=skip)
+                if picked is None:
+                    break
+                name, provider = picked
+                key = (call.tenant_id, service_key, name)
+                if await self._breaker_allow(call, key):
+                    return name, provider, key
+                skip.add(name)
+            if not tried:
+                break
+        return None
+
+    def _health_key(self, tenant_id: str, service_key: str, provider_name: Optional[str] = None) -> HealthKey:
+        """
+        fn-mode key: the named provider, else the binding's preferred one.
+        """
+        name = provider_name or self.registry.bound_provider_name(tenant_id, service_key)
+        return (tenant_id, service_key, name or "-")
+
+    async def _breaker_allow(self, call: ServiceCall, key: HealthKey) -> bool:
+        breaker = self._health.breaker(key)
+        if breaker is None:
+            return True
+        allowed, changed = breaker.allow()
+        if changed is not None:
+            await self._publish_breaker_event(call, key, changed)
+        return allowed
+
+    async def _record(self, call: ServiceCall, key: HealthKey, *, ok: Optional[bool]) -> None:
+        """
+        ok: True provider answered, False provider failure,
+        None neutral (see _health_outcome): only the probe slot is freed.
+        """
+        if ok is None:
+            self._release_probe(key)
+            return
+        if ok:
+            self._health.budget(key).on_success()
+
+        breaker = self._health.breaker(key)
+        if breaker is None:
+            return
+        changed = breaker.on_success() if ok else breaker.on_failure()
+        if changed is not None:
+            await self._publish_breaker_event(call, key, changed)
+
+    def _release_probe(self, key: HealthKey) -> None:
+        breaker = self._health.existing_breaker(key)
+        if breaker is not None:
+            breaker.release_probe()
+
+    async def _before_retry(self, key: HealthKey, attempt: int) -> bool:
+        """
+        Spend retry budget and sleep the backoff delay. False: do not retry.
+        """
+        if not self._health.budget(key).try_spend():
+            return False
+        delay = self.retry.backoff_seconds(attempt)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return True
+
+    async def _circuit_open(
+        self,
+        call: ServiceCall,
+        op_name: str,
+        key: HealthKey,
+        started: int,
+        attempt: int,
+    ) -> ServiceResult[Any]:
+        breaker = self._health.existing_breaker(key)
+        retry_after_ms = breaker.retry_after_ms() if breaker is not None else 0
+        res: ServiceResult[Any] = ServiceResult(
+            status="error",
+            meta=_call_meta(call, started, attempt, finished=True),
+            error=ErrorInfo(
+                code="circuit_open",
+                message="Provider is temporarily unavailable",
+                retryable=True,
+                details={"retry_after_ms": retry_after_ms, "provider": key[2]},
+            ),
+        )
+        await self._publish_service_event(
+            tenant_id=call.tenant_id,
+            trace_id=call.trace_id,
+            request_id=call.request_id,
+            name=f"service.{op_name}.error",
+            payload={
+                "service_key": key[1],
+                "attempt": attempt,
+                "provider": key[2],
+                "error_code": "circuit_open",
+            },
+        )
+        return res
+
+    async def _publish_breaker_event(self, call: ServiceCall, key: HealthKey, state: BreakerState) -> None:
+        await self._publish_service_event(
+            tenant_id=call.tenant_id,
+            trace_id=call.trace_id,
+            request_id=call.request_id,
+            name=f"service.breaker.{state}",
+            payload={
+                "service_key": key[1],
+                "provider": key[2],
+                "state": state,
+            },
+        )
+
+    async def _publish_batch_events(
+        self,
+        call: ServiceCall,
+        service_key: str,
+        op_name: str,
+        attempt: int,
+        results: Sequence[ServiceResult[Any]],
+    ) -> None:
+        counts = Counter(res.status for res in results)
+        providers = sorted({res.meta.provider_name for res in results if res.meta.provider_name})
+
+        for status, count in counts.items():
+            await self._publish_service_event(
+                tenant_id=call.tenant_id,
+                trace_id=call.trace_id,
+                request_id=call.request_id,
+                name=f"service.{op_name}.{status}",
+                payload={
+                    "service_key": service_key,
+                    "attempt": attempt,
+                    "provider": providers[0] if len(providers) == 1 else None,
+                    "batch_size": len(results),
+                    "count": count,
+                },
+            )
+
     async def complete_deferred(
         self,
         *,
@@ -161,6 +830,14 @@ class ServiceExecutor:
             },
         )
 
+    async def wait_deferred(self, ticket_id: str, *, timeout_ms: int) -> Optional[ServiceResult[Any]]:
+        """
+        Wait until a deferred ticket is completed (None on timeout or without store).
+        """
+        if self.deferred is None:
+            return None
+        return await self.deferred.wait(ticket_id, timeout=timeout_ms / 1000.0)
+
     async def _publish_service_event(
         self,
         *,
@@ -181,3 +858,134 @@ class ServiceExecutor:
             payload=payload,
         )
         await self.bus.publish(evt)
+
+
+# first chunk of an empty stream
+_END = object()
+
+
+async def _first_chunk(stream: AsyncIterator[Any], timeout: float) -> Any:
+    """
+    First chunk within timeout (_END for an empty stream); the stream is closed on failure.
+    """
+    try:
+        return await asyncio.wait_for(stream.__anext__(), timeout=max(0.0, timeout))
+    except StopAsyncIteration:
+        return _END
+    except BaseException:
+        await _aclose(stream)
+        raise
+
+
+class _StartedStream(AsyncIterator[T]):
+    """
+    Wrapper of _guarded_stream: an async generator that was never iterated does
+    not run its finally on aclose() or garbage collection, which would leave
+    the provider's stats and half-open probe taken. Closing (or dropping) the
+    wrapper before the first read starts the generator on its prefetched first
+    chunk and closes it, so the end-of-stream bookkeeping always runs.
+    """
+
+    __slots__ = ("_gen", "_started", "_loop")
+
+    def __init__(self, gen: AsyncGenerator[T, None]) -> None:
+        self._gen = gen
+        self._started = False
+        self._loop = asyncio.get_running_loop()
+
+    def __aiter__(self) -> "_StartedStream[T]":
+        return self
+
+    def __anext__(self) -> Awaitable[T]:
+        self._started = True
+        return self._gen.__anext__()
+
+    async def aclose(self) -> None:
+        if not self._started:
+            self._started = True
+            try:
+                # no I/O: the first chunk was already read by _first_chunk
+                await self._gen.__anext__()
+            except StopAsyncIteration:
+                return
+        await self._gen.aclose()
+
+    def __del__(self) -> None:
+        if self._started or self._loop.is_closed():
+            return
+        task = self._loop.create_task(self.aclose())
+        _CLOSING.add(task)
+        task.add_done_callback(_CLOSING.discard)
+
+
+# closes of dropped, never-read streams still running (tasks are weakly held by the loop)
+_CLOSING: Set["asyncio.Task[None]"] = set()
+
+
+async def _aclose(stream: AsyncIterator[Any]) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        try:
+            await aclose()
+        except Exception:
+            pass
+
+
+# retryable codes produced by core itself (middlewares), not by the provider
+_CORE_ERROR_CODES = frozenset({"in_progress", "overloaded"})
+
+
+def _is_retryable_error(res: ServiceResult[Any]) -> bool:
+    return res.status == "error" and res.error is not None and res.error.retryable
+
+
+def _is_failure(res: ServiceResult[Any]) -> bool:
+    # provider-reported retryable errors count against provider health,
+    # non-retryable ones (bad input, missing template) do not
+    return (
+        res.status == "error"
+        and res.error is not None
+        and res.error.retryable
+        and res.error.code not in _CORE_ERROR_CODES
+    )
+
+
+def _health_outcome(res: ServiceResult[Any]) -> Optional[bool]:
+    """
+    What a returned result says about provider health:
+    True (answered), False (provider failure), None (core short-circuit such as
+    overloaded/in_progress, or a non-retryable error like bad input).
+    """
+    if res.status != "error":
+        return True
+    if _is_failure(res):
+        return False
+    return None
+
+
+def _batch_health_outcome(results: Sequence[ServiceResult[Any]]) -> Optional[bool]:
+    # provider is healthy if it served any item, failing if every item failed on its side
+    outcomes = {_health_outcome(res) for res in results}
+    if True in outcomes:
+        return True
+    if False in outcomes:
+        return False
+    return None
+
+
+def _error_result(call: ServiceCall, started: int, attempt: int, error: ErrorInfo) -> ServiceResult[Any]:
+    return ServiceResult(status="error", meta=_call_meta(call, started, attempt, finished=True), error=error)
+
+
+def _call_meta(call: ServiceCall, started: int, attempt: int, *, finished: bool = False) -> ResultMeta:
+    return ResultMeta(
+        request_id=call.request_id,
+        tenant_id=call.tenant_id,
+        trace_id=call.trace_id,
+        started_at_ms=started,
+        finished_at_ms=int(time.time() * 1000) if finished else None,
+        provider_name=None,
+        attempt=attempt,
+        idempotency_key=call.idempotency_key,
+        tags=call.tags,
+    )
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Literal, Optional, Tuple
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+# (tenant_id, service_key, provider_name)
+HealthKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class BreakerConfig:
+    # consecutive failures that open the breaker
+    failure_threshold: int = 5
+    # how long the breaker stays open before letting probes through
+    open_seconds: float = 30.0
+    # concurrent probe calls allowed while half-open
+    half_open_max_calls: int = 1
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter + retry budget.
+
+    Budget: every successful call earns `budget_ratio` retry tokens
+    (up to `budget_max_tokens`), every retry spends one. With no tokens left
+    the call fails with its last error instead of retrying.
+    """
+    base_delay_ms: int = 50
+    max_delay_ms: int = 2_000
+    budget_ratio: float = 0.1
+    budget_initial_tokens: float = 10.0
+    budget_max_tokens: float = 100.0
+
+    def backoff_seconds(self, attempt: int) -> float:
+        """
+        Delay before attempt+1 (attempt is 1-based).
+        """
+        cap = min(self.max_delay_ms, self.base_delay_ms * (2 ** (attempt - 1)))
+        return random.uniform(0, cap) / 1000.0
+
+
+class CircuitBreaker:
+    """
+    closed -> open after N consecutive failures,
+    open -> half_open after open_seconds,
+    half_open -> closed on probe success / open on probe failure;
+    every allowed probe must end in on_success/on_failure/release_probe.
+    """
+
+    def __init__(self, cfg: BreakerConfig) -> None:
+        self._cfg = cfg
+        self.state: BreakerState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    def allow(self) -> Tuple[bool, Optional[BreakerState]]:
+        """
+        Returns (allowed, new_state if the state changed).
+        """
+        if self.state == "closed":
+            return True, None
+
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self._cfg.open_seconds:
+                return False, None
+            self.state = "half_open"
+            self._probes = 1
+            return True, "half_open"
+
+        if self._probes >= self._cfg.half_open_max_calls:
+            return False, None
+        self._probes += 1
+        return True, None
+
+    def retry_after_ms(self) -> int:
+        left = self._cfg.open_seconds - (time.monotonic() - self._opened_at)
+        return max(0, int(left * 1000))
+
+    def on_success(self) -> Optional[BreakerState]:
+        self._failures = 0
+        if self.state == "half_open":
+            self._probes = max(0, self._probes - 1)
+            self.state = "closed"
+            return "closed"
+        return None
+
+    def release_probe(self) -> None:
+        """
+        Neutral outcome (probe cancelled, or its result says nothing about the
+        provider): frees the probe slot without changing the state.
+        """
+        if self.state == "half_open" and self._probes > 0:
+            self._probes -= 1
+
+    def on_failure(self) -> Optional[BreakerState]:
+        if self.state == "half_open":
+            return self._open()
+
+        self._failures += 1
+        if self.state == "closed" and self._failures >= self._cfg.failure_threshold:
+            return self._open()
+        return None
+
+    def _open(self) -> BreakerState:
+        self.state = "open"
+        self._opened_at = time.monotonic()
+        self._failures = 0
+        self._probes = 0
+        return "open"
+
+
+class RetryBudget:
+    def __init__(self, policy: RetryPolicy) -> None:
+        self._policy = policy
+        self._tokens = policy.budget_initial_tokens
+
+    def on_success(self) -> None:
+        self._tokens = min(self._policy.budget_max_tokens, self._tokens + self._policy.budget_ratio)
+
+    def try_spend(self) -> bool:
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+class HealthTracker:
+    """
+    Breakers and retry budgets per (tenant, service_key, provider).
+    """
+
+    def __init__(self, breaker: BreakerConfig | None, retry: RetryPolicy) -> None:
+        self._breaker_cfg = breaker
+        self._retry = retry
+        self._breakers: Dict[HealthKey, CircuitBreaker] = {}
+        self._budgets: Dict[HealthKey, RetryBudget] = {}
+
+    def breaker(self, key: HealthKey) -> Optional[CircuitBreaker]:
+        if self._breaker_cfg is None:
+            return None
+        br = self._breakers.get(key)
+        if br is None:
+            br = self._breakers[key] = CircuitBreaker(self._breaker_cfg)
+        return br
+
+    def existing_breaker(self, key: HealthKey) -> Optional[CircuitBreaker]:
+        return self._breakers.get(key)
+
+    def budget(self, key: HealthKey) -> RetryBudget:
+        b = self._budgets.get(key)
+        if b is None:
+            b = self._budgets[key] = RetryBudget(self._retry)
+        return b
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    Speculative second attempt for latency-sensitive ops.
+
+    delay_ms: fixed hedge delay; None -> use tracked latency percentile
+    (no hedging until min_samples latencies were observed).
+    """
+    delay_ms: Optional[int] = None
+    percentile: float = 0.95
+    min_samples: int = 20
+
+
+class LatencyTracker:
+    """
+    Sliding window of recent latencies per (service_key, op_name).
+    Percentiles are recomputed every `refresh_every` samples.
+    """
+
+    def __init__(self, *, window: int = 256, refresh_every: int = 16) -> None:
+        self._window = window
+        self._refresh_every = refresh_every
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self._since_refresh: Dict[Tuple[str, str], int] = {}
+        self._cached: Dict[Tuple[str, str, float], float] = {}
+
+    def record(self, key: Tuple[str, str], latency_ms: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self._window)
+        samples.append(latency_ms)
+        self._since_refresh[key] = self._since_refresh.get(key, 0) + 1
+
+    def percentile(self, key: Tuple[str, str], q: float, *, min_samples: int) -> Optional[float]:
+        samples = self._samples.get(key)
+        if not samples or len(samples) < min_samples:
+            return None
+
+        cache_key = (key[0], key[1], q)
+        cached = self._cached.get(cache_key)
+        if cached is not None and self._since_refresh.get(key, 0) < self._refresh_every:
+            return cached
+
+        ordered = sorted(samples)
+        value = ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+        self._cached[cache_key] = value
+        self._since_refresh[key] = 0
+        return value
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from core.bootstrap import CoreApp
+from core.modules.contracts import CoreModule, ModuleHandle
+
+from packages.providers.slots.resolver import SlotFillingResolver
+
+_SLOT_KEYS = ("patterns", "gazetteers", "builtins")
+
+
+@dataclass(frozen=True)
+class IntentSlotsModuleConfig:
+    provider_name: str
+    # registered IntentResolver the slot stage wraps
+    intent_provider: str
+    # patterns / gazetteers / builtins, see parse_slot_config
+    slots: Mapping[str, Any]
+
+
+def _typed_config(cfg: Mapping[str, Any]) -> IntentSlotsModuleConfig:
+    return IntentSlotsModuleConfig(
+        provider_name=str(cfg.get("provider_name", "intent_slots_v1")),
+        intent_provider=str(cfg.get("intent_provider", "intent_ngram_v1")),
+        slots={key: cfg[key] for key in _SLOT_KEYS if key in cfg},
+    )
+
+
+class IntentSlotsModule(CoreModule):
+    """
+    Slot extraction for a tenant's intent resolver.
+
+    Registers (once per provider_name) a SlotFillingResolver around
+    intent_provider; the tenant binds intent_resolve to provider_name.
+    Tenants with equal slot configs share one compiled extractor.
+    """
+
+    module_key = "intent_slots"
+
+    def attach(self, app: CoreApp, *, tenant_id: str, cfg: Mapping[str, Any]) -> ModuleHandle:
+        typed = _typed_config(cfg)
+        handle = ModuleHandle(module_key=self.module_key, tenant_id=tenant_id)
+
+        provider = _provider(app, typed)
+        handle.provider_names.append(typed.provider_name)
+
+        provider.set_tenant_slots(tenant_id, typed.slots)
+        return handle
+
+    def reconfigure(self, app: CoreApp, handle: ModuleHandle, cfg: Mapping[str, Any]) -> bool:
+        """
+        Same stage: swap the tenant's extractor (compiled only if the slot config is new).
+        """
+        typed = _typed_config(cfg)
+        if handle.provider_names != [typed.provider_name]:
+            return False
+
+        provider = app.services.get_provider(typed.provider_name)
+        if not isinstance(provider, SlotFillingResolver):
+            return False
+        if provider.inner is not app.services.get_provider(typed.intent_provider):
+            return False
+
+        provider.set_tenant_slots(handle.tenant_id, typed.slots)
+        return True
+
+    def detach(self, app: CoreApp, handle: ModuleHandle) -> None:
+        for name in handle.provider_names:
+            provider = app.services.get_provider(name)
+            if isinstance(provider, SlotFillingResolver):
+                provider.drop_tenant(handle.tenant_id)
+
+
+def _provider(app: CoreApp, typed: IntentSlotsModuleConfig) -> SlotFillingResolver:
+    provider = app.services.get_provider(typed.provider_name)
+    inner = app.services.get_provider(typed.intent_provider)
+    if inner is None:
+        raise ValueError(f"Intent provider is not registered: {typed.intent_provider}")
+    if isinstance(provider, SlotFillingResolver):
+        if provider.inner is inner:
+            return provider
+        # intent provider was replaced: keep other tenants' slot configs
+        provider = provider.rewrap(inner)
+    else:
+        provider = SlotFillingResolver(inner, provider_name=typed.provider_name)
+    app.services.register_provider(typed.provider_name, provider)
+    return provider
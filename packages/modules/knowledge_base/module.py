@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+from core.bootstrap import CoreApp
+from core.modules.contracts import CoreModule, ModuleHandle
+
+from packages.providers.knowledge_bm25.provider import (
+    Bm25KnowledgeResponder,
+    Bm25KnowledgeResponderConfig,
+    KnowledgeArticle,
+)
+
+
+@dataclass(frozen=True)
+class KnowledgeBaseModuleConfig:
+    provider_name: str
+    # article_id -> article
+    articles: Mapping[str, KnowledgeArticle]
+    index_dir: Optional[str] = None
+
+
+def _parse_articles(raw: Mapping[str, Any]) -> Dict[str, KnowledgeArticle]:
+    """
+    Config blob accepts both forms:
+    - "delivery": "Доставка занимает 2-3 дня."
+    - "delivery": {"title": "Доставка", "text": "...", "answer": "..."}
+    """
+    articles: Dict[str, KnowledgeArticle] = {}
+    for article_id, value in raw.items():
+        if isinstance(value, Mapping):
+            articles[str(article_id)] = KnowledgeArticle(
+                text=str(value.get("text", "")),
+                title=str(value.get("title", "")),
+                answer=str(value.get("answer", "")),
+            )
+        else:
+            articles[str(article_id)] = KnowledgeArticle(text=str(value))
+    return articles
+
+
+def _typed_config(cfg: Mapping[str, Any]) -> KnowledgeBaseModuleConfig:
+    index_dir = cfg.get("index_dir")
+    return KnowledgeBaseModuleConfig(
+        provider_name=str(cfg.get("provider_name", "knowledge_bm25_v1")),
+        articles=_parse_articles(cfg.get("articles", {})),
+        index_dir=str(index_dir) if index_dir else None,
+    )
+
+
+class KnowledgeBaseModule(CoreModule):
+    """
+    Per-tenant knowledge articles served by a shared Bm25KnowledgeResponder
+    (one provider instance per provider_name, one index per tenant inside it).
+    """
+
+    module_key = "knowledge_base"
+
+    def attach(self, app: CoreApp, *, tenant_id: str, cfg: Mapping[str, Any]) -> ModuleHandle:
+        typed = _typed_config(cfg)
+        handle = ModuleHandle(module_key=self.module_key, tenant_id=tenant_id)
+
+        # 1) provider instance is shared by tenants (registered once)
+        provider = _provider(app, typed)
+        handle.provider_names.append(typed.provider_name)
+
+        # 2) tenant index: loaded from index_dir if present, then diffed against articles
+        provider.set_articles(tenant_id, typed.articles)
+        return handle
+
+    def reconfigure(self, app: CoreApp, handle: ModuleHandle, cfg: Mapping[str, Any]) -> bool:
+        """
+        Same provider: incremental index update (only changed articles are re-indexed).
+        """
+        typed = _typed_config(cfg)
+        if handle.provider_names != [typed.provider_name]:
+            return False
+
+        provider = app.services.get_provider(typed.provider_name)
+        if not isinstance(provider, Bm25KnowledgeResponder):
+            return False
+
+        provider.set_articles(handle.tenant_id, typed.articles)
+        return True
+
+    def detach(self, app: CoreApp, handle: ModuleHandle) -> None:
+        for name in handle.provider_names:
+            provider = app.services.get_provider(name)
+            if isinstance(provider, Bm25KnowledgeResponder):
+                provider.drop_tenant(handle.tenant_id)
+
+
+def _provider(app: CoreApp, typed: KnowledgeBaseModuleConfig) -> Bm25KnowledgeResponder:
+    provider = app.services.get_provider(typed.provider_name)
+    if isinstance(provider, Bm25KnowledgeResponder):
+        return provider
+
+    provider = Bm25KnowledgeResponder(
+        Bm25KnowledgeResponderConfig(index_dir=typed.index_dir),
+        provider_name=typed.provider_name,
+    )
+    app.services.register_provider(typed.provider_name, provider)
+    return provider
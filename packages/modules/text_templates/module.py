@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Sequence, Tuple
 
 from core.bootstrap import CoreApp
 from core.events.types import Subscription
@@ -15,6 +15,41 @@ class TextTemplatesModuleConfig:
     provider_name: str
     templates: Mapping[str, str]
 
+    # template_key -> locale -> source
+    localized: Mapping[str, Mapping[str, str]] = field(default_factory=dict)
+    # locale -> fallback locales, e.g. {"uk": ["ru"]}
+    fallbacks: Mapping[str, Sequence[str]] = field(default_factory=dict)
+    default_locale: str = "ru"
+
+
+def _split_templates(
+    raw: Mapping[str, Any],
+) -> Tuple[Dict[str, str], Dict[str, Dict[str, str]]]:
+    """
+    Config blob accepts both forms:
+    - "hello": "Привет!"                          (locale-independent)
+    - "hello": {"ru": "Привет!", "en": "Hi!"}     (per locale)
+    """
+    plain: Dict[str, str] = {}
+    localized: Dict[str, Dict[str, str]] = {}
+    for key, value in raw.items():
+        if isinstance(value, Mapping):
+            localized[key] = {str(loc): str(src) for loc, src in value.items()}
+        else:
+            plain[key] = str(value)
+    return plain, localized
+
+
+def _typed_config(cfg: Mapping[str, Any]) -> TextTemplatesModuleConfig:
+    plain, localized = _split_templates(cfg.get("templates", {}))
+    return TextTemplatesModuleConfig(
+        provider_name=str(cfg.get("provider_name", "jinja2_v1")),
+        templates=plain,
+        localized=localized,
+        fallbacks={str(k): [str(x) for x in v] for k, v in dict(cfg.get("fallbacks", {})).items()},
+        default_locale=str(cfg.get("default_locale", "ru")),
+    )
+
 
 async def _log_service_event(event) -> None:
     print("[module:text_templates]", event.name, event.payload)
@@ -24,31 +59,52 @@ class TextTemplatesModule(CoreModule):
     module_key = "text_templates"
 
     def attach(self, app: CoreApp, *, tenant_id: str, cfg: Mapping[str, Any]) -> ModuleHandle:
-        typed = TextTemplatesModuleConfig(
-            provider_name=str(cfg.get("provider_name", "jinja2_v1")),
-            templates=dict(cfg.get("templates", {})),
-        )
+        typed = _typed_config(cfg)
 
         handle = ModuleHandle(module_key=self.module_key, tenant_id=tenant_id)
 
-        # 1) register provider instance
+        # 1) register provider instance (locale index is built here, once per attach)
         provider = Jinja2TextComposer(
-            Jinja2TextComposerConfig(templates=typed.templates),
+            Jinja2TextComposerConfig(
+                templates=typed.templates,
+                localized=typed.localized,
+                fallbacks=typed.fallbacks,
+                default_locale=typed.default_locale,
+            ),
             provider_name=typed.provider_name,
         )
         app.services.register_provider(typed.provider_name, provider)
         handle.provider_names.append(typed.provider_name)
 
-        # 2) module subscriptions (optional)
-        s1 = Subscription(name="service.text_compose.ok", handler=_log_service_event, priority=50)
-        s2 = Subscription(name="service.text_compose.error", handler=_log_service_event, priority=50)
+        # 2) module subscriptions (optional): every text_compose status
+        s1 = Subscription(name="service.text_compose.*", handler=_log_service_event, priority=50)
 
         app.bus.subscribe(s1)
-        app.bus.subscribe(s2)
 
-        handle.subscriptions.extend([s1, s2])
+        handle.subscriptions.append(s1)
         return handle
 
+    def reconfigure(self, app: CoreApp, handle: ModuleHandle, cfg: Mapping[str, Any]) -> bool:
+        """
+        Same provider name: swap templates in the running provider
+        (no new Environment, subscriptions stay). Otherwise -> reattach.
+        """
+        typed = _typed_config(cfg)
+        if handle.provider_names != [typed.provider_name]:
+            return False
+
+        provider = app.services.get_provider(typed.provider_name)
+        if not isinstance(provider, Jinja2TextComposer):
+            return False
+
+        provider.update_templates(
+            templates=typed.templates,
+            localized=typed.localized,
+            fallbacks=typed.fallbacks,
+            default_locale=typed.default_locale,
+        )
+        return True
+
     def detach(self, app: CoreApp, handle: ModuleHandle) -> None:
         for sub in handle.subscriptions:
             app.bus.unsubscribe(sub.name, sub.handler)
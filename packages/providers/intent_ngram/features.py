@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import zlib
+from typing import Tuple
+
+import numpy as np
+
+# sparse feature vector: (sorted unique column indices int64, L2-normalized float32 values)
+SparseVector = Tuple[np.ndarray, np.ndarray]
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercase, "ё" -> "е", collapse whitespace.
+    """
+    return " ".join(text.lower().replace("ё", "е").split())
+
+
+class HashedNgramFeaturizer:
+    """
+    Character n-grams hashed into a fixed number of columns (hashing trick).
+
+    - text is padded with spaces, so word boundaries are features too
+    - crc32 based: same columns in every process (no PYTHONHASHSEED dependency)
+    - signed hashing: colliding n-grams partly cancel instead of adding up
+    """
+
+    def __init__(self, *, dim: int = 4096, ngram_min: int = 2, ngram_max: int = 4) -> None:
+        if dim <= 0 or ngram_min <= 0 or ngram_max < ngram_min:
+            raise ValueError("Invalid featurizer parameters")
+        self.dim = dim
+        self._ngram_min = ngram_min
+        self._ngram_max = ngram_max
+
+    def sparse(self, text: str) -> SparseVector:
+        padded = f" {normalize_text(text)} "
+        hashes = [
+            zlib.crc32(padded[i:i + n].encode("utf-8"))
+            for n in range(self._ngram_min, self._ngram_max + 1)
+            for i in range(len(padded) - n + 1)
+        ]
+        if not hashes:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        h = np.asarray(hashes, dtype=np.int64)
+        signs = np.where(h & 0x80000000, -1.0, 1.0)
+        cols, inverse = np.unique(h % self.dim, return_inverse=True)
+        values = np.bincount(inverse, weights=signs).astype(np.float32)
+
+        norm = float(np.linalg.norm(values))
+        if norm == 0.0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        return cols, values / norm
+
+    def dense(self, text: str) -> np.ndarray:
+        out = np.zeros(self.dim, dtype=np.float32)
+        cols, values = self.sparse(text)
+        out[cols] = values
+        return out
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from core.contracts.results import ErrorInfo, ResultMeta, ServiceResult
+from core.contracts.services import IntentResolveIn, IntentResolveOut, ServiceCall
+
+from .features import HashedNgramFeaturizer
+
+
+@dataclass
+class NgramIntentResolverConfig:
+    # intent -> example utterances
+    intents: Mapping[str, Sequence[str]]
+
+    # hashed feature columns; memory is dim * len(intents) * 4 bytes
+    dim: int = 4096
+    ngram_min: int = 2
+    ngram_max: int = 4
+
+    # below this cosine similarity the fallback intent is returned
+    min_confidence: float = 0.3
+    fallback_intent: str = "unknown"
+
+
+class NgramIntentResolver:
+    """
+    Offline IntentResolver: hashed char n-gram vectors + cosine similarity.
+
+    - every intent is one L2-normalized centroid of its example vectors
+    - matrix is stored transposed (dim x intents): a query only touches the
+      rows of its non-zero n-gram columns, scoring all intents is one
+      (nnz x intents) vector-matrix product
+    - confidence: cosine similarity of the best intent, clipped to [0, 1]
+    """
+
+    def __init__(self, cfg: NgramIntentResolverConfig, provider_name: str = "intent_ngram_v1") -> None:
+        self._cfg = cfg
+        self._provider_name = provider_name
+        self._featurizer = HashedNgramFeaturizer(dim=cfg.dim, ngram_min=cfg.ngram_min, ngram_max=cfg.ngram_max)
+
+        self._labels: List[str] = []
+        columns: List[np.ndarray] = []
+        for intent, examples in cfg.intents.items():
+            centroid = np.zeros(cfg.dim, dtype=np.float32)
+            for example in examples:
+                centroid += self._featurizer.dense(example)
+            norm = float(np.linalg.norm(centroid))
+            if norm == 0.0:
+                continue
+            self._labels.append(intent)
+            columns.append(centroid / norm)
+
+        # (dim, n_intents), C-contiguous: rows of one column index are adjacent
+        self._matrix = (
+            np.ascontiguousarray(np.stack(columns, axis=1))
+            if columns
+            else np.zeros((cfg.dim, 0), dtype=np.float32)
+        )
+
+    @property
+    def intents(self) -> Sequence[str]:
+        return tuple(self._labels)
+
+    def rank(self, text: str, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Top-k (intent, similarity), best first (partial sort, not a full one).
+        """
+        scores = self._scores(text)
+        n = scores.shape[0]
+        if n == 0:
+            return []
+        k = min(k, n)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._labels[i], float(scores[i])) for i in top]
+
+    async def resolve(self, call: ServiceCall, inp: IntentResolveIn) -> ServiceResult[IntentResolveOut]:
+        started = int(time.time() * 1000)
+        try:
+            scores = self._scores(inp.text)
+        except Exception as exc:
+            return self._error(call, started, exc)
+        return self._result(call, started, scores)
+
+    async def resolve_many(
+        self,
+        call: ServiceCall,
+        inputs: Sequence[IntentResolveIn],
+    ) -> list[ServiceResult[IntentResolveOut]]:
+        """
+        Resolve a batch in one go. One result per input, same order;
+        a failing item does not affect the others.
+
+        Items are scored one by one: gathering only each query's rows beats a
+        dense batch product (queries are very sparse, the union of a batch's
+        columns is close to the whole matrix).
+        """
+        started = int(time.time() * 1000)
+        results: list[ServiceResult[IntentResolveOut]] = []
+        for inp in inputs:
+            try:
+                results.append(self._result(call, started, self._scores(inp.text)))
+            except Exception as exc:
+                results.append(self._error(call, started, exc))
+        return results
+
+    def _scores(self, text: str) -> np.ndarray:
+        cols, values = self._featurizer.sparse(text)
+        if cols.size == 0:
+            return np.zeros(self._matrix.shape[1], dtype=np.float32)
+        return values @ self._matrix[cols]
+
+    def _result(self, call: ServiceCall, started: int, scores: np.ndarray) -> ServiceResult[IntentResolveOut]:
+        intent, confidence = self._cfg.fallback_intent, 0.0
+        if scores.shape[0]:
+            best = int(np.argmax(scores))
+            confidence = min(1.0, max(0.0, float(scores[best])))
+            if confidence >= self._cfg.min_confidence:
+                intent = self._labels[best]
+
+        return ServiceResult(
+            status="ok",
+            meta=self._meta(call, started),
+            data=IntentResolveOut(intent=intent, confidence=confidence),
+        )
+
+    def _error(self, call: ServiceCall, started: int, exc: Exception) -> ServiceResult[IntentResolveOut]:
+        return ServiceResult(
+            status="error",
+            meta=self._meta(call, started),
+            error=ErrorInfo(code="resolve_failed", message=str(exc), retryable=False),
+        )
+
+    def _meta(self, call: ServiceCall, started: int) -> ResultMeta:
+        return ResultMeta(
+            request_id=call.request_id,
+            tenant_id=call.tenant_id,
+            trace_id=call.trace_id,
+            started_at_ms=started,
+            finished_at_ms=int(time.time() * 1000),
+            provider_name=self._provider_name,
+            attempt=1,
+            idempotency_key=call.idempotency_key,
+            tags=call.tags,
+        )
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_MAGIC = b"BM25IDX1"
+_ALIGN = 8
+
+
+class BM25Index:
+    """
+    Inverted index with Okapi BM25 scoring.
+
+    Two storage forms:
+    - mutable: term -> {doc slot -> tf} dicts, add()/remove() are incremental
+    - loaded:  CSR-style postings arrays memory-mapped from a file written by
+      save(); search reads only the postings of the query terms. The first
+      add()/remove() converts it to the mutable form.
+    """
+
+    def __init__(self, *, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+
+        # doc slot -> external id / length / version; slots of removed docs are None / 0 / ""
+        self._doc_ids: List[Optional[str]] = []
+        self._doc_lens: List[int] = []
+        self._doc_versions: List[str] = []
+        self._slots: Dict[str, int] = {}
+        self._total_len = 0
+        # doc lengths as float array for scoring, rebuilt after changes
+        self._lens: Optional[np.ndarray] = None
+
+        # mutable form
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._doc_terms: Dict[int, Counter[str]] = {}
+
+        # loaded form: term -> row; postings of row i are [offsets[i], offsets[i + 1])
+        self._terms: Optional[Dict[str, int]] = None
+        self._offsets: Optional[np.ndarray] = None
+        self._post_docs: Optional[np.ndarray] = None
+        self._post_tfs: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._slots
+
+    def doc_ids(self) -> List[str]:
+        return list(self._slots)
+
+    def doc_version(self, doc_id: str) -> Optional[str]:
+        slot = self._slots.get(doc_id)
+        return None if slot is None else self._doc_versions[slot]
+
+    def add(self, doc_id: str, tokens: Sequence[str], *, version: str = "") -> None:
+        """
+        Add or replace a document.
+        version: caller-defined content marker, kept with the doc (and saved).
+        """
+        self._thaw()
+        self._lens = None
+        if doc_id in self._slots:
+            self.remove(doc_id)
+        if len(self._doc_ids) - len(self._slots) > max(1024, len(self._slots)):
+            self._compact()
+
+        slot = len(self._doc_ids)
+        tf = Counter(tokens)
+        self._doc_ids.append(doc_id)
+        self._doc_lens.append(len(tokens))
+        self._doc_versions.append(version)
+        self._slots[doc_id] = slot
+        self._total_len += len(tokens)
+        self._doc_terms[slot] = tf
+        for term, count in tf.items():
+            self._postings.setdefault(term, {})[slot] = count
+
+    def remove(self, doc_id: str) -> bool:
+        self._thaw()
+        self._lens = None
+        slot = self._slots.pop(doc_id, None)
+        if slot is None:
+            return False
+
+        for term in self._doc_terms.pop(slot, {}):
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(slot, None)
+                if not posting:
+                    del self._postings[term]
+        self._total_len -= self._doc_lens[slot]
+        self._doc_ids[slot] = None
+        self._doc_lens[slot] = 0
+        self._doc_versions[slot] = ""
+        return True
+
+    def search(self, tokens: Sequence[str], k: int = 3) -> List[Tuple[str, float]]:
+        """
+        Top-k (doc_id, score), best first. Only documents sharing a term score.
+        """
+        n = len(self._slots)
+        if n == 0 or not tokens:
+            return []
+
+        avgdl = self._total_len / n if self._total_len else 1.0
+        lens = self._lens
+        if lens is None:
+            lens = self._lens = np.asarray(self._doc_lens, dtype=np.float32)
+        scores = np.zeros(len(self._doc_ids), dtype=np.float32)
+        touched = False
+
+        for term, qtf in Counter(tokens).items():
+            posting = self._posting(term)
+            if posting is None:
+                continue
+            docs, tfs = posting
+            df = docs.size
+            idf = np.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1.0 - self.b + self.b * lens[docs] / avgdl)
+            scores[docs] += qtf * idf * tfs * (self.k1 + 1.0) / (tfs + norm)
+            touched = True
+
+        if not touched:
+            return []
+
+        hits = np.flatnonzero(scores > 0)
+        k = min(k, hits.size)
+        top = hits[np.argpartition(-scores[hits], k - 1)[:k]]
+        top = top[np.argsort(-scores[top])]
+        return [(self._doc_ids[i], float(scores[i])) for i in top]  # type: ignore[misc]
+
+    # --- persistence ---
+
+    def save(self, path: str) -> None:
+        """
+        Write the index as one file: magic, header length, JSON header
+        (params, vocabulary, doc ids), then 8-byte aligned arrays
+        (term offsets int64, posting doc slots int32, posting tfs int32,
+        doc lengths int32). Written to a temp file and renamed.
+        """
+        live = [slot for slot, doc_id in enumerate(self._doc_ids) if doc_id is not None]
+        remap = {slot: i for i, slot in enumerate(live)}
+
+        terms: List[str] = []
+        offsets = [0]
+        post_docs: List[int] = []
+        post_tfs: List[int] = []
+        for term in sorted(self._vocabulary()):
+            docs, tfs = self._posting(term)  # type: ignore[misc]
+            order = sorted(zip((remap[int(d)] for d in docs), (int(t) for t in tfs)))
+            terms.append(term)
+            post_docs.extend(d for d, _ in order)
+            post_tfs.extend(t for _, t in order)
+            offsets.append(len(post_docs))
+
+        header = json.dumps(
+            {
+                "k1": self.k1,
+                "b": self.b,
+                "terms": terms,
+                "doc_ids": [self._doc_ids[s] for s in live],
+                "doc_versions": [self._doc_versions[s] for s in live],
+                "postings": len(post_docs),
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        arrays = (
+            np.asarray(offsets, dtype=np.int64),
+            np.asarray(post_docs, dtype=np.int32),
+            np.asarray(post_tfs, dtype=np.int32),
+            np.asarray([self._doc_lens[s] for s in live], dtype=np.int32),
+        )
+
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            for arr in arrays:
+                f.write(b"\0" * (-f.tell() % _ALIGN))
+                f.write(arr.tobytes())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        """
+        Open a saved index; postings stay on disk (np.memmap, read-only).
+        """
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"Not a BM25 index file: {path}")
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_len))
+
+        pos = len(_MAGIC) + 8 + header_len
+        terms: List[str] = header["terms"]
+        doc_ids: List[str] = header["doc_ids"]
+
+        arrays = []
+        for dtype, count in (
+            (np.int64, len(terms) + 1),
+            (np.int32, header["postings"]),
+            (np.int32, header["postings"]),
+            (np.int32, len(doc_ids)),
+        ):
+            pos += -pos % _ALIGN
+            arrays.append(
+                np.memmap(path, dtype=dtype, mode="r", offset=pos, shape=(count,))
+                if count
+                else np.zeros(0, dtype=dtype)
+            )
+            pos += count * np.dtype(dtype).itemsize
+
+        idx = cls(k1=header["k1"], b=header["b"])
+        idx._doc_ids = list(doc_ids)
+        idx._doc_lens = [int(x) for x in arrays[3]]
+        idx._doc_versions = list(header["doc_versions"])
+        idx._slots = {doc_id: i for i, doc_id in enumerate(doc_ids)}
+        idx._total_len = sum(idx._doc_lens)
+        idx._terms = {term: i for i, term in enumerate(terms)}
+        idx._offsets, idx._post_docs, idx._post_tfs = arrays[0], arrays[1], arrays[2]
+        return idx
+
+    # --- internals ---
+
+    def _vocabulary(self) -> Sequence[str]:
+        if self._terms is not None:
+            return list(self._terms)
+        return list(self._postings)
+
+    def _posting(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        if self._terms is not None:
+            row = self._terms.get(term)
+            if row is None:
+                return None
+            assert self._offsets is not None and self._post_docs is not None and self._post_tfs is not None
+            start, end = int(self._offsets[row]), int(self._offsets[row + 1])
+            return self._post_docs[start:end], self._post_tfs[start:end].astype(np.float32)
+
+        posting = self._postings.get(term)
+        if not posting:
+            return None
+        return (
+            np.fromiter(posting.keys(), dtype=np.int64, count=len(posting)),
+            np.fromiter(posting.values(), dtype=np.float32, count=len(posting)),
+        )
+
+    def _compact(self) -> None:
+        """
+        Drop slots of removed documents (mutable form only).
+        """
+        live = [slot for slot, doc_id in enumerate(self._doc_ids) if doc_id is not None]
+        remap = {slot: i for i, slot in enumerate(live)}
+
+        self._doc_ids = [self._doc_ids[s] for s in live]
+        self._doc_lens = [self._doc_lens[s] for s in live]
+        self._doc_versions = [self._doc_versions[s] for s in live]
+        self._slots = {doc_id: i for i, doc_id in enumerate(self._doc_ids)}  # type: ignore[misc]
+        self._doc_terms = {remap[s]: tf for s, tf in self._doc_terms.items()}
+        self._postings = {
+            term: {remap[s]: count for s, count in posting.items()} for term, posting in self._postings.items()
+        }
+
+    def _thaw(self) -> None:
+        """
+        Loaded form -> mutable form (before the first incremental update).
+        """
+        if self._terms is None:
+            return
+        assert self._offsets is not None and self._post_docs is not None and self._post_tfs is not None
+
+        postings: Dict[str, Dict[int, int]] = {}
+        doc_terms: Dict[int, Counter[str]] = {slot: Counter() for slot in range(len(self._doc_ids))}
+        docs = self._post_docs.tolist()
+        tfs = self._post_tfs.tolist()
+        offsets = self._offsets.tolist()
+        for term, row in self._terms.items():
+            posting = postings[term] = {}
+            for j in range(offsets[row], offsets[row + 1]):
+                posting[docs[j]] = tfs[j]
+                doc_terms[docs[j]][term] = tfs[j]
+
+        self._postings = postings
+        self._doc_terms = doc_terms
+        self._terms = self._offsets = self._post_docs = self._post_tfs = None
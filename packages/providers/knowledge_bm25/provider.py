@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Tuple
+
+from core.contracts.results import ErrorInfo, ResultMeta, ServiceResult
+from core.contracts.services import KnowledgeRespondIn, KnowledgeRespondOut, ServiceCall
+
+from .index import BM25Index
+from .tokenize import tokenize
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@dataclass(frozen=True)
+class KnowledgeArticle:
+    text: str
+    title: str = ""
+    # returned to the user; article text when empty
+    answer: str = ""
+
+    def version(self) -> str:
+        blob = "\0".join((self.title, self.text, self.answer)).encode("utf-8")
+        return hashlib.blake2b(blob, digest_size=8).hexdigest()
+
+
+@dataclass
+class Bm25KnowledgeResponderConfig:
+    # directory for per-tenant index files (None: in-memory only)
+    index_dir: Optional[str] = None
+    # number of source ids returned with the answer
+    top_k: int = 3
+    # hits scoring below this are ignored
+    min_score: float = 0.0
+    k1: float = 1.2
+    b: float = 0.75
+
+
+@dataclass
+class _TenantKnowledge:
+    index: BM25Index
+    articles: Dict[str, KnowledgeArticle] = field(default_factory=dict)
+
+
+class Bm25KnowledgeResponder:
+    """
+    Local KnowledgeResponder: per-tenant BM25 inverted index over articles.
+
+    - set_articles() diffs by article content version: only added/changed
+      articles are tokenized, removed ones are dropped from the index
+    - with index_dir the index is saved after each change and, on the next
+      start, memory-mapped from disk instead of rebuilt
+    - respond(): best article's answer + ids of the top-k matching articles
+    """
+
+    def __init__(self, cfg: Bm25KnowledgeResponderConfig, provider_name: str = "knowledge_bm25_v1") -> None:
+        self._cfg = cfg
+        self._provider_name = provider_name
+        self._tenants: Dict[str, _TenantKnowledge] = {}
+
+    def set_articles(self, tenant_id: str, articles: Mapping[str, KnowledgeArticle]) -> Tuple[int, int]:
+        """
+        Bring tenant's index in line with articles. Returns (indexed, removed) counts.
+        """
+        kb = self._tenants.get(tenant_id)
+        if kb is None:
+            kb = self._tenants[tenant_id] = _TenantKnowledge(index=self._open_index(tenant_id))
+
+        index = kb.index
+        indexed = 0
+        for doc_id, article in articles.items():
+            version = article.version()
+            if index.doc_version(doc_id) != version:
+                index.add(doc_id, tokenize(f"{article.title}\n{article.text}"), version=version)
+                indexed += 1
+
+        # also covers docs of an older config loaded from disk
+        stale = [doc_id for doc_id in index.doc_ids() if doc_id not in articles]
+        for doc_id in stale:
+            index.remove(doc_id)
+
+        kb.articles = dict(articles)
+        if indexed or stale:
+            self._save_index(tenant_id, index)
+        return indexed, len(stale)
+
+    def drop_tenant(self, tenant_id: str) -> None:
+        """
+        Forget tenant's index in memory (file on disk is kept for the next start).
+        """
+        self._tenants.pop(tenant_id, None)
+
+    async def respond(self, call: ServiceCall, inp: KnowledgeRespondIn) -> ServiceResult[KnowledgeRespondOut]:
+        started = int(time.time() * 1000)
+        meta = ResultMeta(
+            request_id=call.request_id,
+            tenant_id=call.tenant_id,
+            trace_id=call.trace_id,
+            started_at_ms=started,
+            provider_name=self._provider_name,
+            attempt=1,
+            idempotency_key=call.idempotency_key,
+            tags=call.tags,
+        )
+
+        kb = self._tenants.get(call.tenant_id)
+        try:
+            hits = kb.index.search(tokenize(inp.question), k=self._cfg.top_k) if kb is not None else []
+        except Exception as exc:
+            return ServiceResult(
+                status="error",
+                meta=meta,
+                error=ErrorInfo(code="search_failed", message=str(exc), retryable=False),
+            )
+
+        hits = [(doc_id, score) for doc_id, score in hits if score >= self._cfg.min_score]
+        finished = ResultMeta(**{**meta.__dict__, "finished_at_ms": int(time.time() * 1000)})
+        if not hits or kb is None:
+            return ServiceResult(
+                status="error",
+                meta=finished,
+                error=ErrorInfo(code="answer_not_found", message="No matching knowledge article", retryable=False),
+            )
+
+        best = kb.articles[hits[0][0]]
+        return ServiceResult(
+            status="ok",
+            meta=finished,
+            data=KnowledgeRespondOut(
+                answer_text=best.answer or best.text,
+                sources=[doc_id for doc_id, _ in hits],
+            ),
+        )
+
+    def _index_path(self, tenant_id: str) -> Optional[str]:
+        if self._cfg.index_dir is None:
+            return None
+        return os.path.join(self._cfg.index_dir, f"{_UNSAFE_FILENAME_RE.sub('_', tenant_id)}.bm25")
+
+    def _open_index(self, tenant_id: str) -> BM25Index:
+        path = self._index_path(tenant_id)
+        if path is not None and os.path.exists(path):
+            try:
+                index = BM25Index.load(path)
+                if (index.k1, index.b) == (self._cfg.k1, self._cfg.b):
+                    return index
+            except (OSError, ValueError, KeyError):
+                logger.warning("Cannot load knowledge index path=%s, rebuilding", path)
+        return BM25Index(k1=self._cfg.k1, b=self._cfg.b)
+
+    def _save_index(self, tenant_id: str, index: BM25Index) -> None:
+        path = self._index_path(tenant_id)
+        if path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            index.save(path)
+        except OSError:
+            logger.warning("Cannot save knowledge index path=%s", path)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import re
+from typing import List
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+RU_STOPWORDS = frozenset(
+    "и в во не что он на я с со как а то все она так его но да ты к у же вы за бы по только ее мне было "
+    "вот от меня еще нет о из ему теперь когда даже ну вдруг ли если уже или ни быть был него до вас "
+    "нибудь опять уж вам ведь там потом себя ничего ей может они тут где есть надо ней для мы тебя их "
+    "чем была сам чтоб без будто чего раз тоже себе под будет ж тогда кто этот того потому этого какой "
+    "совсем ним здесь этом один почти мой тем чтобы нее сейчас были куда зачем всех никогда можно при "
+    "наконец два об другой хоть после над больше тот через эти нас про всего них какая много разве три "
+    "эту моя впрочем хорошо свою этой перед иногда лучше чуть том нельзя такой им более всегда конечно "
+    "всю между мой мою мои моих наш ваш это".split()
+)
+
+EN_STOPWORDS = frozenset(
+    "a an the and or but if then else of at by for with about against between into through during before "
+    "after above below to from up down in out on off over under again further once here there when where "
+    "why how all any both each few more most other some such no nor not only own same so than too very "
+    "can will just should now i me my we our you your he him his she her it its they them their what which "
+    "who whom this that these those am is are was were be been being have has had having do does did "
+    "doing please".split()
+)
+
+# longest first
+_RU_SUFFIXES = tuple(
+    sorted(
+        (
+            "иями ями ами ией ием иям ией ого его ому ему ыми ими ой ей ий ый ое ее ая яя ую юю ые ие их ых "
+            "ом ем ам ям ах ях ов ев ию ью ия ья ться тся ешь ете ет ем ишь ите ит им ут ют ат ят ла ло ли "
+            "ть ти а я о е ы и у ю ь й"
+        ).split(),
+        key=len,
+        reverse=True,
+    )
+)
+_EN_SUFFIXES = ("ingly", "edly", "ing", "ies", "ied", "es", "ed", "ly", "s")
+
+
+def _is_cyrillic(ch: str) -> bool:
+    return "Ѐ" <= ch <= "ӿ"
+
+
+def stem_ru(token: str) -> str:
+    """
+    Light suffix stripping (no dictionary): good enough to match word forms
+    like "заказ/заказа/заказом". Stem keeps at least 3 letters.
+    """
+    for suffix in _RU_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            return token[: -len(suffix)]
+    return token
+
+
+def stem_en(token: str) -> str:
+    for suffix in _EN_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            if suffix in ("ies", "ied"):
+                return token[: -len(suffix)] + "y"
+            return token[: -len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercased, stop words removed, stemmed tokens.
+
+    Language rules are picked per token by script (Cyrillic -> ru, Latin -> en),
+    so ru/en articles and questions can be mixed in one index.
+    Digits and other scripts are kept as is.
+    """
+    out: List[str] = []
+    for token in _WORD_RE.findall(text.lower().replace("ё", "е")):
+        if _is_cyrillic(token[0]):
+            if token not in RU_STOPWORDS:
+                out.append(stem_ru(token))
+        elif token.isascii() and token.isalpha():
+            if token not in EN_STOPWORDS:
+                out.append(stem_en(token))
+        else:
+            out.append(token)
+    return out
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class AhoCorasick(Generic[V]):
+    """
+    Multi-pattern exact string matcher: one pass over the text finds every
+    occurrence of every key, independent of the number of keys.
+
+    Keys are matched as given (callers normalize case beforehand).
+    Outputs of suffix states are merged at build time, so matching does not
+    follow dictionary links.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, V]]) -> None:
+        # state -> char -> state; state 0 is the root
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # state -> [(key length, value)] of keys ending in this state
+        self._out: List[List[Tuple[int, V]]] = [[]]
+
+        for key, value in items:
+            if key:
+                self._insert(key, value)
+        self._build()
+
+    def __len__(self) -> int:
+        return sum(len(out) for out in self._out)
+
+    def _insert(self, key: str, value: V) -> None:
+        state = 0
+        for ch in key:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(key), value))
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter(self, text: str) -> Iterator[Tuple[int, int, V]]:
+        """
+        Yields (start, end, value) for all (possibly overlapping) matches.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, value in out[state]:
+                yield i - length + 1, i + 1, value
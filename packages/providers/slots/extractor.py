@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import datetime as dt
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from core.config.hashing import config_hash
+
+from .automaton import AhoCorasick
+
+BUILTIN_SLOTS = ("amount", "phone", "date", "order_id")
+
+_RU_MONTHS = (
+    "январ", "феврал", "март", "апрел", "ма", "июн", "июл", "август", "сентябр", "октябр", "ноябр", "декабр",
+)
+_EN_MONTHS = (
+    "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec",
+)
+_MONTH_WORD = r"(?:январ[яь]|феврал[яь]|марта?|апрел[яь]|ма[яй]|июн[яь]|июл[яь]|августа?|сентябр[яь]|октябр[яь]|ноябр[яь]|декабр[яь]|jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+
+# units that make "d.dd" a decimal quantity rather than a date
+_UNIT = r"(?:кг|г|л|мл|см|мм|км|м|шт|kg|g|l|ml|cm|mm|km|m|pcs|%)"
+
+# leading global inline flags of a tenant pattern, e.g. "(?i)TCK-\d+"
+_LEADING_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+# Built-in slot patterns. Case-insensitive via scoped flags: the combined
+# regex itself is compiled without global flags so tenant patterns keep theirs.
+_BUILTIN_PATTERNS: Dict[str, str] = {
+    "amount": (
+        r"(?i:(?<![\w.,])(?:[$€₽]\s?\d+(?:[.,]\d{1,2})?"
+        r"|\d{1,3}(?:[  ]\d{3})+(?:[.,]\d{1,2})?\s?(?:[$€₽]|руб\w*|р\.|rub\b|usd\b|eur\b|долл\w*|евро\b)"
+        r"|\d+(?:[.,]\d{1,2})?\s?(?:[$€₽]|руб\w*|р\.|rub\b|usd\b|eur\b|долл\w*|евро\b)))"
+    ),
+    "phone": r"(?<![\w+])(?:\+7|8|7)[\s(-]*\d{3}[\s)-]*\d{3}[\s-]*\d{2}[\s-]*\d{2}(?!\d)|\+\d{1,3}(?:[\s()-]*\d){7,12}(?!\d)",
+    "date": (
+        r"(?i:(?<![\w.])(?:\d{4}-\d{2}-\d{2}"
+        r"|\d{1,2}[./]\d{1,2}[./](?:\d{4}|\d{2})"
+        # no year: dd.mm / d.mm only, and not a measurement ("1.50 kg")
+        rf"|\d{{1,2}}\.\d{{2}}(?!\s*{_UNIT}(?!\w))"
+        rf"|\d{{1,2}}\s+{_MONTH_WORD}(?:\s+\d{{4}})?)(?![\w.]))"
+    ),
+    "order_id": r"(?i:(?:заказ\w*|order)\s*(?:№|#|no\.?|номер)?\s*|[№#]\s?)(\d[\d-]{3,19}\d|\d{4,20})(?!\w)",
+}
+
+_RELATIVE_DAYS: Dict[str, Tuple[str, ...]] = {
+    "0": ("сегодня", "today"),
+    "1": ("завтра", "tomorrow"),
+    "2": ("послезавтра", "day after tomorrow"),
+    "-1": ("вчера", "yesterday"),
+}
+
+_CURRENCIES = (
+    ("₽", "RUB"), ("руб", "RUB"), ("р.", "RUB"), ("rub", "RUB"),
+    ("$", "USD"), ("usd", "USD"), ("долл", "USD"),
+    ("€", "EUR"), ("eur", "EUR"), ("евро", "EUR"),
+)
+
+
+def _fold(text: str) -> str:
+    """
+    Lowercase + ё->е with offsets preserved (gazetteer spans index the raw text).
+    """
+    folded = text.lower()
+    if len(folded) != len(text):
+        folded = "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+    return folded.replace("ё", "е")
+
+
+def _scope_flags(pattern: str) -> str:
+    """
+    "(?i)TCK-\\d+" -> "(?i:TCK-\\d+)": global flags are only allowed at the start
+    of the whole regex, so leading ones are scoped to the pattern's own group.
+    """
+    flags = ""
+    m = _LEADING_FLAGS.match(pattern)
+    while m is not None:
+        flags += m.group(1)
+        pattern = pattern[m.end():]
+        m = _LEADING_FLAGS.match(pattern)
+    if not flags:
+        return pattern
+    # a verbose-mode comment must not swallow the closing parenthesis
+    return f"(?{flags}:{pattern}\n)" if "x" in flags else f"(?{flags}:{pattern})"
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _norm_amount(raw: str, today: dt.date) -> Optional[Dict[str, Any]]:
+    lowered = raw.lower()
+    currency = next((code for sign, code in _CURRENCIES if sign in lowered), None)
+    number = re.search(r"\d[\d  ]*(?:[.,]\d{1,2})?", raw)
+    if number is None:
+        return None
+    value = float(number.group(0).replace(" ", "").replace(" ", "").replace(",", "."))
+    return {"value": value, "currency": currency}
+
+
+def _norm_phone(raw: str, today: dt.date) -> Optional[str]:
+    digits = re.sub(r"\D", "", raw)
+    if len(digits) == 11 and digits[0] == "8" and not raw.lstrip().startswith("+"):
+        digits = "7" + digits[1:]
+    return "+" + digits
+
+
+def _month_number(word: str) -> Optional[int]:
+    word = word.lower()
+    for i, prefix in enumerate(_RU_MONTHS):
+        if word.startswith(prefix) and (prefix != "ма" or word in ("мая", "май")):
+            return i + 1
+    for i, prefix in enumerate(_EN_MONTHS):
+        if word.startswith(prefix):
+            return i + 1
+    return None
+
+
+def _norm_date(raw: str, today: dt.date) -> Optional[str]:
+    """
+    ISO date; a missing year is the current one, two-digit years are 20xx.
+    Impossible dates (31.02) are not a match.
+    """
+    try:
+        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", raw):
+            return dt.date.fromisoformat(raw).isoformat()
+        parts = re.split(r"[./\s]+", raw.strip())
+        day = int(parts[0])
+        month = int(parts[1]) if parts[1].isdigit() else _month_number(parts[1])
+        year = int(parts[2]) if len(parts) > 2 else today.year
+        if year < 100:
+            year += 2000
+        if month is None:
+            return None
+        return dt.date(year, month, day).isoformat()
+    except (ValueError, IndexError):
+        return None
+
+
+_BUILTIN_NORMALIZERS: Dict[str, Callable[[str, dt.date], Any]] = {
+    "amount": _norm_amount,
+    "phone": _norm_phone,
+    "date": _norm_date,
+}
+
+
+@dataclass(frozen=True)
+class _RelativeDate:
+    days: int
+
+
+@dataclass(frozen=True)
+class SlotMatch:
+    slot: str
+    value: Any
+    start: int
+    end: int
+    text: str
+
+
+@dataclass(frozen=True)
+class SlotExtractorConfig:
+    # slot -> regex (or list of regexes); the first capturing group, if any, is the value
+    patterns: Mapping[str, Sequence[str]] = field(default_factory=dict)
+    # slot -> canonical value -> synonyms (matched as whole words, case-insensitive)
+    gazetteers: Mapping[str, Mapping[str, Sequence[str]]] = field(default_factory=dict)
+    # enabled built-in slots, see BUILTIN_SLOTS
+    builtins: Sequence[str] = BUILTIN_SLOTS
+
+
+def parse_slot_config(raw: Mapping[str, Any]) -> SlotExtractorConfig:
+    """
+    Config blob:
+      patterns:   {"ticket": "(?i)TCK-\\d+", "sku": ["SKU(\\d+)", "арт\\.?\\s*(\\d+)"]}
+      gazetteers: {"city": {"Москва": ["москва", "мск"], "Санкт-Петербург": ["спб", "питер"]}}
+      builtins:   ["date", "phone"]        (default: all)
+    """
+    patterns: Dict[str, Tuple[str, ...]] = {}
+    for slot, value in dict(raw.get("patterns", {})).items():
+        patterns[str(slot)] = (str(value),) if isinstance(value, str) else tuple(str(p) for p in value)
+
+    gazetteers: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+    for slot, entries in dict(raw.get("gazetteers", {})).items():
+        gazetteers[str(slot)] = {
+            str(canonical): (str(synonyms),) if isinstance(synonyms, str) else tuple(str(s) for s in synonyms)
+            for canonical, synonyms in dict(entries).items()
+        }
+
+    builtins = raw.get("builtins", BUILTIN_SLOTS)
+    unknown = [b for b in builtins if b not in BUILTIN_SLOTS]
+    if unknown:
+        raise ValueError(f"Unknown builtin slots: {unknown}")
+    return SlotExtractorConfig(patterns=patterns, gazetteers=gazetteers, builtins=tuple(builtins))
+
+
+class SlotExtractor:
+    """
+    All slot patterns of one config compiled for a single pass over a message:
+
+    - regex patterns (tenant first, then built-ins) are alternatives of one
+      combined regex with a named group per pattern; finditer scans the text
+      once and lastgroup tells which pattern matched
+    - gazetteer synonyms (and relative dates) are keys of one Aho-Corasick
+      automaton over the case-folded text
+    - overlapping hits: the leftmost wins, then the longest
+
+    Immutable after construction; safe to share between tenants and tasks.
+    """
+
+    def __init__(self, cfg: SlotExtractorConfig) -> None:
+        self._cfg = cfg
+
+        # group name -> (slot, value group index or 0, normalizer)
+        self._groups: Dict[str, Tuple[str, int, Optional[Callable[[str, dt.date], Any]]]] = {}
+        alternatives: List[str] = []
+        group_count = 0
+
+        def add(slot: str, pattern: str, normalizer: Optional[Callable[[str, dt.date], Any]]) -> None:
+            nonlocal group_count
+            pattern = _scope_flags(pattern)
+            try:
+                compiled = re.compile(pattern)
+            except re.error as exc:
+                raise ValueError(f"Bad slot pattern: slot={slot} pattern={pattern!r}: {exc}") from None
+            if compiled.groupindex:
+                raise ValueError(f"Slot pattern must not use named groups: slot={slot} pattern={pattern!r}")
+            name = f"s{len(self._groups)}"
+            alternatives.append(f"(?P<{name}>{pattern})")
+            # in the combined regex our named group comes first, the pattern's own groups follow
+            own = group_count + 1
+            self._groups[name] = (slot, own + 1 if compiled.groups else 0, normalizer)
+            group_count = own + compiled.groups
+
+        for slot, patterns in cfg.patterns.items():
+            for pattern in patterns:
+                add(slot, pattern, None)
+        for slot in BUILTIN_SLOTS:
+            if slot in cfg.builtins:
+                add(slot, _BUILTIN_PATTERNS[slot], _BUILTIN_NORMALIZERS.get(slot))
+
+        try:
+            self._regex = re.compile("|".join(alternatives)) if alternatives else None
+        except re.error as exc:
+            # e.g. an inline flag in the middle of a tenant pattern
+            raise ValueError(f"Slot patterns do not combine: {exc}") from None
+
+        entries: List[Tuple[str, Tuple[str, Any]]] = []
+        for slot, values in cfg.gazetteers.items():
+            for canonical, synonyms in values.items():
+                for key in {canonical, *synonyms}:
+                    entries.append((_fold(key), (slot, canonical)))
+        if "date" in cfg.builtins:
+            for days, words in _RELATIVE_DAYS.items():
+                for word in words:
+                    entries.append((word, ("date", _RelativeDate(int(days)))))
+        self._automaton: Optional[AhoCorasick[Tuple[str, Any]]] = AhoCorasick(entries) if entries else None
+
+    @property
+    def config(self) -> SlotExtractorConfig:
+        return self._cfg
+
+    def matches(self, text: str, *, today: Optional[dt.date] = None) -> List[SlotMatch]:
+        """
+        Non-overlapping slot hits in text order.
+        """
+        today = today or dt.date.today()
+        candidates: List[SlotMatch] = []
+
+        if self._regex is not None:
+            for m in self._regex.finditer(text):
+                slot, value_group, normalizer = self._groups[m.lastgroup]
+                raw = (m.group(value_group) if value_group else None) or m.group(m.lastgroup)
+                value = normalizer(raw, today) if normalizer is not None else raw
+                if value is not None:
+                    candidates.append(SlotMatch(slot, value, m.start(), m.end(), m.group(0)))
+
+        if self._automaton is not None:
+            folded = _fold(text)
+            n = len(folded)
+            for start, end, (slot, value) in self._automaton.iter(folded):
+                if (start > 0 and _is_word_char(folded[start - 1])) or (end < n and _is_word_char(folded[end])):
+                    continue
+                if isinstance(value, _RelativeDate):
+                    value = (today + dt.timedelta(days=value.days)).isoformat()
+                candidates.append(SlotMatch(slot, value, start, end, text[start:end]))
+
+        candidates.sort(key=lambda c: (c.start, c.start - c.end))
+        selected: List[SlotMatch] = []
+        pos = 0
+        for c in candidates:
+            if c.start >= pos:
+                selected.append(c)
+                pos = c.end
+        return selected
+
+    def extract(self, text: str, *, today: Optional[dt.date] = None) -> Dict[str, Any]:
+        """
+        slot -> value of its first occurrence.
+        """
+        slots: Dict[str, Any] = {}
+        for m in self.matches(text, today=today):
+            slots.setdefault(m.slot, m.value)
+        return slots
+
+
+@dataclass
+class SlotExtractorCacheStats:
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
+class SlotExtractorCache:
+    """
+    Compiled extractors keyed by config hash (LRU): tenants with the same slot
+    config share one extractor, and a config push that does not change the slot
+    section does not recompile anything.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, SlotExtractor]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = SlotExtractorCacheStats()
+
+    def get(self, raw: Mapping[str, Any]) -> SlotExtractor:
+        key = config_hash(raw)
+        with self._lock:
+            extractor = self._entries.get(key)
+            if extractor is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return extractor
+            self._stats.misses += 1
+
+        # compiled outside the lock; a concurrent miss of the same key is harmless
+        extractor = SlotExtractor(parse_slot_config(raw))
+        with self._lock:
+            self._entries[key] = extractor
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._stats.size = len(self._entries)
+        return extractor
+
+    def stats(self) -> SlotExtractorCacheStats:
+        with self._lock:
+            return SlotExtractorCacheStats(**self._stats.__dict__)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+from core.contracts.results import ServiceResult
+from core.contracts.services import IntentResolveIn, IntentResolveOut, IntentResolver, ServiceCall
+
+from .extractor import SlotExtractor, SlotExtractorCache
+
+
+class SlotFillingResolver:
+    """
+    IntentResolver pipeline stage: delegates intent detection to the wrapped
+    resolver, then fills IntentResolveOut.slots from the message text.
+
+    - per-tenant slot config, compiled once per distinct config (shared cache)
+    - slots returned by the wrapped resolver win over extracted ones
+    - tenants without slot config get the wrapped result unchanged
+    - error results of the wrapped resolver are passed through
+    """
+
+    def __init__(
+        self,
+        inner: IntentResolver,
+        *,
+        cache: Optional[SlotExtractorCache] = None,
+        provider_name: str = "intent_slots_v1",
+    ) -> None:
+        self._inner = inner
+        self._cache = cache or SlotExtractorCache()
+        self._provider_name = provider_name
+        self._tenants: Dict[str, SlotExtractor] = {}
+
+    @property
+    def inner(self) -> IntentResolver:
+        return self._inner
+
+    def rewrap(self, inner: IntentResolver) -> "SlotFillingResolver":
+        """
+        Same stage (cache, tenant extractors) around another resolver.
+        """
+        stage = SlotFillingResolver(inner, cache=self._cache, provider_name=self._provider_name)
+        stage._tenants = dict(self._tenants)
+        return stage
+
+    def set_tenant_slots(self, tenant_id: str, cfg: Mapping[str, Any]) -> SlotExtractor:
+        """
+        Raises ValueError on a bad pattern or an unknown builtin slot.
+        """
+        extractor = self._cache.get(cfg)
+        self._tenants[tenant_id] = extractor
+        return extractor
+
+    def drop_tenant(self, tenant_id: str) -> None:
+        self._tenants.pop(tenant_id, None)
+
+    async def resolve(self, call: ServiceCall, inp: IntentResolveIn) -> ServiceResult[IntentResolveOut]:
+        res = await self._inner.resolve(call, inp)
+        return self._fill(self._tenants.get(call.tenant_id), res, inp)
+
+    async def resolve_many(
+        self,
+        call: ServiceCall,
+        inputs: Sequence[IntentResolveIn],
+    ) -> list[ServiceResult[IntentResolveOut]]:
+        results = await self._inner.resolve_many(call, inputs)
+        extractor = self._tenants.get(call.tenant_id)
+        return [self._fill(extractor, res, inp) for res, inp in zip(results, inputs)]
+
+    @staticmethod
+    def _fill(
+        extractor: Optional[SlotExtractor],
+        res: ServiceResult[IntentResolveOut],
+        inp: IntentResolveIn,
+    ) -> ServiceResult[IntentResolveOut]:
+        if extractor is None or res.status != "ok" or res.data is None:
+            return res
+        slots = extractor.extract(inp.text)
+        if not slots:
+            return res
+        slots.update(res.data.slots)
+        return replace(res, data=replace(res.data, slots=slots))
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+from jinja2 import Environment, Template
+
+
+@dataclass(frozen=True)
+class TemplateCacheStats:
+    """
+    Snapshot of cache counters (read-only, safe to log/export).
+    """
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    compile_count: int
+    compile_time_ms: float
+
+
+class CompiledTemplateCache:
+    """
+    LRU cache of compiled Jinja2 templates.
+
+    - key: (template_key, source hash); each entry keeps its source and a hit
+      is verified against it, so a hash collision never serves a wrong template
+    - bounded by max_size, least recently used entry is evicted first
+    - counts hits/misses/evictions and total compile time
+    """
+
+    def __init__(self, env: Environment, *, max_size: int = 256) -> None:
+        self._env = env
+        self._max_size = max(1, max_size)
+        # key -> (source, compiled template)
+        self._items: "OrderedDict[Tuple[str, int], Tuple[str, Template]]" = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._compile_count = 0
+        self._compile_time_ms = 0.0
+
+    def get(self, template_key: str, source: str) -> Template:
+        # str hash is computed once per string object and cached by CPython,
+        # and the configured source is usually the very object stored with the
+        # entry, so repeated lookups are O(1) (== only runs for an equal copy)
+        key = (template_key, hash(source))
+
+        entry = self._items.get(key)
+        if entry is not None and (entry[0] is source or entry[0] == source):
+            self._hits += 1
+            self._items.move_to_end(key)
+            return entry[1]
+
+        self._misses += 1
+        return self._compile(key, source)
+
+    def warm_up(self, templates: Iterable[Tuple[str, str]]) -> None:
+        """
+        Compile (template_key, source) pairs upfront.
+        Invalid templates are skipped, they fail on compose with render_failed.
+        """
+        for template_key, source in templates:
+            if not source:
+                continue
+            key = (template_key, hash(source))
+            entry = self._items.get(key)
+            if entry is not None and entry[0] == source:
+                continue
+            try:
+                self._compile(key, source)
+            except Exception:
+                continue
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def stats(self) -> TemplateCacheStats:
+        return TemplateCacheStats(
+            size=len(self._items),
+            max_size=self._max_size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            compile_count=self._compile_count,
+            compile_time_ms=self._compile_time_ms,
+        )
+
+    def _compile(self, key: Tuple[str, int], source: str) -> Template:
+        started = time.perf_counter()
+        tpl = self._env.from_string(source)
+        self._compile_time_ms += (time.perf_counter() - started) * 1000.0
+        self._compile_count += 1
+
+        self._items[key] = (source, tpl)
+        self._items.move_to_end(key)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+            self._evictions += 1
+
+        return tpl
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+# index slot used when requested locale is unknown to the index
+ANY_LOCALE = ""
+
+TemplateIndex = Dict[Tuple[str, str], str]
+
+
+def fallback_chain(locale: str, fallbacks: Mapping[str, Sequence[str]]) -> List[str]:
+    """
+    Expand locale fallbacks transitively, e.g. uk -> ru -> en.
+    Cycles and duplicates are ignored.
+    """
+    chain: List[str] = []
+    pending = [locale]
+    while pending:
+        loc = pending.pop(0)
+        if loc in chain:
+            continue
+        chain.append(loc)
+        pending.extend(fallbacks.get(loc, ()))
+    return chain
+
+
+def build_template_index(
+    *,
+    templates: Mapping[str, str],
+    localized: Mapping[str, Mapping[str, str]],
+    fallbacks: Mapping[str, Sequence[str]],
+    default_locale: str,
+) -> TemplateIndex:
+    """
+    Precompute (template_key, locale) -> source.
+
+    Resolution order for a locale:
+    - explicit locale and its fallback chain (localized sources)
+    - locale-independent source from `templates`
+    - default_locale source
+
+    (template_key, ANY_LOCALE) holds the source for locales not known to the index.
+    """
+    locales = set(fallbacks) | {default_locale}
+    for per_locale in localized.values():
+        locales.update(per_locale)
+
+    chains = {loc: fallback_chain(loc, fallbacks) for loc in locales}
+
+    index: TemplateIndex = {}
+    for key in set(templates) | set(localized):
+        per_locale = localized.get(key, {})
+        plain = templates.get(key)
+
+        for loc, chain in chains.items():
+            src = _first_source(per_locale, chain) or plain or per_locale.get(default_locale)
+            if src:
+                index[(key, loc)] = src
+
+        any_src = plain or per_locale.get(default_locale)
+        if any_src:
+            index[(key, ANY_LOCALE)] = any_src
+
+    return index
+
+
+def _first_source(per_locale: Mapping[str, str], chain: Sequence[str]) -> str | None:
+    for loc in chain:
+        src = per_locale.get(loc)
+        if src:
+            return src
+    return None
@@ -1,19 +1,34 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
-from typing import Any, Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any, Mapping, Sequence
 
 from jinja2 import Environment, StrictUndefined
 
 from core.contracts.results import ErrorInfo, ResultMeta, ServiceResult
 from core.contracts.services import ServiceCall, TextComposeIn, TextComposeOut
 
+from .cache import CompiledTemplateCache, TemplateCacheStats
+from .locales import ANY_LOCALE, TemplateIndex, build_template_index
+
 
 @dataclass
 class Jinja2TextComposerConfig:
+    # template_key -> source (locale-independent)
     templates: Mapping[str, str]
 
+    # template_key -> locale -> source
+    localized: Mapping[str, Mapping[str, str]] = field(default_factory=dict)
+    # locale -> fallback locales, e.g. {"uk": ["ru"]}
+    fallbacks: Mapping[str, Sequence[str]] = field(default_factory=dict)
+    default_locale: str = "ru"
+
+    # compiled template cache (per provider instance)
+    cache_size: int = 256
+    # compile all configured templates on provider construction
+    warm_up: bool = True
+
 
 class Jinja2TextComposer:
     """
@@ -25,8 +40,64 @@ class Jinja2TextComposer:
         self._cfg = cfg
         self._provider_name = provider_name
         self._env = Environment(undefined=StrictUndefined, autoescape=False)
+        self._cache = CompiledTemplateCache(self._env, max_size=cfg.cache_size)
+
+        self._index = self._build_index(cfg)
+
+    def update_templates(
+        self,
+        *,
+        templates: Mapping[str, str],
+        localized: Mapping[str, Mapping[str, str]],
+        fallbacks: Mapping[str, Sequence[str]],
+        default_locale: str,
+    ) -> None:
+        """
+        Swap template sources in place (same Environment and cache).
+        Compiled templates are keyed by source, so only changed ones are compiled.
+        """
+        cfg = replace(
+            self._cfg,
+            templates=templates,
+            localized=localized,
+            fallbacks=fallbacks,
+            default_locale=default_locale,
+        )
+        # single attribute swap: in-flight compose calls see the old or the new index
+        self._index = self._build_index(cfg)
+        self._cfg = cfg
+
+    def _build_index(self, cfg: Jinja2TextComposerConfig) -> TemplateIndex:
+        # (template_key, locale) -> source, fallbacks resolved once here
+        index = build_template_index(
+            templates=cfg.templates,
+            localized=cfg.localized,
+            fallbacks=cfg.fallbacks,
+            default_locale=cfg.default_locale,
+        )
+
+        if cfg.warm_up:
+            self._cache.warm_up((key, src) for (key, _locale), src in index.items())
+        return index
+
+    def cache_stats(self) -> TemplateCacheStats:
+        return self._cache.stats()
 
     async def compose(self, call: ServiceCall, inp: TextComposeIn) -> ServiceResult[TextComposeOut]:
+        return self._compose_one(call, inp)
+
+    async def compose_many(
+        self,
+        call: ServiceCall,
+        inputs: Sequence[TextComposeIn],
+    ) -> list[ServiceResult[TextComposeOut]]:
+        """
+        Render a batch in one go. Results keep input order, one per item;
+        a failing item does not affect the others.
+        """
+        return [self._compose_one(call, inp) for inp in inputs]
+
+    def _compose_one(self, call: ServiceCall, inp: TextComposeIn) -> ServiceResult[TextComposeOut]:
         started = int(time.time() * 1000)
 
         meta = ResultMeta(
@@ -41,7 +112,9 @@ class Jinja2TextComposer:
         )
 
         try:
-            tpl_src = self._cfg.templates.get(inp.template_key)
+            tpl_src = self._index.get((inp.template_key, inp.locale)) or self._index.get(
+                (inp.template_key, ANY_LOCALE)
+            )
             if not tpl_src:
                 return ServiceResult(
                     status="error",
@@ -53,7 +126,7 @@ class Jinja2TextComposer:
                     ),
                 )
 
-            template = self._env.from_string(tpl_src)
+            template = self._cache.get(inp.template_key, tpl_src)
             text = template.render(**dict(inp.variables))
 
             finished = int(time.time() * 1000)
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+from core.contracts.results import ResultMeta, ServiceResult
+from core.contracts.services import ServiceCall
+from core.middleware.chain import MiddlewareChain
+from core.middleware.types import ServiceOp
+
+
+class LegacyMiddlewareChain:
+    """
+    Previous implementation (recursive call_at + per-layer nxt closures), for comparison.
+    """
+
+    def __init__(self) -> None:
+        self.middlewares = []
+
+    def add(self, mw) -> None:
+        self.middlewares.append(mw)
+
+    async def run(self, op, terminal):
+        async def call_at(i: int):
+            if i >= len(self.middlewares):
+                return await terminal()
+
+            mw = self.middlewares[i]
+
+            async def nxt():
+                return await call_at(i + 1)
+
+            return await mw(op, nxt)
+
+        return await call_at(0)
+
+
+async def passthrough_mw(op, nxt):
+    return await nxt()
+
+
+async def retry_once_mw(op, nxt):
+    res = await nxt()
+    if res.status == "error":
+        return await nxt()
+    return res
+
+
+CALL = ServiceCall(tenant_id="tenant_demo", request_id="req_bench", trace_id="trc_bench")
+OP = ServiceOp(service_key="Bench", op_name="bench", call=CALL)
+RESULT = ServiceResult(status="ok", meta=ResultMeta(request_id="req_bench", tenant_id="tenant_demo", trace_id="trc_bench", started_at_ms=0))
+
+
+async def terminal():
+    return RESULT
+
+
+async def bench(chain, n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        await chain.run(OP, terminal)
+    return (time.perf_counter() - started) / n * 1e9
+
+
+async def check_retry() -> None:
+    calls = {"n": 0}
+
+    async def flaky():
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return ServiceResult(status="error", meta=RESULT.meta)
+        return RESULT
+
+    chain = MiddlewareChain()
+    chain.add(passthrough_mw)
+    chain.add(retry_once_mw)
+    chain.add(passthrough_mw)
+    chain.freeze()
+
+    res = await chain.run(OP, flaky)
+    print("retry check:", res.status, "terminal calls =", calls["n"])
+
+
+async def main() -> None:
+    n = 50_000
+    await check_retry()
+
+    for layers in (0, 3, 10):
+        legacy = LegacyMiddlewareChain()
+        compiled = MiddlewareChain()
+        for _ in range(layers):
+            legacy.add(passthrough_mw)
+            compiled.add(passthrough_mw)
+        compiled.freeze()
+
+        # warm up
+        await bench(legacy, 1000)
+        await bench(compiled, 1000)
+
+        t_legacy = await bench(legacy, n)
+        t_compiled = await bench(compiled, n)
+        print(
+            f"middlewares={layers:>2} legacy={t_legacy:8.0f} ns/call "
+            f"compiled={t_compiled:8.0f} ns/call speedup={t_legacy / t_compiled:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
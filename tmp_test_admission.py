@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+from core.bootstrap import build_core
+from core.contracts.results import ResultMeta, ServiceResult
+from core.middleware.admission_mw import AdmissionController, AdmissionLimits, make_admission_middleware
+from core.middleware.chain import MiddlewareChain
+from core.modules.manager import ModuleManager
+from core.registry.services import ProviderChoice, ServiceBinding
+from core.runtime.config_manager import ConfigManager
+from core.runtime.context import RuntimeContext
+from core.services.executor import ServiceExecutor
+
+
+async def main() -> None:
+    app = build_core()
+
+    admission = AdmissionController(
+        registry=app.services,
+        tenant_default=AdmissionLimits(max_concurrent=10, max_queue=10),
+    )
+    chain = MiddlewareChain()
+    chain.add(make_admission_middleware(admission))
+    executor = ServiceExecutor(bus=app.bus, registry=app.services, chain=chain)
+
+    cm = ConfigManager(app=app, modules=ModuleManager(app=app), admission=admission)
+    cm.apply_tenant_config(
+        tenant_id="tenant_noisy",
+        trace_id="trc_1",
+        request_id="req_1",
+        services={"DemoService": "demo_v1"},
+        modules={},
+        limits={"max_concurrent": 2, "max_queue": 3},
+    )
+    cm.apply_tenant_config(
+        tenant_id="tenant_quiet",
+        trace_id="trc_2",
+        request_id="req_2",
+        services={"DemoService": "demo_v1"},
+        modules={},
+    )
+    await cm.drain()
+
+    async def slow_provider():
+        await asyncio.sleep(0.05)
+        return ServiceResult(status="ok", meta=ResultMeta(request_id="r", tenant_id="t", trace_id="t", started_at_ms=0))
+
+    async def one(tenant_id: str):
+        ctx = RuntimeContext.new(tenant_id=tenant_id, locale="ru")
+        call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+        return await executor.call(service_key="DemoService", call=call, op_name="demo_op", fn=slow_provider)
+
+    started = time.perf_counter()
+    noisy = [asyncio.create_task(one("tenant_noisy")) for _ in range(20)]
+    quiet = await one("tenant_quiet")
+    quiet_ms = (time.perf_counter() - started) * 1000
+    results = await asyncio.gather(*noisy)
+
+    codes = [r.error.code if r.error else r.status for r in results]
+    print("noisy: ok =", codes.count("ok"), "overloaded =", codes.count("overloaded"))
+    print("quiet:", quiet.status, "not delayed by noisy tenant:", quiet_ms < 100)
+
+    # queued noisy calls wait at their tenant gate, not while holding global slots
+    shared = AdmissionController(
+        global_limits=AdmissionLimits(max_concurrent=4, max_queue=50),
+        tenant_default=AdmissionLimits(max_concurrent=10, max_queue=50),
+    )
+    shared.set_tenant_limits("tenant_noisy", AdmissionLimits(max_concurrent=1, max_queue=50))
+    shared_executor = ServiceExecutor(bus=app.bus, registry=app.services, chain=MiddlewareChain([make_admission_middleware(shared)]))
+
+    async def shared_one(tenant_id: str, fn=slow_provider):
+        ctx = RuntimeContext.new(tenant_id=tenant_id, locale="ru")
+        call = ctx.to_service_call(timeout_ms=5000, max_attempts=1)
+        return await shared_executor.call(service_key="DemoService", call=call, op_name="demo_op", fn=fn)
+
+    noisy = [asyncio.create_task(shared_one("tenant_noisy")) for _ in range(10)]
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    quiet = await shared_one("tenant_quiet")
+    quiet_ms = (time.perf_counter() - started) * 1000
+    print("quiet with global limit:", quiet.status, "not queued behind noisy tenant:", quiet_ms < 100)
+    await asyncio.gather(*noisy)
+
+    # lowering a limit holds waiters back until running calls drop below it
+    running = {"now": 0, "peak": 0}
+
+    async def counted():
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.03)
+        running["now"] -= 1
+        return ServiceResult(status="ok", meta=ResultMeta(request_id="r", tenant_id="t", trace_id="t", started_at_ms=0))
+
+    shared = AdmissionController(tenant_default=AdmissionLimits(max_concurrent=4, max_queue=50))
+    shared_executor = ServiceExecutor(bus=app.bus, registry=app.services, chain=MiddlewareChain([make_admission_middleware(shared)]))
+    calls = [asyncio.create_task(shared_one("tenant_quiet", counted)) for _ in range(12)]
+    await asyncio.sleep(0.01)
+    shared.set_tenant_limits("tenant_quiet", AdmissionLimits(max_concurrent=1, max_queue=50))
+    await asyncio.sleep(0.025)                    # first four are done
+    running["peak"] = running["now"]
+    await asyncio.gather(*calls)
+    print("peak concurrency after lowering limit to 1:", running["peak"])
+
+    # multi-provider binding: the gate of the provider actually picked applies
+    per_provider = AdmissionController(
+        registry=app.services,
+        provider_limits={"demo_b": AdmissionLimits(max_concurrent=1, max_queue=50)},
+    )
+    balanced = ServiceExecutor(bus=app.bus, registry=app.services, chain=MiddlewareChain([make_admission_middleware(per_provider)]))
+    app.services.set_tenant_bindings(
+        "tenant_multi",
+        {"DemoService": ServiceBinding(providers=(ProviderChoice("demo_a"), ProviderChoice("demo_b")))},
+    )
+    in_flight = {"demo_a": 0, "demo_b": 0}
+    peaks = {"demo_a": 0, "demo_b": 0}
+
+    class Counted:
+        def __init__(self, name):
+            self.name = name
+
+        async def run(self):
+            in_flight[self.name] += 1
+            peaks[self.name] = max(peaks[self.name], in_flight[self.name])
+            await asyncio.sleep(0.02)
+            in_flight[self.name] -= 1
+            return ServiceResult(status="ok", meta=ResultMeta(request_id="r", tenant_id="t", trace_id="t", started_at_ms=0))
+
+    app.services.register_provider("demo_a", Counted("demo_a"))
+    app.services.register_provider("demo_b", Counted("demo_b"))
+
+    async def multi_one():
+        call = RuntimeContext.new(tenant_id="tenant_multi", locale="ru").to_service_call(timeout_ms=5000, max_attempts=1)
+        return await balanced.call(service_key="DemoService", call=call, op_name="demo_op", invoke=lambda p: p.run())
+
+    results = await asyncio.gather(*(multi_one() for _ in range(20)))
+    print("multi-provider peaks:", peaks, "all ok:", all(r.status == "ok" for r in results))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
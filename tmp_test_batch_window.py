@@ -0,0 +1,153 @@
+import asyncio
+import time
+
+from core.bootstrap import build_core
+from core.contracts.results import ResultMeta, ServiceResult
+from core.contracts.services import IntentResolveIn, IntentResolveOut, IntentResolver
+from core.events.types import Subscription
+from core.registry.services import ServiceBinding, service_key
+from core.runtime.context import RuntimeContext
+from core.services.batching import BatchWindow
+from core.services.executor import ServiceExecutor
+
+
+class RemoteResolver:
+    """
+    Intent resolver with a fixed per-call overhead (network round trip) and a
+    small per-item cost.
+    """
+
+    def __init__(self, name: str, *, overhead: float = 0.005, per_item: float = 0.0001):
+        self.name = name
+        self.overhead = overhead
+        self.per_item = per_item
+        self.calls = 0
+
+    def _one(self, call, inp) -> ServiceResult[IntentResolveOut]:
+        meta = ResultMeta(
+            request_id=call.request_id, tenant_id=call.tenant_id, trace_id=call.trace_id,
+            started_at_ms=int(time.time() * 1000), provider_name=self.name,
+        )
+        intent = "order_status" if "заказ" in inp.text else "unknown"
+        return ServiceResult(status="ok", meta=meta, data=IntentResolveOut(intent=intent, confidence=0.9))
+
+    async def resolve(self, call, inp):
+        self.calls += 1
+        await asyncio.sleep(self.overhead + self.per_item)
+        return self._one(call, inp)
+
+    async def resolve_many(self, call, inputs):
+        self.calls += 1
+        await asyncio.sleep(self.overhead + self.per_item * len(inputs))
+        return [self._one(call, inp) for inp in inputs]
+
+
+class SingleOnlyResolver(RemoteResolver):
+    resolve_many = None  # no batch method declared
+
+
+async def main() -> None:
+    app = build_core()
+    events = []
+
+    async def on_event(event):
+        events.append((event.name, event.payload.get("batch_size"), event.payload.get("count")))
+
+    app.bus.subscribe(Subscription(name="service.intent_resolve.*", handler=on_event, priority=10))
+    executor = ServiceExecutor(bus=app.bus, registry=app.services)
+
+    remote = RemoteResolver("nlu_remote")
+    app.services.register_provider("nlu_remote", remote)
+    app.services.register_provider("nlu_single", SingleOnlyResolver("nlu_single"))
+    key = service_key(IntentResolver)
+    for tenant in ("t1", "t2"):
+        app.services.set_tenant_bindings(tenant, {key: ServiceBinding(provider="nlu_remote")})
+    app.services.set_tenant_bindings("t3", {key: ServiceBinding(provider="nlu_single")})
+
+    batcher = executor.batcher(
+        service_key=key,
+        op_name="intent_resolve",
+        batch_method="resolve_many",
+        single_method="resolve",
+        window=BatchWindow(max_items=64, max_delay_ms=2),
+    )
+
+    async def handle(tenant: str, i: int):
+        call = RuntimeContext.new(tenant_id=tenant).to_service_call(timeout_ms=1000, max_attempts=1)
+        text = f"где заказ {i}" if i % 2 else f"привет {i}"
+        res = await batcher.submit(call, IntentResolveIn(text=text, locale="ru"))
+        assert res.meta.request_id == call.request_id
+        return res
+
+    # 1) concurrent handlers of two tenants: per-tenant batches, per-item results
+    results = await asyncio.gather(*(handle("t1" if i % 3 else "t2", i) for i in range(100)))
+    print("intents:", [r.data.intent for r in results[:4]], "provider calls:", remote.calls)
+    print("stats:", batcher.stats())
+    await asyncio.sleep(0)
+    print("events:", sorted(set(events)))
+
+    # 2) provider without resolve_many: one by one through call()
+    results = await asyncio.gather(*(handle("t3", i) for i in range(5)))
+    print("single-only:", [r.status for r in results], "unbatched:", batcher.stats().unbatched)
+
+    # 3) a caller that gives up before the flush is not sent
+    slow = executor.batcher(
+        service_key=key, op_name="intent_resolve", batch_method="resolve_many",
+        window=BatchWindow(max_items=100, max_delay_ms=50),
+    )
+    calls_before = remote.calls
+    call = RuntimeContext.new(tenant_id="t1").to_service_call(timeout_ms=1000, max_attempts=1)
+    waiter = asyncio.ensure_future(slow.submit(call, IntentResolveIn(text="где заказ", locale="ru")))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    await asyncio.sleep(0.06)
+    await slow.drain()
+    print("cancelled before flush -> provider not called:", remote.calls == calls_before)
+
+    # 3b) batch cancelled mid-flight (shutdown): its callers are not left hanging
+    remote.overhead = 1.0
+    closing = executor.batcher(
+        service_key=key, op_name="intent_resolve", batch_method="resolve_many",
+        window=BatchWindow(max_items=100, max_delay_ms=1),
+    )
+    waiters = [
+        asyncio.ensure_future(closing.submit(
+            RuntimeContext.new(tenant_id="t1").to_service_call(timeout_ms=5000, max_attempts=1),
+            IntentResolveIn(text="где заказ", locale="ru"),
+        ))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.02)                     # flushed, provider call in flight
+    await closing.close()
+    outcome = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), timeout=0.5)
+    print("cancelled mid-batch -> callers released:", [type(o).__name__ for o in outcome])
+    remote.overhead = 0.005
+
+    # 4) throughput: 2000 concurrent messages, batched vs one call each
+    n = 2_000
+    remote.calls = 0
+    t0 = time.perf_counter()
+    await asyncio.gather(*(handle("t1", i) for i in range(n)))
+    batched = time.perf_counter() - t0
+    batched_calls = remote.calls
+
+    remote.calls = 0
+    sem = asyncio.Semaphore(64)  # same concurrency towards the provider as one batch
+
+    async def direct(i: int):
+        call = RuntimeContext.new(tenant_id="t1").to_service_call(timeout_ms=5000, max_attempts=1)
+        async with sem:
+            return await executor.call(
+                call=call, op_name="intent_resolve", service_key=key,
+                invoke=lambda p: p.resolve(call, IntentResolveIn(text=f"где заказ {i}", locale="ru")),
+            )
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(direct(i) for i in range(n)))
+    single = time.perf_counter() - t0
+    print(f"{n} msgs: batched {batched * 1000:.0f} ms in {batched_calls} provider calls, "
+          f"single {single * 1000:.0f} ms in {remote.calls} calls")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+import asyncio
+
+from core.bootstrap import build_core
+from core.config.cached_store import CachedTenantConfigStore
+from core.config.loader import TenantConfig, TenantNotFound
+from core.modules.manager import ModuleManager
+from core.runtime.config_manager import ConfigManager
+
+from packages.modules.text_templates.module import TextTemplatesModule
+
+
+class SlowBackingStore:
+    def __init__(self) -> None:
+        self.fetches = 0
+        self.greeting = "Привет!"
+
+    async def get_tenant_config(self, tenant_id: str) -> TenantConfig:
+        self.fetches += 1
+        await asyncio.sleep(0.02)
+        if tenant_id.startswith("ghost"):
+            raise TenantNotFound(tenant_id)
+        return TenantConfig(
+            tenant_id=tenant_id,
+            services={"TextComposer": f"jinja2_{tenant_id}"},
+            modules={"text_templates": {"provider_name": f"jinja2_{tenant_id}", "templates": {"hello": self.greeting}}},
+        )
+
+
+async def main() -> None:
+    app = build_core()
+    mm = ModuleManager(app=app)
+    mm.register(TextTemplatesModule())
+
+    backing = SlowBackingStore()
+    store = CachedTenantConfigStore(backing, ttl_seconds=0.1, stale_seconds=0.5, negative_ttl_seconds=1, max_tenants=2)
+    cm = ConfigManager(app=app, modules=mm, store=store)
+
+    # cold tenant, 50 concurrent requests -> one fetch
+    await asyncio.gather(*(cm.ensure_tenant("t1", trace_id="trc", request_id=f"r{i}") for i in range(50)))
+    print("coalesced fetches:", backing.fetches, "bound:", app.services.bound_provider_name("t1", "TextComposer"))
+
+    # negative caching
+    for _ in range(3):
+        try:
+            await store.get_tenant_config("ghost_1")
+        except TenantNotFound:
+            pass
+    print("fetches after 3 unknown lookups:", backing.fetches)
+
+    # stale-while-revalidate: stale value is returned at once, refresh runs in background
+    backing.greeting = "Здравствуйте!"
+    await asyncio.sleep(0.15)
+    cfg = await cm.ensure_tenant("t1", trace_id="trc", request_id="r_stale")
+    print("stale served:", cfg.modules["text_templates"]["templates"]["hello"])
+    await asyncio.sleep(0.05)
+    cfg = await cm.ensure_tenant("t1", trace_id="trc", request_id="r_fresh")
+    print("refreshed:", cfg.modules["text_templates"]["templates"]["hello"])
+
+    # LRU bound: third tenant evicts the least recently used one and unloads it
+    await cm.ensure_tenant("t2", trace_id="trc", request_id="r_t2")
+    await cm.ensure_tenant("t3", trace_id="trc", request_id="r_t3")
+    print("t1 after eviction:", app.services.bound_provider_name("t1", "TextComposer"))
+    print("t3 bound:", app.services.bound_provider_name("t3", "TextComposer"))
+    print("stats:", store.stats())
+    print("providers resident:", sorted(app.services.snapshot().providers))
+
+    # many cold tenants: only the LRU-bounded ones keep providers
+    for i in range(200):
+        await cm.ensure_tenant(f"cold_{i}", trace_id="trc", request_id=f"r_cold_{i}")
+    bound = sum(1 for i in range(200) if app.services.bound_provider_name(f"cold_{i}", "TextComposer"))
+    print("after 200 tenants: bound", bound, "providers", len(app.services.snapshot().providers))
+    await cm.drain()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
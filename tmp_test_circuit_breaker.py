@@ -0,0 +1,127 @@
+import asyncio
+
+from core.bootstrap import build_core
+from core.contracts.results import ErrorInfo, ResultMeta, ServiceResult
+from core.events.types import Subscription
+from core.middleware.chain import MiddlewareChain
+from core.registry.services import ProviderChoice, ServiceBinding
+from core.runtime.context import RuntimeContext
+from core.services.executor import ServiceExecutor
+from core.services.resilience import BreakerConfig, RetryPolicy
+
+
+async def log_breaker_event(event):
+    print("[breaker]", event.name, event.payload)
+
+
+async def main() -> None:
+    app = build_core()
+    app.bus.subscribe(Subscription(name="service.breaker.*", handler=log_breaker_event, priority=10))
+
+    executor = ServiceExecutor(
+        bus=app.bus,
+        registry=app.services,
+        breaker=BreakerConfig(failure_threshold=3, open_seconds=0.2),
+        retry=RetryPolicy(base_delay_ms=10, max_delay_ms=50, budget_initial_tokens=2),
+    )
+
+    tenant_id = "tenant_demo"
+    app.services.set_tenant_bindings(tenant_id, {"DemoService": ServiceBinding(provider="flaky_v1")})
+
+    provider_calls = {"n": 0}
+    healthy = {"ok": False}
+
+    async def flaky():
+        provider_calls["n"] += 1
+        if not healthy["ok"]:
+            raise RuntimeError("provider down")
+        return ServiceResult(status="ok", meta=ResultMeta(request_id="r", tenant_id=tenant_id, trace_id="t", started_at_ms=0, provider_name="flaky_v1"))
+
+    async def one():
+        ctx = RuntimeContext.new(tenant_id=tenant_id, locale="ru")
+        call = ctx.to_service_call(timeout_ms=1000, max_attempts=3)
+        return await executor.call(service_key="DemoService", call=call, op_name="demo_op", fn=flaky)
+
+    codes = []
+    for _ in range(5):
+        res = await one()
+        codes.append(res.error.code if res.error else res.status)
+    print("while failing:", codes, "provider calls:", provider_calls["n"])
+
+    await asyncio.sleep(0.25)
+    healthy["ok"] = True
+    res = await one()
+    print("after recovery:", res.status, "provider calls:", provider_calls["n"])
+
+    # half-open probe cancelled by the caller: slot is freed, next call probes again
+    reject = {"on": False}
+
+    async def gate_mw(op, nxt):
+        if reject["on"]:
+            meta = ResultMeta(request_id="r", tenant_id=tenant_id, trace_id="t", started_at_ms=0)
+            return ServiceResult(status="error", meta=meta, error=ErrorInfo(code="overloaded", message="busy", retryable=True))
+        return await nxt()
+
+    strict = ServiceExecutor(
+        bus=app.bus,
+        registry=app.services,
+        chain=MiddlewareChain([gate_mw]),
+        breaker=BreakerConfig(failure_threshold=1, open_seconds=0.05),
+        retry=RetryPolicy(base_delay_ms=0, budget_initial_tokens=0),
+    )
+
+    async def strict_call(fn):
+        ctx = RuntimeContext.new(tenant_id=tenant_id, locale="ru")
+        call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+        return await strict.call(service_key="DemoService", call=call, op_name="demo_op", fn=fn)
+
+    healthy["ok"] = False
+    await strict_call(flaky)                      # opens
+    await asyncio.sleep(0.06)
+
+    async def hanging():
+        await asyncio.sleep(10)
+
+    probe = asyncio.ensure_future(strict_call(hanging))
+    await asyncio.sleep(0.01)
+    probe.cancel()
+    await asyncio.gather(probe, return_exceptions=True)
+    healthy["ok"] = True
+    res = await strict_call(flaky)
+    print("after cancelled probe:", res.status)
+
+    # core short-circuit while half-open does not close the breaker
+    healthy["ok"] = False
+    await strict_call(flaky)                      # opens again
+    await asyncio.sleep(0.06)
+    reject["on"] = True
+    res = await strict_call(flaky)
+    reject["on"] = False
+    print("half-open + overloaded:", res.error.code)
+    res = await strict_call(flaky)                # real probe: provider still down -> open
+    res = await strict_call(flaky)
+    print("provider still down:", res.error.code)
+
+    # fn mode with a multi-provider binding: health is keyed by the provider the caller names
+    app.services.set_tenant_bindings(
+        tenant_id,
+        {"DemoService": ServiceBinding(providers=(ProviderChoice("nlu_a"), ProviderChoice("nlu_b")))},
+    )
+
+    async def named_call(name, fn):
+        ctx = RuntimeContext.new(tenant_id=tenant_id, locale="ru")
+        call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+        return await strict.call(service_key="DemoService", call=call, op_name="demo_op", fn=fn, provider_name=name)
+
+    async def down():
+        raise RuntimeError("provider down")
+
+    async def up():
+        return ServiceResult(status="ok", meta=ResultMeta(request_id="r", tenant_id=tenant_id, trace_id="t", started_at_ms=0))
+
+    await named_call("nlu_b", down)                # opens nlu_b only
+    print("named: b", (await named_call("nlu_b", up)).error.code, "| a", (await named_call("nlu_a", up)).status)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+import asyncio
+
+from core.bootstrap import build_core
+from core.contracts.services import TextComposer, TextComposeIn
+from core.events.types import Subscription
+from core.middleware.chain import MiddlewareChain
+from core.middleware.logging_mw import logging_middleware
+from core.registry.services import ServiceBinding, resolve_typed, service_key
+from core.runtime.context import RuntimeContext
+from core.services.executor import ServiceExecutor
+
+from packages.providers.text_jinja2.provider import Jinja2TextComposer, Jinja2TextComposerConfig
+
+
+async def log_service_event(event):
+    print("[svc-event]", event.name, event.payload)
+
+
+async def main() -> None:
+    app = build_core()
+
+    chain = MiddlewareChain()
+    chain.add(logging_middleware)
+    executor = ServiceExecutor(bus=app.bus, registry=app.services, chain=chain)
+
+    app.bus.subscribe(Subscription(name="service.text_compose.ok", handler=log_service_event, priority=10))
+    app.bus.subscribe(Subscription(name="service.text_compose.error", handler=log_service_event, priority=10))
+
+    provider = Jinja2TextComposer(
+        Jinja2TextComposerConfig(templates={"hello": "Привет, {{ name }}!"}),
+        provider_name="jinja2_v1",
+    )
+    app.services.register_provider("jinja2_v1", provider)
+
+    tenant_id = "tenant_demo"
+    app.services.set_tenant_bindings(tenant_id, {service_key(TextComposer): ServiceBinding(provider="jinja2_v1")})
+
+    svc = resolve_typed(app.services, tenant_id, TextComposer)
+
+    ctx = RuntimeContext.new(tenant_id=tenant_id, locale="ru")
+    call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+
+    # 1000 recipients + one item with missing variable
+    inputs = [TextComposeIn(locale="ru", template_key="hello", variables={"name": f"user{i}"}) for i in range(1000)]
+    inputs.append(TextComposeIn(locale="ru", template_key="hello", variables={}))
+
+    results = await executor.call_many(
+        service_key=service_key(TextComposer),
+        call=call,
+        op_name="text_compose",
+        size=len(inputs),
+        fn=lambda: svc.compose_many(call, inputs),
+    )
+
+    print("results:", len(results))
+    print("first:", results[0].status, results[0].data.text if results[0].data else None)
+    print("last:", results[-1].status, results[-1].error.code if results[-1].error else None)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
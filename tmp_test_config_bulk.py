@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+from core.bootstrap import build_core
+from core.config.loader import TenantConfig
+from core.events.types import Subscription
+from core.modules.manager import ModuleManager
+from core.runtime.config_manager import ConfigManager
+
+from packages.modules.text_templates.module import TextTemplatesModule
+
+
+def configs(n: int, greeting: str):
+    return [
+        TenantConfig(
+            tenant_id=f"tenant_{i}",
+            services={"TextComposer": f"jinja2_t{i}"},
+            modules={"text_templates": {"provider_name": f"jinja2_t{i}", "templates": {"hello": greeting}}},
+            limits={"max_concurrent": 10},
+        )
+        for i in range(n)
+    ]
+
+
+async def main() -> None:
+    app = build_core()
+    mm = ModuleManager(app=app)
+    mm.register(TextTemplatesModule())
+    cm = ConfigManager(app=app, modules=mm)
+
+    seen = []
+
+    async def on_bulk(event):
+        seen.append((event.name, len(event.payload["tenants"]), event.payload["unchanged"]))
+
+    async def on_tenant(event):
+        seen.append((event.name, event.tenant_id))
+
+    app.bus.subscribe(Subscription(name="config.bulk_updated", handler=on_bulk))
+    app.bus.subscribe(Subscription(name="config.tenant_updated", handler=on_tenant))
+
+    n = 2_000
+    t0 = time.perf_counter()
+    version_before = app.services.version
+    result = await cm.apply_many(configs(n, "Привет!"), trace_id="trc_1", request_id="req_1")
+    print(f"initial: {len(result.changed)} changed, {result.unchanged} unchanged, "
+          f"version {result.version}, {(time.perf_counter() - t0) * 1000:.0f} ms")
+    # bindings + 2000 module providers in one swap
+    print("single swap:", result.version == version_before + 1 == app.services.version,
+          "providers:", len(app.services.snapshot().providers))
+    print("events:", seen)
+    print("tenant_1999 ->", app.services.bound_provider_name("tenant_1999", "TextComposer"))
+
+    # same push again: nothing to do
+    seen.clear()
+    t0 = time.perf_counter()
+    result = await cm.apply_many(configs(n, "Привет!"), trace_id="trc_2", request_id="req_2")
+    print(f"repeat: {len(result.changed)} changed, {result.unchanged} unchanged, "
+          f"{(time.perf_counter() - t0) * 1000:.0f} ms")
+    print("events:", seen)
+
+    # three tenants changed, per-tenant events paced at 100/s
+    seen.clear()
+    update = configs(n, "Привет!")
+    for i in (1, 2, 3):
+        update[i] = configs(i + 1, "Здравствуйте!")[i]
+    t0 = time.perf_counter()
+    result = await cm.apply_many(
+        update, trace_id="trc_3", request_id="req_3", events="per_tenant", max_events_per_second=100
+    )
+    print(f"partial: {result.changed}, {(time.perf_counter() - t0) * 1000:.0f} ms (paced)")
+    print("events:", seen)
+
+
+def apply_outside_loop() -> None:
+    # startup code: sync apply without a running loop, events delivered once a loop drains
+    app = build_core()
+    cm = ConfigManager(app=app, modules=ModuleManager(app=app))
+    seen = []
+
+    async def on_event(event):
+        seen.append((event.name, event.tenant_id))
+
+    app.bus.subscribe(Subscription(name="config.*", handler=on_event, priority=10))
+    cm.apply_tenant_config(
+        tenant_id="tenant_boot", trace_id="trc_0", request_id="req_0",
+        services={"TextComposer": "jinja2_v1"}, modules={},
+    )
+    print("outside loop: applied =", cm.is_applied("tenant_boot"),
+          app.services.bound_provider_name("tenant_boot", "TextComposer"), "events so far:", seen)
+    try:
+        cm.apply_many([], trace_id="trc_0", request_id="req_0")
+    except RuntimeError as exc:
+        print("apply_many outside loop:", exc)
+    asyncio.run(cm.drain())
+    print("after drain:", seen)
+
+
+if __name__ == "__main__":
+    apply_outside_loop()
+    asyncio.run(main())
@@ -107,6 +107,7 @@ async def main() -> None:
         print("unexpected: TextComposer still configured")
     except ServiceNotConfigured as exc:
         print("after service disable (expected):", str(exc))
+    print("module provider released:", "jinja2_v1" not in app.services.snapshot().providers)
 
 
 if __name__ == "__main__":
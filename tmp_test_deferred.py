@@ -67,6 +67,9 @@ async def main() -> None:
     )
     print("call result:", res.status, res.ticket_id)
 
+    # webhook side waits for completion instead of polling
+    waiter = asyncio.create_task(executor.wait_deferred(ticket_id, timeout_ms=2000))
+
     # 2) later we complete it
     await asyncio.sleep(0.2)
 
@@ -95,6 +98,12 @@ async def main() -> None:
     cached = await store.get(ticket_id)
     print("stored:", cached.status if cached else None, cached.data if cached else None)
 
+    waited = await waiter
+    print("waited:", waited.status if waited else None, waited is cached)
+
+    many = await store.get_many([ticket_id, "tkt_unknown"])
+    print("get_many:", {k: (v.status if v else None) for k, v in many.items()})
+
 
 if __name__ == "__main__":
     asyncio.run(main())
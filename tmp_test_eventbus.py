@@ -51,6 +51,69 @@ async def main() -> None:
 
     await bus.publish(evt)
 
+    # dispatch modes: two slow concurrent handlers + one background handler
+    async def slow(event: EventEnvelope) -> None:
+        await asyncio.sleep(0.1)
+
+    async def slow_background_fail(event: EventEnvelope) -> None:
+        await asyncio.sleep(0.1)
+        raise RuntimeError("background boom")
+
+    bus.subscribe(Subscription(name="demo.modes", handler=slow, priority=10, mode="concurrent"))
+    bus.subscribe(Subscription(name="demo.modes", handler=handler_ok, priority=10, mode="concurrent"))
+    bus.subscribe(Subscription(name="demo.modes", handler=slow, priority=10, mode="concurrent"))
+    bus.subscribe(Subscription(name="demo.modes", handler=handler_fail, priority=20, mode="concurrent"))
+    bus.subscribe(Subscription(name="demo.modes", handler=slow_background_fail, priority=30, mode="background"))
+
+    started = time.perf_counter()
+    await bus.publish(EventEnvelope(
+        name="demo.modes",
+        kind="domain",
+        tenant_id="tenant_demo",
+        event_id=new_id("evt"),
+        trace_id=new_id("trc"),
+        occurred_at_ms=now_ms(),
+        payload={"x": 2},
+    ))
+    print("publish took < 0.2s:", time.perf_counter() - started < 0.2)
+
+    await bus.drain()
+    print("background drained")
+
+    # wildcard subscriptions
+    async def on_any_error(event: EventEnvelope) -> None:
+        print("[service.*.error] got:", event.name)
+
+    async def on_compose(event: EventEnvelope) -> None:
+        print("[service.text_compose.*] got:", event.name)
+
+    async def on_service(event: EventEnvelope) -> None:
+        print("[service.**] got:", event.name)
+
+    bus.subscribe(Subscription(name="service.*.error", handler=on_any_error, priority=10))
+    bus.subscribe(Subscription(name="service.text_compose.*", handler=on_compose, priority=20))
+    bus.subscribe(Subscription(name="service.**", handler=on_service, priority=30))
+
+    for name in ["service.text_compose.ok", "service.intent_resolve.error", "service.text_compose.error", "config.tenant_updated"]:
+        await bus.publish(EventEnvelope(
+            name=name,
+            kind="service",
+            tenant_id="tenant_demo",
+            event_id=new_id("evt"),
+            trace_id=new_id("trc"),
+            occurred_at_ms=now_ms(),
+        ))
+
+    print("unsubscribed:", bus.unsubscribe("service.*.error", on_any_error))
+    await bus.publish(EventEnvelope(
+        name="service.intent_resolve.error",
+        kind="service",
+        tenant_id="tenant_demo",
+        event_id=new_id("evt"),
+        trace_id=new_id("trc"),
+        occurred_at_ms=now_ms(),
+    ))
+
 
 if __name__ == "__main__":
     asyncio.run(main())
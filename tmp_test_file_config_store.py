@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from core.bootstrap import build_core
+from core.config.file_store import FileTenantConfigStore
+from core.config.loader import TenantNotFound
+from core.modules.manager import ModuleManager
+from core.runtime.config_manager import ConfigManager
+
+
+def tenant(i: int, provider: str = "jinja2_v1") -> dict:
+    return {
+        "tenant_id": f"tenant_{i}",
+        "services": {"TextComposer": provider},
+        "modules": {},
+        "limits": {"max_concurrent": 10},
+    }
+
+
+def write_packed(path: str, n: int, overrides: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(json.dumps(overrides.get(i, tenant(i)), ensure_ascii=False) + "\n")
+
+
+async def main() -> None:
+    n = 50_000
+    with tempfile.TemporaryDirectory() as tmp:
+        packed = os.path.join(tmp, "tenants.jsonl")
+        write_packed(packed, n, {})
+
+        t0 = time.perf_counter()
+        store = FileTenantConfigStore(packed)
+        print(f"cold index ({n} tenants): {(time.perf_counter() - t0) * 1000:.0f} ms")
+        store.close()
+
+        t0 = time.perf_counter()
+        store = FileTenantConfigStore(packed)
+        print(f"warm start (.idx reused): {(time.perf_counter() - t0) * 1000:.0f} ms, tenants: {len(store.tenant_ids())}")
+
+        cfg = await store.get_tenant_config("tenant_49999")
+        print("tenant_49999:", cfg.services, cfg.limits)
+        try:
+            await store.get_tenant_config("nobody")
+        except TenantNotFound:
+            print("unknown tenant -> TenantNotFound")
+
+        # watcher pushes only changed tenants that are loaded
+        app = build_core()
+        cm = ConfigManager(app=app, modules=ModuleManager(app=app))
+        for i in (1, 2):
+            c = await store.get_tenant_config(f"tenant_{i}")
+            cm.apply_tenant_config(
+                tenant_id=c.tenant_id, trace_id="trc", request_id="req",
+                services=c.services, modules=c.modules, limits=c.limits,
+            )
+
+        watcher = asyncio.get_running_loop().create_task(store.watch(cm, interval_seconds=0.05))
+        await asyncio.sleep(0.02)
+        write_packed(packed, n, {1: tenant(1, "jinja2_v2"), 3: tenant(3, "jinja2_v2")})
+        await asyncio.sleep(0.3)
+        watcher.cancel()
+
+        print("tenant_1 ->", app.services.bound_provider_name("tenant_1", "TextComposer"))
+        print("tenant_2 ->", app.services.bound_provider_name("tenant_2", "TextComposer"))
+        print("tenant_3 (not loaded) ->", app.services.bound_provider_name("tenant_3", "TextComposer"))
+        changed, removed = store.poll()
+        print("nothing pending:", changed, removed)
+        store.close()
+
+        # directory layout
+        d = os.path.join(tmp, "dir")
+        os.mkdir(d)
+        for i in range(3):
+            with open(os.path.join(d, f"tenant_{i}.json"), "w", encoding="utf-8") as f:
+                json.dump(tenant(i), f)
+        dstore = FileTenantConfigStore(d)
+        print("dir tenants:", sorted(dstore.tenant_ids()))
+        time.sleep(0.01)
+        with open(os.path.join(d, "tenant_2.json"), "w", encoding="utf-8") as f:
+            json.dump(tenant(2, "jinja2_v3"), f)
+        os.remove(os.path.join(d, "tenant_0.json"))
+        print("dir poll:", dstore.poll())
+        print("tenant_2:", (await dstore.get_tenant_config("tenant_2")).services)
+
+        # a file named for one tenant but declaring another is not served
+        with open(os.path.join(d, "tenant_1.json"), "w", encoding="utf-8") as f:
+            json.dump(tenant(7), f)
+        try:
+            await dstore.get_tenant_config("tenant_1")
+        except ValueError as exc:
+            print("mismatched file:", exc)
+
+        # tenant_id is taken from the top level, wherever it is in the record
+        odd = os.path.join(tmp, "odd.jsonl")
+        with open(odd, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"modules": {"m": {"tenant_id": "other"}}, "tenant_id": "late"}) + "\n")
+            f.write(json.dumps(tenant(5)) + "\n")
+        ostore = FileTenantConfigStore(odd)
+        print("top-level ids:", ostore.tenant_ids())
+        ostore.close()
+
+        # same mtime/size, different content: the sidecar checksum forces a rebuild
+        st = os.stat(odd)
+        with open(odd, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"modules": {"m": {"tenant_id": "other"}}, "tenant_id": "LATE"}) + "\n")
+            f.write(json.dumps(tenant(6)) + "\n")
+        os.utime(odd, ns=(st.st_atime_ns, st.st_mtime_ns))
+        ostore = FileTenantConfigStore(odd)
+        print("after same-size rewrite:", ostore.tenant_ids(), (await ostore.get_tenant_config("tenant_6")).tenant_id)
+        ostore.close()
+        await cm.drain()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,141 @@
+import asyncio
+
+from core.bootstrap import build_core
+from core.contracts.results import ErrorInfo, ResultMeta, ServiceResult
+from core.events.types import Subscription
+from core.middleware.chain import MiddlewareChain
+from core.middleware.idempotency_mw import make_idempotency_middleware
+from core.middleware.idempotency_store import InMemoryIdempotencyStore
+from core.registry.services import ProviderChoice, ServiceBinding
+from core.runtime.context import RuntimeContext
+from core.services.executor import ServiceExecutor
+from core.services.resilience import HedgePolicy
+
+
+async def log_hedged(event):
+    print("[hedged]", event.name, event.payload)
+
+
+async def main() -> None:
+    app = build_core()
+    app.bus.subscribe(Subscription(name="service.*.hedged", handler=log_hedged, priority=10))
+
+    store = InMemoryIdempotencyStore()
+    chain = MiddlewareChain()
+    chain.add(make_idempotency_middleware(store=store))
+    executor = ServiceExecutor(bus=app.bus, registry=app.services, chain=chain)
+
+    calls = {"primary": 0, "alternate": 0, "cancelled": 0}
+
+    def make_result(provider: str) -> ServiceResult:
+        meta = ResultMeta(request_id="r", tenant_id="tenant_demo", trace_id="t", started_at_ms=0, provider_name=provider)
+        return ServiceResult(status="ok", meta=meta, data={"intent": "greeting"})
+
+    async def straggler():
+        calls["primary"] += 1
+        try:
+            await asyncio.sleep(0.5)
+        except asyncio.CancelledError:
+            calls["cancelled"] += 1
+            raise
+        return make_result("nlu_primary")
+
+    async def alternate():
+        calls["alternate"] += 1
+        await asyncio.sleep(0.01)
+        return make_result("nlu_alternate")
+
+    ctx = RuntimeContext.new(tenant_id="tenant_demo", locale="ru")
+    call = ctx.to_service_call(timeout_ms=1000, max_attempts=1, idempotency_key="idem_hedge")
+
+    res = await executor.call(
+        service_key="IntentResolver",
+        call=call,
+        op_name="intent_resolve",
+        fn=straggler,
+        hedge=HedgePolicy(delay_ms=50),
+        hedge_fn=alternate,
+    )
+    print("result:", res.status, res.meta.provider_name, calls, "(loser awaited)")
+
+    # same idempotency key: cached once, no second provider round
+    res2 = await executor.call(
+        service_key="IntentResolver",
+        call=call,
+        op_name="intent_resolve",
+        fn=straggler,
+        hedge=HedgePolicy(delay_ms=50),
+        hedge_fn=alternate,
+    )
+    print("repeat:", res2 is res, calls)
+
+    # hedge fails fast with a retryable error: keep waiting for the primary
+    async def slow_ok():
+        await asyncio.sleep(0.1)
+        return make_result("nlu_primary")
+
+    async def busy():
+        meta = ResultMeta(request_id="r", tenant_id="tenant_demo", trace_id="t", started_at_ms=0, provider_name="nlu_alternate")
+        return ServiceResult(status="error", meta=meta, error=ErrorInfo(code="unavailable", message="busy", retryable=True))
+
+    async def hedge_call(primary, secondary):
+        call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+        return await executor.call(
+            service_key="IntentResolver", call=call, op_name="intent_resolve",
+            fn=primary, hedge=HedgePolicy(delay_ms=20), hedge_fn=secondary,
+        )
+
+    res = await hedge_call(slow_ok, busy)
+    print("retryable hedge error, primary still running:", res.status, res.meta.provider_name)
+
+    # both fail: the retryable error result comes back (not swallowed)
+    async def slow_busy():
+        await asyncio.sleep(0.05)
+        return await busy()
+
+    res = await hedge_call(slow_busy, busy)
+    print("both retryable errors:", res.status, res.error.code)
+
+    # invoke mode: the hedge goes to another provider of the binding, not the slow one again
+    class Resolver:
+        def __init__(self, name, delay):
+            self.name, self.delay, self.calls = name, delay, 0
+
+        async def resolve(self):
+            self.calls += 1
+            await asyncio.sleep(self.delay)
+            return make_result(self.name)
+
+    slow, fast = Resolver("nlu_slow", 0.3), Resolver("nlu_fast", 0.01)
+    app.services.register_provider("nlu_slow", slow)
+    app.services.register_provider("nlu_fast", fast)
+    app.services.set_tenant_bindings(
+        "tenant_demo",
+        {"IntentResolver": ServiceBinding(providers=(ProviderChoice("nlu_slow"), ProviderChoice("nlu_fast", priority=1)))},
+    )
+    plain = ServiceExecutor(bus=app.bus, registry=app.services)
+
+    async def invoke_call(policy=HedgePolicy(delay_ms=20)):
+        call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+        return await plain.call(
+            service_key="IntentResolver", call=call, op_name="intent_invoke",
+            invoke=lambda p: p.resolve(), hedge=policy,
+        )
+
+    res = await invoke_call()
+    print("invoke hedge:", res.meta.provider_name, "calls:", slow.calls, fast.calls)
+
+    # single-provider binding: nothing to hedge with, the provider is not called twice
+    app.services.set_tenant_bindings("tenant_demo", {"IntentResolver": ServiceBinding(provider="nlu_slow")})
+    slow.delay, slow.calls = 0.05, 0
+    res = await invoke_call()
+    print("single provider, no hedge:", res.meta.provider_name, "calls:", slow.calls)
+
+    # the tracked latency is the primary's: hedged calls do not pull the percentile under the delay
+    for _ in range(5):
+        await invoke_call()
+    print("tracked p50 >= hedge delay:", plain._latency.percentile(("IntentResolver", "intent_invoke"), 0.5, min_samples=1) >= 20)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+from core.bootstrap import build_core
+from core.contracts.results import ResultMeta, ServiceResult
+from core.middleware.chain import MiddlewareChain
+from core.middleware.idempotency_mw import make_idempotency_middleware
+from core.middleware.idempotency_store import InMemoryIdempotencyStore
+from core.runtime.context import RuntimeContext
+from core.services.executor import ServiceExecutor
+
+
+async def main() -> None:
+    app = build_core()
+
+    provider_calls = {"n": 0}
+
+    async def slow_provider(call):
+        provider_calls["n"] += 1
+        await asyncio.sleep(0.1)
+        meta = ResultMeta(
+            request_id=call.request_id,
+            tenant_id=call.tenant_id,
+            trace_id=call.trace_id,
+            started_at_ms=int(time.time() * 1000),
+            provider_name="demo_provider",
+        )
+        return ServiceResult(status="ok", meta=meta, data={"n": provider_calls["n"]})
+
+    async def run(coalesce: bool, wait_ms: int):
+        provider_calls["n"] = 0
+        chain = MiddlewareChain()
+        chain.add(make_idempotency_middleware(store=InMemoryIdempotencyStore(), coalesce=coalesce, coalesce_wait_ms=wait_ms))
+        executor = ServiceExecutor(bus=app.bus, registry=app.services, chain=chain)
+
+        async def one():
+            ctx = RuntimeContext.new(tenant_id="tenant_demo", locale="ru")
+            call = ctx.to_service_call(timeout_ms=1000, max_attempts=1, idempotency_key="idem_dup")
+            return await executor.call(service_key="DemoService", call=call, op_name="demo_op", fn=lambda: slow_provider(call))
+
+        results = await asyncio.gather(*(one() for _ in range(5)))
+        statuses = [r.error.code if r.error else r.status for r in results]
+        print(f"coalesce={coalesce} wait_ms={wait_ms}:", statuses, "provider calls:", provider_calls["n"],
+              "same result:", all(r is results[0] for r in results))
+
+    await run(coalesce=False, wait_ms=0)
+    await run(coalesce=True, wait_ms=1000)
+    await run(coalesce=True, wait_ms=10)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
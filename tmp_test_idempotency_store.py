@@ -0,0 +1,43 @@
+import asyncio
+
+from core.contracts.results import ResultMeta, ServiceResult
+from core.middleware.idempotency_store import InMemoryIdempotencyStore
+
+
+def make_result(i: int) -> ServiceResult:
+    meta = ResultMeta(request_id=f"req_{i}", tenant_id="tenant_demo", trace_id="trc_demo", started_at_ms=0)
+    return ServiceResult(status="ok", meta=meta, data=i)
+
+
+async def main() -> None:
+    store = InMemoryIdempotencyStore(shards=4, max_entries=100, sweep_interval_seconds=0.05)
+
+    # hard cap: LRU eviction
+    for i in range(500):
+        await store.put(f"idem_{i}", make_result(i), ttl_seconds=300)
+    print("after 500 puts:", store.stats())
+    print("oldest evicted:", await store.get("idem_0") is None, "newest kept:", (await store.get("idem_499")).data)
+
+    # background expiry: keys are never read again
+    for i in range(50):
+        await store.put(f"short_{i}", make_result(i), ttl_seconds=0)
+    print("lock:", await store.lock("idem_lock", ttl_seconds=0), await store.lock("idem_other", ttl_seconds=30))
+
+    await asyncio.sleep(0.2)
+    print("after sweep:", store.stats())
+
+    await store.close()
+
+    # eviction/unlock churn: expiry heaps stay bounded by the live size
+    store = InMemoryIdempotencyStore(shards=4, max_entries=100, sweep_interval_seconds=0)
+    for i in range(200_000):
+        key = f"churn_{i}"
+        await store.lock(key, ttl_seconds=30)
+        await store.put(key, make_result(i), ttl_seconds=300)
+        await store.unlock(key)
+    heap_entries = sum(len(s.heap) for s in store._shards)
+    print("after churn:", store.stats(), "heap entries bounded:", heap_entries <= 2 * 100 + 4 * 64 + 4)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+import asyncio
+import random
+import time
+
+from core.contracts.services import IntentResolveIn
+from core.runtime.context import RuntimeContext
+
+from packages.providers.intent_ngram.provider import NgramIntentResolver, NgramIntentResolverConfig
+
+
+INTENTS = {
+    "greeting": ["привет", "здравствуйте", "добрый день", "hello", "hi there"],
+    "order_status": ["где мой заказ", "статус заказа", "когда привезут заказ", "where is my order"],
+    "refund": ["верните деньги", "хочу возврат", "оформить возврат средств", "refund please"],
+    "operator": ["позовите оператора", "соедините с человеком", "talk to a human"],
+}
+
+
+def synthetic_intents(n: int) -> dict:
+    rnd = random.Random(7)
+    alphabet = "абвгдежзиклмнопрстуфхцчшщэюя"
+    words = ["".join(rnd.choice(alphabet) for _ in range(rnd.randint(3, 9))) for _ in range(5_000)]
+    return {f"intent_{i}": [" ".join(rnd.sample(words, 4)) for _ in range(3)] for i in range(n)}
+
+
+async def main() -> None:
+    resolver = NgramIntentResolver(NgramIntentResolverConfig(intents=INTENTS))
+    ctx = RuntimeContext.new(tenant_id="t1", locale="ru")
+    call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+
+    for text in ("Привет!", "где мой заказ номер 15?", "хочу вернуть деньги", "qwerty zxcv"):
+        res = await resolver.resolve(call, IntentResolveIn(text=text, locale="ru"))
+        print(f"{text!r:32} -> {res.data.intent} ({res.data.confidence:.2f})")
+    print("rank:", [(i, round(s, 2)) for i, s in resolver.rank("оператора позовите пожалуйста", k=2)])
+
+    batch = await resolver.resolve_many(
+        call, [IntentResolveIn(text=t, locale="ru") for t in ("добрый вечер", "статус моего заказа", "")]
+    )
+    print("batch:", [(r.data.intent, round(r.data.confidence, 2)) for r in batch])
+
+    # latency with many intents
+    big = synthetic_intents(5_000)
+    t0 = time.perf_counter()
+    resolver = NgramIntentResolver(NgramIntentResolverConfig(intents=big))
+    print(f"built 5000 intents in {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    queries = [IntentResolveIn(text=examples[0], locale="ru") for examples in list(big.values())[:500]]
+    t0 = time.perf_counter()
+    hits = 0
+    for name, q in zip(big, queries):
+        res = await resolver.resolve(call, q)
+        hits += res.data.intent == name
+    per_call = (time.perf_counter() - t0) / len(queries) * 1e6
+    print(f"resolve: {per_call:.0f} us/query, accuracy on examples: {hits}/{len(queries)}")
+
+    t0 = time.perf_counter()
+    results = await resolver.resolve_many(call, queries)
+    per_item = (time.perf_counter() - t0) / len(queries) * 1e6
+    print(f"resolve_many: {per_item:.0f} us/query, same answers: "
+          f"{sum(r.data.intent == n for n, r in zip(big, results))}/{len(queries)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import tempfile
+import time
+
+from core.bootstrap import build_core
+from core.contracts.services import KnowledgeRespondIn
+from core.modules.manager import ModuleManager
+from core.runtime.context import RuntimeContext
+
+from packages.modules.knowledge_base.module import KnowledgeBaseModule
+from packages.providers.knowledge_bm25.index import BM25Index
+from packages.providers.knowledge_bm25.tokenize import tokenize
+
+ARTICLES = {
+    "delivery": {"title": "Доставка", "text": "Доставка заказов по Москве занимает 1-2 дня, по России до 7 дней."},
+    "refund": {
+        "title": "Возврат",
+        "text": "Вернуть товар можно в течение 14 дней с момента получения заказа.",
+        "answer": "Возврат возможен в течение 14 дней.",
+    },
+    "payment": "Оплатить заказ можно картой или наличными курьеру.",
+    "hours": {"title": "Working hours", "text": "Our support works daily from 9 am to 9 pm."},
+}
+
+
+async def ask(app, tenant_id: str, question: str, locale: str = "ru"):
+    ctx = RuntimeContext.new(tenant_id=tenant_id, locale=locale)
+    call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+    provider = app.services.snapshot().providers["knowledge_bm25_v1"]
+    return await provider.respond(call, KnowledgeRespondIn(question=question, locale=locale))
+
+
+async def main() -> None:
+    print("tokens:", tokenize("Когда привезут мои заказы? When are orders shipped?"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = build_core()
+        mm = ModuleManager(app=app)
+        mm.register(KnowledgeBaseModule())
+
+        cfg = {"articles": ARTICLES, "index_dir": tmp}
+        print("attach:", mm.refresh(tenant_id="t1", desired={"knowledge_base": cfg}))
+
+        for q in ("Сколько дней идет доставка заказа?", "как вернуть товар", "support hours", "погода завтра"):
+            res = await ask(app, "t1", q)
+            out = (res.data.answer_text, res.data.sources) if res.data else res.error.code
+            print(f"{q!r:40} -> {out}")
+
+        # incremental update: one article changed, one removed, one added
+        articles = dict(ARTICLES)
+        articles["payment"] = "Оплата заказа картой, наличными или по СБП."
+        del articles["hours"]
+        articles["gift"] = "Подарочные сертификаты действуют 1 год."
+        print("reconfigure:", mm.refresh(tenant_id="t1", desired={"knowledge_base": dict(cfg, articles=articles)}))
+        res = await ask(app, "t1", "можно ли оплатить по СБП")
+        print("after update:", res.data.answer_text if res.data else res.error.code)
+
+        # worker restart: index is memory-mapped from disk, nothing is re-tokenized
+        path = os.path.join(tmp, "t1.bm25")
+        print("index file bytes:", os.path.getsize(path))
+        app2 = build_core()
+        mm2 = ModuleManager(app=app2)
+        mm2.register(KnowledgeBaseModule())
+        mm2.refresh(tenant_id="t1", desired={"knowledge_base": dict(cfg, articles=articles)})
+        kb = app2.services.snapshot().providers["knowledge_bm25_v1"]._tenants["t1"]
+        print("loaded from disk (mmap postings):", kb.index._post_docs is not None)
+        res = await ask(app2, "t1", "сертификат подарочный")
+        print("restarted answer:", res.data.answer_text, res.data.sources)
+
+        # larger index timing
+        big = BM25Index()
+        words = [f"слово{i}" for i in range(20_000)]
+        for i in range(10_000):
+            big.add(f"doc{i}", [words[(i * 7 + j * 13) % len(words)] for j in range(40)])
+        big.save(os.path.join(tmp, "big.bm25"))
+        t0 = time.perf_counter()
+        loaded = BM25Index.load(os.path.join(tmp, "big.bm25"))
+        t_load = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for i in range(200):
+            loaded.search([words[i], words[i + 13], words[i + 26]], k=3)
+        print(f"10k docs: load {t_load * 1000:.1f} ms, search {(time.perf_counter() - t0) / 200 * 1e6:.0f} us/query")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+import asyncio
+from collections import Counter
+
+from core.bootstrap import build_core
+from core.contracts.results import ErrorInfo, ResultMeta, ServiceResult
+from core.registry.balancers import ProviderChoice
+from core.registry.services import ServiceBinding
+from core.runtime.context import RuntimeContext
+from core.services.executor import ServiceExecutor
+from core.services.resilience import BreakerConfig, RetryPolicy
+
+
+class DemoProvider:
+    def __init__(self, name: str, *, healthy: bool = True, delay: float = 0.0) -> None:
+        self.name = name
+        self.healthy = healthy
+        self.delay = delay
+        self.calls = 0
+
+    async def resolve(self, call):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        meta = ResultMeta(
+            request_id=call.request_id,
+            tenant_id=call.tenant_id,
+            trace_id=call.trace_id,
+            started_at_ms=0,
+            provider_name=self.name,
+        )
+        if not self.healthy:
+            return ServiceResult(status="error", meta=meta, error=ErrorInfo(code="unavailable", message="down", retryable=True))
+        return ServiceResult(status="ok", meta=meta, data={"intent": "greeting"})
+
+
+async def run(executor, tenant_id: str, n: int) -> Counter:
+    used = Counter()
+    for _ in range(n):
+        ctx = RuntimeContext.new(tenant_id=tenant_id, locale="ru")
+        call = ctx.to_service_call(timeout_ms=1000, max_attempts=2)
+        res = await executor.call(
+            service_key="IntentResolver",
+            call=call,
+            op_name="intent_resolve",
+            invoke=lambda p: p.resolve(call),
+        )
+        used[(res.status, res.meta.provider_name)] += 1
+    return used
+
+
+async def main() -> None:
+    app = build_core()
+    executor = ServiceExecutor(
+        bus=app.bus,
+        registry=app.services,
+        breaker=BreakerConfig(failure_threshold=3, open_seconds=60),
+        retry=RetryPolicy(base_delay_ms=0),
+    )
+
+    a, b, c = DemoProvider("nlu_a"), DemoProvider("nlu_b"), DemoProvider("nlu_backup")
+    for p in (a, b, c):
+        app.services.register_provider(p.name, p)
+
+    tenant_id = "tenant_demo"
+    app.services.set_tenant_bindings(tenant_id, {
+        "IntentResolver": ServiceBinding(providers=(
+            ProviderChoice("nlu_a", weight=3),
+            ProviderChoice("nlu_b", weight=1),
+            ProviderChoice("nlu_backup", priority=1),
+        )),
+    })
+
+    print("weighted rr:", sorted((await run(executor, tenant_id, 40)).items()))
+
+    # nlu_a goes bad: calls fail over to nlu_b, breaker opens for nlu_a
+    a.healthy = False
+    print("failover:", sorted((await run(executor, tenant_id, 20)).items()), "nlu_a calls:", a.calls)
+
+    # primary tier gone -> backup tier
+    b.healthy = False
+    print("backup tier:", sorted((await run(executor, tenant_id, 10)).items()))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
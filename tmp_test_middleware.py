@@ -47,6 +47,32 @@ async def main() -> None:
 
     print("final:", res.status, res.data.text if res.data else None)
 
+    # each layer's nxt is its own: calling it twice or concurrently runs the inner layers again
+    trail = []
+
+    def tagged(tag):
+        async def mw(op, nxt):
+            trail.append(tag)
+            return await nxt()
+        return mw
+
+    async def twice(op, nxt):
+        a, b = await asyncio.gather(nxt(), nxt())
+        return b
+
+    async def terminal():
+        trail.append("T")
+        return res
+
+    fanout = MiddlewareChain([tagged("a"), twice, tagged("b"), tagged("c")])
+    await fanout.run(op=None, terminal=terminal)
+    print("concurrent nxt:", trail)
+
+    try:
+        fanout.middlewares.append(logging_middleware)
+    except AttributeError:
+        print("middlewares is read-only:", len(fanout.middlewares))
+
 
 if __name__ == "__main__":
     asyncio.run(main())
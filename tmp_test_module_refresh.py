@@ -0,0 +1,54 @@
+import asyncio
+
+from core.bootstrap import build_core
+from core.config.hashing import config_hash
+from core.contracts.services import TextComposeIn
+from core.modules.manager import ModuleManager
+from core.registry.services import ServiceBinding
+from core.runtime.context import RuntimeContext
+
+from packages.modules.text_templates.module import TextTemplatesModule
+
+
+async def main() -> None:
+    print("stable hash:", config_hash({"a": 1, "b": [1, 2]}) == config_hash({"b": (1, 2), "a": 1}))
+
+    app = build_core()
+    mm = ModuleManager(app=app)
+    mm.register(TextTemplatesModule())
+
+    tenant_id = "tenant_demo"
+    app.services.set_tenant_bindings(tenant_id, {"TextComposer": ServiceBinding(provider="jinja2_v1")})
+
+    cfg = {"provider_name": "jinja2_v1", "templates": {"hello": "Привет, {{ name }}!", "bye": "Пока!"}}
+    print("1:", mm.refresh(tenant_id=tenant_id, desired={"text_templates": cfg}))
+    provider = app.services.resolve(tenant_id, "TextComposer")
+    subs_before = len(app.bus._subscriptions) + len(app.bus._patterns)
+
+    # same config (new dict objects): nothing touched
+    same = {"templates": {"bye": "Пока!", "hello": "Привет, {{ name }}!"}, "provider_name": "jinja2_v1"}
+    print("2:", mm.refresh(tenant_id=tenant_id, desired={"text_templates": same}))
+
+    # one template changed: in place, same provider instance, only one compile
+    compiled = provider.cache_stats().compile_count
+    changed = {"provider_name": "jinja2_v1", "templates": {"hello": "Здравствуйте, {{ name }}!", "bye": "Пока!"}}
+    print("3:", mm.refresh(tenant_id=tenant_id, desired={"text_templates": changed}))
+    print(
+        "same provider:", app.services.resolve(tenant_id, "TextComposer") is provider,
+        "new compiles:", provider.cache_stats().compile_count - compiled,
+        "subscriptions unchanged:", subs_before == len(app.bus._subscriptions) + len(app.bus._patterns),
+    )
+
+    ctx = RuntimeContext.new(tenant_id=tenant_id, locale="ru")
+    call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+    res = await provider.compose(call, TextComposeIn(locale="ru", template_key="hello", variables={"name": "Савин"}))
+    print("compose:", res.status, res.data.text if res.data else None)
+
+    # provider name changed: cannot be done in place
+    renamed = dict(changed, provider_name="jinja2_v2")
+    print("4:", mm.refresh(tenant_id=tenant_id, desired={"text_templates": renamed}))
+    print("5:", mm.refresh(tenant_id=tenant_id, desired={}))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+import asyncio
+import time
+import uuid
+
+from core.contracts.events import EventEnvelope
+from core.events.queued import QueueConfig, QueuedEventBus
+from core.events.types import Subscription
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def new_id(prefix: str) -> str:
+    return f"{prefix}_{uuid.uuid4().hex}"
+
+
+def make_event(i: int, kind: str = "service") -> EventEnvelope:
+    return EventEnvelope(
+        name="service.demo_op.ok",
+        kind=kind,
+        tenant_id="tenant_demo",
+        event_id=new_id("evt"),
+        trace_id=new_id("trc"),
+        occurred_at_ms=now_ms(),
+        payload={"i": i},
+    )
+
+
+async def main() -> None:
+    seen = []
+
+    async def slow_handler(event: EventEnvelope) -> None:
+        await asyncio.sleep(0.01)
+        seen.append(event.payload["i"])
+
+    for policy in ("block", "drop_oldest", "drop_new"):
+        seen.clear()
+        bus = QueuedEventBus(per_kind={"service": QueueConfig(maxsize=5, workers=2, overflow=policy)})
+        bus.subscribe(Subscription(name="service.demo_op.ok", handler=slow_handler))
+
+        started = time.perf_counter()
+        for i in range(20):
+            await bus.publish(make_event(i))
+        publish_ms = (time.perf_counter() - started) * 1000
+
+        await bus.close()
+        m = bus.metrics()["service"]
+        print(
+            f"{policy}: handled={len(seen)} dropped={m.dropped} processed={m.processed} "
+            f"depth={m.depth} publish_fast={publish_ms < 50} lag_tracked={m.max_lag_ms > 0}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
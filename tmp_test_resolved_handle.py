@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+from core.bootstrap import build_core
+from core.contracts.results import ResultMeta, ServiceResult
+from core.contracts.services import TextComposeIn, TextComposer
+from core.middleware.admission_mw import AdmissionLimits
+from core.registry.handles import bind_typed
+from core.registry.services import ServiceBinding, resolve_typed
+from core.runtime.context import RuntimeContext
+
+
+class DemoComposer:
+    def __init__(self, name: str, delay: float = 0.0) -> None:
+        self.name = name
+        self.delay = delay
+
+    async def compose(self, call, inp):
+        await asyncio.sleep(self.delay)
+        meta = ResultMeta(
+            request_id=call.request_id,
+            tenant_id=call.tenant_id,
+            trace_id=call.trace_id,
+            started_at_ms=0,
+            provider_name=self.name,
+        )
+        return ServiceResult(status="ok", meta=meta, data={"text": f"{self.name}:{inp.template_key}"})
+
+
+async def main() -> None:
+    app = build_core()
+    app.services.register_provider("v1", DemoComposer("v1", delay=0.05))
+    app.services.register_provider("v2", DemoComposer("v2"))
+    app.services.set_tenant_bindings("t1", {"TextComposer": ServiceBinding(provider="v1")})
+
+    seen = []
+
+    async def tag_mw(op, nxt):
+        seen.append(op.op_name)
+        return await nxt()
+
+    handle = bind_typed(
+        app.services,
+        "t1",
+        TextComposer,
+        middleware=[tag_mw],
+        limits=AdmissionLimits(max_concurrent=1, max_queue=0),
+    )
+    print("provider:", handle().name, "rebinds:", handle.rebinds, "version:", handle.version)
+
+    # another tenant's update: snapshot moves, provider stays
+    app.services.set_tenant_bindings("t2", {"TextComposer": ServiceBinding(provider="v2")})
+    print("after t2 update:", handle().name, "rebinds:", handle.rebinds, "version:", handle.version)
+
+    app.services.set_tenant_bindings("t1", {"TextComposer": ServiceBinding(provider="v2")})
+    print("after t1 rebind:", handle().name, "rebinds:", handle.rebinds)
+
+    app.services.set_tenant_bindings("t1", {"TextComposer": ServiceBinding(provider="v1")})
+
+    async def one(i: int):
+        ctx = RuntimeContext.new(tenant_id="t1", locale="ru")
+        call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+        return await app.executor.call(
+            handle=handle,
+            call=call,
+            op_name="text_compose",
+            invoke=lambda p: p.compose(call, TextComposeIn(locale="ru", template_key="hello")),
+        )
+
+    results = await asyncio.gather(one(0), one(1))
+    print("limited:", [(r.status, r.error.code if r.error else r.data["text"]) for r in results])
+    print("handle middleware saw:", seen)
+
+    n = 200_000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        resolve_typed(app.services, "t1", TextComposer)
+    t_resolve = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(n):
+        handle()
+    t_handle = time.perf_counter() - t0
+    print(f"resolve_typed: {t_resolve / n * 1e9:.0f} ns/op, handle: {t_handle / n * 1e9:.0f} ns/op")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+import asyncio
+import datetime as dt
+import time
+
+from core.bootstrap import build_core
+from core.contracts.services import IntentResolveIn
+from core.modules.manager import ModuleManager
+from core.runtime.context import RuntimeContext
+
+from packages.modules.intent_slots.module import IntentSlotsModule
+from packages.providers.intent_ngram.provider import NgramIntentResolver, NgramIntentResolverConfig
+from packages.providers.slots.extractor import SlotExtractor, SlotExtractorCache, parse_slot_config
+
+INTENTS = {
+    "order_status": ["где мой заказ", "статус заказа", "when will my order arrive"],
+    "delivery": ["доставьте завтра", "привезите в москву", "нужна доставка"],
+}
+
+SLOTS = {
+    "patterns": {"ticket": r"TCK-\d+", "sku": [r"(?i:арт\.?\s*)(\d{3,})"]},
+    "gazetteers": {"city": {"Москва": ["москва", "москву", "мск"], "Санкт-Петербург": ["спб", "питер"]}},
+}
+
+
+async def main() -> None:
+    today = dt.date(2026, 3, 10)
+    ex = SlotExtractor(parse_slot_config(SLOTS))
+    for text in (
+        "Где заказ №123456? Звоните +7 (999) 123-45-67",
+        "привезите в Мск 15.03 к 18:00, оплачу 1 500 руб",
+        "order #98765 should arrive tomorrow, paid $49.90",
+        "арт. 5512 нет в наличии, TCK-77 открыт, 8 912 000 11 22",
+        "доставка 5 мая 2026 в Питер",
+        "31.02 не бывает, 2026-04-01 бывает",
+        "price 1.5 kg, 1.50 kg, 3/4 cup, 2.5% fat",
+        "привезите 05.04 или 7.04, не позже 12/04/2026",
+    ):
+        print(f"{text!r:60} -> {ex.extract(text, today=today)}")
+
+    # cache: same config -> same compiled extractor
+    cache = SlotExtractorCache()
+    a = cache.get(SLOTS)
+    b = cache.get({"gazetteers": SLOTS["gazetteers"], "patterns": SLOTS["patterns"]})
+    print("cache shared:", a is b, cache.stats())
+    try:
+        cache.get({"patterns": {"bad": r"(?P<x>\d+)"}})
+    except ValueError as exc:
+        print("bad pattern:", exc)
+
+    # leading inline flags are scoped to the pattern; misplaced ones are a clear ValueError
+    flagged = SlotExtractor(parse_slot_config({"patterns": {"ticket": r"(?i)TCK-\d+", "tag": r"(?x) \#(\w+)  # hashtag"}}))
+    print("inline flags:", flagged.extract("see tck-42 and #urgent", today=today))
+    try:
+        cache.get({"patterns": {"bad": r"TCK(?i)-\d+"}})
+    except ValueError as exc:
+        print("misplaced flag:", exc)
+
+    # pipeline stage through the module
+    app = build_core()
+    app.services.register_provider("intent_ngram_v1", NgramIntentResolver(NgramIntentResolverConfig(intents=INTENTS)))
+    mm = ModuleManager(app=app)
+    mm.register(IntentSlotsModule())
+    print("attach:", mm.refresh(tenant_id="t1", desired={"intent_slots": SLOTS}))
+    print("attach t2:", mm.refresh(tenant_id="t2", desired={"intent_slots": {"builtins": ["phone"]}}))
+
+    stage = app.services.snapshot().providers["intent_slots_v1"]
+    for tenant in ("t1", "t2", "t3"):
+        call = RuntimeContext.new(tenant_id=tenant, locale="ru").to_service_call(timeout_ms=1000, max_attempts=1)
+        res = await stage.resolve(call, IntentResolveIn(text="доставьте заказ 445566 в мск, тел 89991234567", locale="ru"))
+        print(tenant, res.data.intent, dict(res.data.slots))
+
+    batch = await stage.resolve_many(
+        RuntimeContext.new(tenant_id="t1", locale="ru").to_service_call(timeout_ms=1000, max_attempts=1),
+        [IntentResolveIn(text=t, locale="ru") for t in ("статус заказа #1234", "привет")],
+    )
+    print("batch:", [dict(r.data.slots) for r in batch])
+
+    # one combined scan vs one scan per pattern
+    many = dict(SLOTS)
+    many["gazetteers"] = {"product": {f"товар{i}": [f"продукт{i}", f"изделие{i}"] for i in range(2_000)}}
+    many["patterns"] = {f"code{i}": rf"C{i}-\d{{4}}" for i in range(50)}
+    t0 = time.perf_counter()
+    big = SlotExtractor(parse_slot_config(many))
+    print(f"compiled 6000 gazetteer keys + 50 patterns in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    text = "Хочу продукт1500 и изделие7, заказ №556677, позвоните 8 999 111-22-33 завтра, C42-1234 " * 3
+    n = 2_000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        big.extract(text, today=today)
+    print(f"extract: {(time.perf_counter() - t0) / n * 1e6:.0f} us/message, slots={big.extract(text, today=today)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
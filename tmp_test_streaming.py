@@ -0,0 +1,192 @@
+import asyncio
+import time
+
+from core.bootstrap import build_core
+from core.contracts.results import ResultMeta, ServiceResult, StreamError
+from core.contracts.services import KnowledgeRespondIn, KnowledgeRespondOut
+from core.events.types import Subscription
+from core.middleware.admission_mw import AdmissionController, AdmissionLimits, make_admission_middleware
+from core.middleware.chain import MiddlewareChain
+from core.registry.services import ProviderChoice, ServiceBinding
+from core.middleware.stream_mw import make_stream_middleware
+from core.runtime.context import RuntimeContext
+from core.services.executor import ServiceExecutor
+from core.services.resilience import BreakerConfig, RetryPolicy
+
+
+class StreamingResponder:
+    """
+    KnowledgeResponder that returns the answer in pieces (first_delay before
+    the first piece, gap between pieces).
+    """
+
+    def __init__(self, name: str, *, first_delay: float = 0.01, gap: float = 0.01, stall_after: int | None = None):
+        self.name = name
+        self.first_delay = first_delay
+        self.gap = gap
+        self.stall_after = stall_after
+        self.closed = 0
+
+    async def respond(self, call, inp: KnowledgeRespondIn) -> ServiceResult[KnowledgeRespondOut]:
+        meta = ResultMeta(
+            request_id=call.request_id, tenant_id=call.tenant_id, trace_id=call.trace_id,
+            started_at_ms=int(time.time() * 1000), provider_name=self.name,
+        )
+        return ServiceResult(status="ok", meta=meta, stream=self._pieces(inp.question))
+
+    async def _pieces(self, question: str):
+        try:
+            await asyncio.sleep(self.first_delay)
+            for i, word in enumerate(f"Ответ на вопрос «{question}» приходит по частям".split()):
+                if self.stall_after is not None and i == self.stall_after:
+                    await asyncio.sleep(10)
+                yield KnowledgeRespondOut(answer_text=word + " ")
+                await asyncio.sleep(self.gap)
+        finally:
+            self.closed += 1
+
+
+async def log_event(event):
+    payload = {k: v for k, v in event.payload.items() if k not in ("first_chunk_ms", "duration_ms")}
+    print("  [event]", event.name, payload)
+
+
+async def consume(res):
+    parts = []
+    try:
+        async for chunk in res.stream:
+            parts.append(chunk.answer_text)
+    except StreamError as exc:
+        return "".join(parts), exc.error.code
+    return "".join(parts), None
+
+
+async def main() -> None:
+    app = build_core()
+    app.bus.subscribe(Subscription(name="service.knowledge_respond.*", handler=log_event, priority=10))
+
+    seen = []
+    admission = AdmissionController(global_limits=AdmissionLimits(max_concurrent=1, max_queue=0))
+    chain = MiddlewareChain()
+    chain.add(make_admission_middleware(admission))
+    chain.add(
+        make_stream_middleware(
+            lambda op, chunk: KnowledgeRespondOut(answer_text=chunk.answer_text.upper()),
+            on_end=lambda op, n, err: seen.append((n, type(err).__name__ if err else None)),
+        )
+    )
+    executor = ServiceExecutor(bus=app.bus, registry=app.services, chain=chain)
+
+    fast = StreamingResponder("kb_fast")
+    app.services.register_provider("kb_fast", fast)
+    app.services.register_provider("kb_slow_start", StreamingResponder("kb_slow_start", first_delay=1.0))
+    app.services.register_provider("kb_stall", StreamingResponder("kb_stall", stall_after=3))
+
+    ctx = RuntimeContext.new(tenant_id="t1", locale="ru")
+    inp = KnowledgeRespondIn(question="доставка", locale="ru")
+
+    async def run(provider_name: str, *, timeout_ms=300, attempts=1, idle_ms=None, binding=None):
+        binding = binding or ServiceBinding(providers=(ProviderChoice(provider_name),))
+        app.services.set_tenant_bindings("t1", {"KnowledgeResponder": binding})
+        call = ctx.to_service_call(timeout_ms=timeout_ms, max_attempts=attempts)
+        return await executor.call(
+            call=call, op_name="knowledge_respond", service_key="KnowledgeResponder",
+            invoke=lambda p: p.respond(call, inp), stream_idle_timeout_ms=idle_ms,
+        )
+
+    print("1) streamed answer, middleware upper-cases chunks:")
+    res = await run("kb_fast")
+    print("  returned before consumption:", res.status, "(no event yet)")
+    print("  text:", await consume(res))
+
+    print("2) admission slot is held while the stream is open:")
+    res = await run("kb_fast")
+    other = await run("kb_fast")
+    print("  second call while first streams:", other.status, other.error.code if other.error else None)
+    await consume(res)
+    again = await run("kb_fast")
+    print("  after first stream ended:", again.status)
+    await consume(again)
+
+    print("3) slow first chunk -> timeout inside the attempt, failover to the next provider:")
+    res = await run(
+        "kb_slow_start",
+        attempts=2,
+        binding=ServiceBinding(providers=(ProviderChoice("kb_slow_start"), ProviderChoice("kb_fast", priority=1))),
+    )
+    print("  result:", res.status, res.error.code if res.error else await consume(res))
+
+    print("4) provider stalls mid-stream -> idle timeout:")
+    res = await run("kb_stall", idle_ms=100)
+    print("  text:", await consume(res))
+
+    print("5) consumer stops early -> stream closed, error event 'cancelled':")
+    res = await run("kb_fast")
+    closed = fast.closed
+    async for chunk in res.stream:
+        break
+    await res.stream.aclose()
+    print("  provider stream closed:", fast.closed == closed + 1)
+
+    print("observer on_end:", seen)
+
+    print("6) half-open probe stream closed early / never read -> probe freed, breaker not wedged:")
+    guarded = ServiceExecutor(
+        bus=app.bus,
+        registry=app.services,
+        breaker=BreakerConfig(failure_threshold=1, open_seconds=0.05),
+        retry=RetryPolicy(base_delay_ms=0, budget_initial_tokens=0),
+    )
+    down = {"on": True}
+
+    class FlakyResponder(StreamingResponder):
+        async def respond(self, call, inp):
+            if down["on"]:
+                raise RuntimeError("provider down")
+            return await super().respond(call, inp)
+
+    app.services.register_provider("kb_flaky", FlakyResponder("kb_flaky", first_delay=0.0, gap=0.0))
+    app.services.set_tenant_bindings("t1", {"KnowledgeResponder": ServiceBinding(providers=(ProviderChoice("kb_flaky"),))})
+
+    async def guarded_call():
+        call = ctx.to_service_call(timeout_ms=300, max_attempts=1)
+        return await guarded.call(
+            call=call, op_name="knowledge_respond", service_key="KnowledgeResponder",
+            invoke=lambda p: p.respond(call, inp),
+        )
+
+    async def trip():
+        down["on"] = True
+        await guarded_call()
+        print("  while open:", (await guarded_call()).error.code)
+        await asyncio.sleep(0.06)
+        down["on"] = False
+
+    await trip()
+    probe = await guarded_call()
+    async for chunk in probe.stream:
+        break
+    await probe.stream.aclose()
+    res = await guarded_call()
+    print("  after early close:", res.status, res.error.code if res.error else None)
+    await consume(res)
+
+    await trip()
+    probe = await guarded_call()
+    await probe.stream.aclose()
+    res = await guarded_call()
+    print("  after aclose without reading:", res.status, res.error.code if res.error else None)
+    await consume(res)
+
+    await trip()
+    probe = await guarded_call()
+    del probe
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    res = await guarded_call()
+    print("  after dropping the stream unread:", res.status, res.error.code if res.error else None)
+    await consume(res)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
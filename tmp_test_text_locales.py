@@ -0,0 +1,44 @@
+import asyncio
+
+from core.bootstrap import build_core
+from core.contracts.services import TextComposer, TextComposeIn
+from core.modules.manager import ModuleManager
+from core.registry.services import ServiceBinding, resolve_typed, service_key
+from core.runtime.context import RuntimeContext
+
+from packages.modules.text_templates.module import TextTemplatesModule
+
+
+async def main() -> None:
+    app = build_core()
+
+    mm = ModuleManager(app=app)
+    mm.register(TextTemplatesModule())
+
+    tenant_id = "tenant_demo"
+    mm.attach(
+        tenant_id=tenant_id,
+        module_key="text_templates",
+        cfg={
+            "provider_name": "jinja2_v1",
+            "default_locale": "ru",
+            "fallbacks": {"uk": ["ru"]},
+            "templates": {
+                "hello": {"ru": "Привет, {{ name }}!", "en": "Hello, {{ name }}!"},
+                "bye": "Пока, {{ name }}!",
+            },
+        },
+    )
+    app.services.set_tenant_bindings(tenant_id, {service_key(TextComposer): ServiceBinding(provider="jinja2_v1")})
+
+    svc = resolve_typed(app.services, tenant_id, TextComposer)
+
+    for locale, key in [("ru", "hello"), ("en", "hello"), ("uk", "hello"), ("de", "hello"), ("en", "bye")]:
+        ctx = RuntimeContext.new(tenant_id=tenant_id, locale=locale)
+        call = ctx.to_service_call(timeout_ms=1000, max_attempts=1)
+        res = await svc.compose(call, TextComposeIn(locale=locale, template_key=key, variables={"name": "Савин"}))
+        print(f"{locale}/{key}:", res.status, res.data.text if res.data else res.error)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
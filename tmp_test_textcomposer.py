@@ -2,6 +2,9 @@ import asyncio
 
 from core.runtime.context import RuntimeContext
 from core.contracts.services import TextComposeIn
+from jinja2 import Environment
+
+from packages.providers.text_jinja2.cache import CompiledTemplateCache
 from packages.providers.text_jinja2.provider import Jinja2TextComposer, Jinja2TextComposerConfig
 
 
@@ -25,6 +28,25 @@ async def main() -> None:
     print("text:", res.data.text if res.data else None)
     print("error:", res.error.code if res.error else None)
 
+    # second compose must reuse compiled template (warmed up on construction)
+    await provider.compose(
+        call,
+        TextComposeIn(locale="ru", template_key="hello", variables={"name": "Иван", "order_id": 124}),
+    )
+    stats = provider.cache_stats()
+    print("cache:", "size=", stats.size, "hits=", stats.hits, "misses=", stats.misses, "compiles=", stats.compile_count)
+
+    # equal hash, different source: the stored source is checked, no stale template
+    class Colliding(str):
+        def __hash__(self) -> int:
+            return 42
+
+    cache = CompiledTemplateCache(Environment())
+    first = cache.get("k", Colliding("one {{ x }}")).render(x=1)
+    second = cache.get("k", Colliding("two {{ x }}")).render(x=2)
+    again = cache.get("k", Colliding("two {{ x }}")).render(x=3)
+    print("collision:", first, "|", second, "|", again, "| compiles:", cache.stats().compile_count)
+
 
 if __name__ == "__main__":
     asyncio.run(main())